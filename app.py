@@ -41,6 +41,25 @@ class LaunchApplication(sgtk.platform.Application):
         # Register the appropriate DCC launch commands
         self._launcher.register_launch_commands()
 
+    def get_registration_report(self):
+        """
+        Report of the time spent registering the launch commands when the app
+        was initialized, to find out what slows down the engine startup.
+        Missing thumbnails are downloaded in the background while the commands
+        are registered, and registration waits for them, up to a bounded total
+        timeout, so their downloads and waits are part of the report.
+
+        :returns: Dictionary with the 'name' of the report, its 'start_time'
+                  and 'duration', the list of timed 'stages', ordered by start,
+                  and the list of Software 'entities', slowest first. Each stage
+                  has a 'name', a 'start' offset and a 'duration' in seconds,
+                  the 'thread' it ran in, and details like the 'entity' or
+                  'engine_instance' it ran for. Each entity has an 'entity'
+                  label, a total 'duration' and the duration of each of its
+                  'stages', keyed by stage name.
+        """
+        return self._launcher.registration_report
+
     def launch_from_path_and_context(self, path, context, version=None):
         """
         Launch an app with the specified path and context. The context can
@@ -57,3 +76,24 @@ class LaunchApplication(sgtk.platform.Application):
         This should be handled in logic which is external to this app.
         """
         self._launcher.launch_from_path(path, version)
+
+    def launch_batch(self, items, max_workers=None):
+        """
+        Launch an app once for each of the specified file paths, running
+        several launches at the same time. The contexts can contain more
+        information than is available from the paths themselves, such as Task
+        information. As with launch_from_path, there are no checks that the
+        input paths are actually compatible with the app that is being launched.
+
+        :param list items: List of (path, context, version) tuples. If a context
+                           is None, it is derived from the path. If a version is
+                           None, no {version} substitutions take place.
+        :param int max_workers: Maximum number of launches run at the same time.
+                                Defaults to the batch_launch_max_workers setting.
+        :returns: List of dictionaries, one per item in the same order, with the
+                  'path', 'context' and 'version' of the item, 'success' telling
+                  if the application was launched, the launch 'command',
+                  'return_code' and 'pid' when known, and the 'error' which
+                  prevented the launch, if any.
+        """
+        return self._launcher.launch_batch(items, max_workers)
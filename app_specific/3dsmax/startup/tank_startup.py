@@ -9,6 +9,7 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import os
+import runpy
 
 # Py3dsMax libs
 from Py3dsMax import mxs
@@ -46,6 +47,11 @@ def bootstrap_tank():
         mxs.messageBox("Flow Production Tracking: Could not start engine: %s" % e)
         return
 
+    # let the launcher know the engine has started
+    ready_script = os.environ.get("SGTK_LAUNCHAPP_READY_SCRIPT")
+    if ready_script and os.path.isfile(ready_script):
+        runpy.run_path(ready_script)
+
     # clean up temp env vars
     for var in ["TANK_ENGINE", "TANK_CONTEXT", "TANK_FILE_TO_OPEN"]:
         if var in os.environ:
@@ -0,0 +1,27 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+This file is run by the app_specific startup scripts once the engine has
+started, to let the launcher know about it. The launcher passes its path in
+the SGTK_LAUNCHAPP_READY_SCRIPT environment variable.
+"""
+
+import os
+import time
+
+ready_file = os.environ.pop("SGTK_LAUNCHAPP_READY_FILE", None)
+os.environ.pop("SGTK_LAUNCHAPP_READY_SCRIPT", None)
+if ready_file:
+    try:
+        with open(ready_file, "a") as fh:
+            fh.write("engine_started %f\n" % time.time())
+    except Exception:
+        pass
@@ -14,6 +14,7 @@ Set up the tank context and prepares the Tank Hiero engine.
 """
 
 import os
+import runpy
 import hiero.core
 
 
@@ -52,6 +53,11 @@ def bootstrap_tank():
     if file_to_open:
         hiero.core.openProject(file_to_open.replace(os.path.sep, "/"))
 
+    # let the launcher know the engine has started
+    ready_script = os.environ.get("SGTK_LAUNCHAPP_READY_SCRIPT")
+    if ready_script and os.path.isfile(ready_script):
+        runpy.run_path(ready_script)
+
     # clean up temp env vars
     for var in ["TANK_ENGINE", "TANK_CONTEXT", "TANK_FILE_TO_OPEN"]:
         if var in os.environ:
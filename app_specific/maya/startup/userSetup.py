@@ -14,6 +14,7 @@ It sets up the tank context and prepares the Tank Maya engine.
 """
 
 import os
+import runpy
 import maya.OpenMaya as OpenMaya
 import maya.cmds as cmds
 
@@ -57,6 +58,11 @@ def bootstrap_tank():
         # finally open the file
         cmds.file(file_to_open, force=True, open=True)
 
+    # let the launcher know the engine has started
+    ready_script = os.environ.get("SGTK_LAUNCHAPP_READY_SCRIPT")
+    if ready_script and os.path.isfile(ready_script):
+        runpy.run_path(ready_script)
+
     # clean up temp env vars
     for var in ["TANK_ENGINE", "TANK_CONTEXT", "TANK_FILE_TO_OPEN"]:
         if var in os.environ:
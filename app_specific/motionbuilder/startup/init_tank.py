@@ -9,6 +9,7 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import os
+import runpy
 
 from pyfbsdk import FBMessageBox, FBApplication
 
@@ -64,6 +65,11 @@ def bootstrap_tank():
     if file_to_open:
         FBApplication.FileOpen(file_to_open)
 
+    # let the launcher know the engine has started
+    ready_script = os.environ.get("SGTK_LAUNCHAPP_READY_SCRIPT")
+    if ready_script and os.path.isfile(ready_script):
+        runpy.run_path(ready_script)
+
     # clean up temp env vars
     for var in ["TANK_ENGINE", "TANK_CONTEXT", "TANK_FILE_TO_OPEN"]:
         if var in os.environ:
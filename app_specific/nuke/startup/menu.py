@@ -26,6 +26,7 @@ once the engine has been created.
 """
 
 import os
+import runpy
 import nuke
 
 
@@ -62,6 +63,11 @@ def bootstrap_tank():
         nuke.warning("Flow Production Tracking: Could not start engine: %s" % e)
         return
 
+    # let the launcher know the engine has started
+    ready_script = os.environ.get("SGTK_LAUNCHAPP_READY_SCRIPT")
+    if ready_script and os.path.isfile(ready_script):
+        runpy.run_path(ready_script)
+
     # clean up temp env vars
     for var in ["TANK_ENGINE", "TANK_CONTEXT", "TANK_FILE_TO_OPEN"]:
         if var in os.environ:
@@ -14,6 +14,7 @@ It sets up the tank context and prepares the Tank Photoshop engine.
 """
 
 import os
+import runpy
 import sys
 
 
@@ -69,6 +70,11 @@ def bootstrap_tank():
         f = photoshop.RemoteObject("flash.filesystem::File", file_to_open)
         photoshop.app.load(f)
 
+    # let the launcher know the engine has started
+    ready_script = os.environ.get("SGTK_LAUNCHAPP_READY_SCRIPT")
+    if ready_script and os.path.isfile(ready_script):
+        runpy.run_path(ready_script)
+
     # clean up temp env vars
     for var in ["TANK_ENGINE", "TANK_CONTEXT", "TANK_FILE_TO_OPEN"]:
         if var in os.environ:
@@ -15,6 +15,10 @@ This hook is executed to launch the applications.
 """
 
 import os
+import shlex
+import subprocess
+import time
+
 import tank
 
 
@@ -24,7 +28,14 @@ class AppLaunch(tank.Hook):
     """
 
     def execute(
-        self, app_path, app_args, version, engine_name, software_entity=None, **kwargs
+        self,
+        app_path,
+        app_args,
+        version,
+        engine_name,
+        software_entity=None,
+        environment=None,
+        **kwargs
     ):
         """
         The execute function of the hook will be called to start the required application
@@ -37,39 +48,87 @@ class AppLaunch(tank.Hook):
             software about to be launched.
         :param software_entity: (dict) If set, this is the Software entity that is
             associated with this launch command.
+        :param environment: (dict) The environment variables to launch the
+            application with. If None, the environment of the current process
+            is used.
 
-        :returns: (dict) The two valid keys are 'command' (str) and 'return_code' (int).
+        :returns: (dict) The two required keys are 'command' (str) and 'return_code' (int).
+            When the application was started, the 'process' (subprocess.Popen), 'pid' (int)
+            and 'start_time' (float, as returned by time.time()) keys are also set. The
+            'process_is_launcher' (bool) key is True when the process is a launcher which
+            exits once the application is started, like the macOS open command, rather
+            than the application itself. Its pid and exit code are then not the ones of
+            the application.
         """
 
-        if tank.util.is_linux():
-            # on linux, we just run the executable directly
-            cmd = "%s %s &" % (app_path, app_args)
-
-        elif tank.util.is_macos():
-            # If we're on OS X, then we have two possibilities: we can be asked
-            # to launch an application bundle using the "open" command, or we
-            # might have been given an executable that we need to treat like
-            # any other Unix-style command. The best way we have to know whether
-            # we're in one situation or the other is to check the app path we're
-            # being asked to launch; if it's a .app, we use the "open" command,
-            # and if it's not then we treat it like a typical, Unix executable.
-            if app_path.endswith(".app"):
+        # The application is not launched through a shell anymore, expand the
+        # environment variables and user home directories like it would. The
+        # hook runs with the launch environment applied to os.environ.
+        app_path = os.path.expanduser(os.path.expandvars(app_path))
+
+        process_is_launcher = False
+        if tank.util.is_windows():
+            # on windows, pass the command line as is to CreateProcess. The
+            # application is started in its own process group without a console,
+            # in order to avoid any command shells popping up as part of the
+            # application launch. Expand %VAR% in the arguments, as cmd.exe did.
+            app_args = os.path.expandvars(app_args) if app_args else app_args
+            cmd = '"%s" %s' % (app_path, app_args) if app_args else '"%s"' % app_path
+            popen_kwargs = {
+                "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP
+                | subprocess.DETACHED_PROCESS
+            }
+
+        else:
+            args = [
+                os.path.expanduser(os.path.expandvars(arg))
+                for arg in (shlex.split(app_args) if app_args else [])
+            ]
+
+            if tank.util.is_macos() and app_path.endswith(".app"):
+                # If we're on OS X, then we have two possibilities: we can be asked
+                # to launch an application bundle using the "open" command, or we
+                # might have been given an executable that we need to treat like
+                # any other Unix-style command. The best way we have to know whether
+                # we're in one situation or the other is to check the app path we're
+                # being asked to launch; if it's a .app, we use the "open" command,
+                # and if it's not then we treat it like a typical, Unix executable.
+                #
                 # The -n flag tells the OS to launch a new instance even if one is
                 # already running. The -a flag specifies that the path is an
                 # application and supports both the app bundle form or the full
                 # executable form.
-                cmd = 'open -n -a "%s"' % (app_path)
-                if app_args:
-                    cmd += " --args %s" % app_args
+                cmd = ["open", "-n", "-a", app_path]
+                if args:
+                    cmd += ["--args"] + args
+                # open exits as soon as the application is started.
+                process_is_launcher = True
             else:
-                cmd = "%s %s &" % (app_path, app_args)
+                # on linux, we just run the executable directly
+                cmd = [app_path] + args
 
-        else:
-            # on windows, we run the start command in order to avoid
-            # any command shells popping up as part of the application launch.
-            cmd = 'start /B "App" "%s" %s' % (app_path, app_args)
+            # Run the application in its own session so it is not tied to
+            # the terminal of the current process.
+            popen_kwargs = {"start_new_session": True}
+
+        if environment is not None:
+            popen_kwargs["env"] = environment
+
+        cmd_line = cmd if isinstance(cmd, str) else shlex.join(cmd)
 
-        # run the command to launch the app
-        exit_code = os.system(cmd)
+        # run the command to launch the app, without waiting for it to exit.
+        start_time = time.time()
+        try:
+            process = subprocess.Popen(cmd, **popen_kwargs)
+        except (OSError, ValueError) as e:
+            self.logger.debug("Unable to launch '%s': %s" % (cmd_line, e))
+            return {"command": cmd_line, "return_code": getattr(e, "errno", None) or 1}
 
-        return {"command": cmd, "return_code": exit_code}
+        return {
+            "command": cmd_line,
+            "return_code": 0,
+            "process": process,
+            "pid": process.pid,
+            "start_time": start_time,
+            "process_is_launcher": process_is_launcher,
+        }
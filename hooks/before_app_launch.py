@@ -25,7 +25,14 @@ class BeforeAppLaunch(tank.Hook):
     """
 
     def execute(
-        self, app_path, app_args, version, engine_name, software_entity=None, **kwargs
+        self,
+        app_path,
+        app_args,
+        version,
+        engine_name,
+        software_entity=None,
+        environment=None,
+        **kwargs
     ):
         """
         The execute function of the hook will be called prior to starting the required application
@@ -38,6 +45,8 @@ class BeforeAppLaunch(tank.Hook):
             software about to be launched.
         :param software_entity: (dict) If set, this is the Software entity that is
             associated with this launch command.
+        :param environment: (LaunchEnvironment) The environment the application
+            will be launched with. It can be used like a dictionary.
         """
 
         # accessing the current context (current shot, etc)
@@ -47,4 +56,8 @@ class BeforeAppLaunch(tank.Hook):
         # > current_entity = multi_launchapp.context.entity
 
         # you can set environment variables like this:
-        # os.environ["MY_SETTING"] = "foo bar"
+        # environment["MY_SETTING"] = "foo bar"
+        #
+        # Setting them in os.environ is still supported: changes made to
+        # os.environ by this hook are passed on to the application, and
+        # reverted for the current process once the application is launched.
@@ -0,0 +1,48 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import sgtk
+
+HookBaseClass = sgtk.get_hook_baseclass()
+
+
+class EnginePreparers(HookBaseClass):
+    """
+    Engine Preparers Hook
+
+    This hook provides the routines preparing the launch of applications for
+    engines which don't implement an engine launcher. They take precedence over
+    the ones built into launchapp and over the bootstrap of the engine, so
+    studios can prepare launches of their own engines without importing a
+    bootstrap.
+    """
+
+    def get_engine_preparers(self):
+        """
+        Return the engine preparers, keyed by engine name.
+
+        Each preparer is called with the ``engine_name``, ``context``,
+        ``app_path``, ``app_args`` and ``file_to_open`` keyword arguments of
+        the launch, may update os.environ, which is captured for the launched
+        application, and returns a tuple (app_path, app_args).
+
+        The TANK_ENGINE, TANK_CONTEXT and TANK_FILE_TO_OPEN environment
+        variables are already set when preparers are called.
+
+        For example::
+
+            def get_engine_preparers(self):
+                return {"tk-inhouse": self._prepare_inhouse_launch}
+
+        :returns: Dictionary of callables keyed by engine name.
+        :rtype: dict
+        """
+        # The default implementation doesn't provide any preparer.
+        return {}
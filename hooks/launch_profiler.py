@@ -0,0 +1,73 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import time
+
+import sgtk
+
+HookBaseClass = sgtk.get_hook_baseclass()
+
+
+class LaunchProfiler(HookBaseClass):
+    """
+    Launch Profiler Hook
+
+    This hook is used to profile application launches when the profile_launches
+    setting is on. The default implementation uses cProfile, which only profiles
+    the thread the launch is prepared in. Override it to use another profiler.
+    """
+
+    def start_profiling(self, name, version):
+        """
+        Start profiling the launch of an application.
+
+        :param str name: Name of the launched DCC.
+        :param str version: Version of the launched DCC, if any.
+
+        :returns: Profiling state, passed back to :meth:`stop_profiling`.
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def stop_profiling(self, name, version, profiling_state):
+        """
+        Stop profiling the launch of an application and report the results.
+
+        The default implementation writes the profile to the app cache location,
+        where it can be loaded with :mod:`pstats` or tools like snakeviz, and
+        logs the most time consuming calls at debug level.
+
+        :param str name: Name of the launched DCC.
+        :param str version: Version of the launched DCC, if any.
+        :param profiling_state: Profiling state returned by :meth:`start_profiling`.
+        """
+        profiler = profiling_state
+        profiler.disable()
+
+        profiles_folder = os.path.join(self.parent.cache_location, "launch_profiles")
+        sgtk.util.filesystem.ensure_folder_exists(profiles_folder)
+        file_name = "%s_%s.prof" % (
+            "_".join(filter(None, [name, version])),
+            time.strftime("%Y%m%d_%H%M%S"),
+        )
+        profile_path = os.path.join(profiles_folder, re.sub(r"[^\w.-]", "_", file_name))
+        profiler.dump_stats(profile_path)
+
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(20)
+        self.logger.debug(
+            "Launch profile written to %s:\n%s" % (profile_path, stream.getvalue())
+        )
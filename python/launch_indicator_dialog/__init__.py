@@ -9,3 +9,4 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 from .launch_spinner import LaunchDialog, populate_launch_dialog
+from .launch_indicator import LaunchIndicator
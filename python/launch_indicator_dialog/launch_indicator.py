@@ -0,0 +1,110 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import time
+
+from sgtk.platform.qt import QtCore
+
+from .launch_spinner import populate_launch_dialog
+
+
+class LaunchIndicator(object):
+    """
+    Drives the launch indicator dialog from the actual progress of a launch.
+
+    The launcher reports each stage of the launch as it completes. Once the
+    process is spawned, the dialog is closed as soon as the launched application
+    reports its engine has started, or when the process exits. Applications which
+    can't report their engine has started, or whose process isn't known, are given
+    a fixed amount of time.
+    """
+
+    # Milliseconds between two checks of the launched application readiness.
+    POLL_INTERVAL = 500
+
+    # Seconds to wait for an application which reports its readiness.
+    READY_TIMEOUT = 120
+
+    # Milliseconds the dialog is shown for applications which can't report
+    # their readiness, and after which they are considered launched.
+    FALLBACK_LAUNCHED_DELAY = 7000
+    FALLBACK_CLOSE_DELAY = 10000
+
+    # Milliseconds the dialog stays open once the application is ready.
+    CLOSE_DELAY = 1000
+
+    def __init__(self, app_instance):
+        """
+        :param app_instance: App instance to associate the dialog with.
+        """
+        self._widget, self._dialog = populate_launch_dialog(app_instance)
+        self._widget.start_progress()
+        self._timer = None
+
+    def report(self, pct, msg):
+        """
+        Report the progress of the launch.
+
+        :param float pct: Current progress. Must be between 0 and 1.
+        :param str msg: Message describing the current stage of the launch.
+        """
+        self._widget.report_progress(pct, msg)
+        # The launch runs in the main thread, so give the dialog a chance
+        # to repaint between stages.
+        QtCore.QCoreApplication.processEvents()
+
+    def wait_for_ready(self, app_path, process=None, is_ready=None):
+        """
+        Wait for the launched application to be ready and close the dialog.
+
+        :param str app_path: Path of the launched application.
+        :param process: The launched :class:`subprocess.Popen` instance, if it
+                        is the application itself. None if it is unknown or if
+                        it is a launcher which exits once the application is
+                        started, in which case the application is given a fixed
+                        amount of time.
+        :param is_ready: Callable returning True once the launched application
+                         reported its engine has started, or None if the
+                         application can't report it.
+        """
+        self.report(0.8, "Waiting for '%s' to start" % app_path)
+
+        if process is None or is_ready is None:
+            # There is no way to tell when the application is ready.
+            QtCore.QTimer.singleShot(
+                self.FALLBACK_LAUNCHED_DELAY,
+                lambda: self._widget.report_progress(0.97, "Launched successfully"),
+            )
+            QtCore.QTimer.singleShot(self.FALLBACK_CLOSE_DELAY, self.close)
+            return
+
+        start_time = time.time()
+
+        def check():
+            if is_ready():
+                self._timer.stop()
+                self._widget.report_progress(1.0, "Launched successfully")
+                QtCore.QTimer.singleShot(self.CLOSE_DELAY, self.close)
+            elif process.poll() is not None:
+                self.close()
+            elif time.time() - start_time > self.READY_TIMEOUT:
+                self.close()
+
+        self._timer = QtCore.QTimer(self._dialog)
+        self._timer.timeout.connect(check)
+        self._timer.start(self.POLL_INTERVAL)
+
+    def close(self):
+        """
+        Close the dialog.
+        """
+        if self._timer:
+            self._timer.stop()
+        self._dialog.reject()
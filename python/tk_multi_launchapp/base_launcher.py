@@ -8,23 +8,80 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
+import collections
+import concurrent.futures
 import contextlib
 import os
-import sys
+import time
 
 import sgtk
 import sgtk.util
 from sgtk import TankError
-from sgtk.platform.qt import QtCore, QtGui
 
-from .prepare_apps import prepare_launch_for_engine
+from .bootstrap_cache import BootstrapCache
+from .folder_creation_cache import FolderCreationCache
+from .launch_environment import LaunchEnvironment
+from .launch_supervisor import (
+    ENGINE_STARTED_EVENT,
+    READY_FILE_ENV_VAR,
+    READY_SCRIPT_ENV_VAR,
+    LaunchSupervisor,
+    read_ready_events,
+)
+from .launch_telemetry import LaunchTelemetry
+from .launch_timing import (
+    LaunchTimer,
+    RegistrationTimer,
+    log_registration_report,
+    write_launch_timings,
+)
+from .prepare_apps import clear_engine_launchers, prepare_launch_for_engine
 from .util import (
     apply_version_to_setting,
     clear_dll_directory,
     get_clean_version_string,
+    get_version_sort_key,
     restore_dll_directory,
 )
 
+# Environments launch commands are not registered in.
+# special case! @todo: fix this.
+# this is to allow this app to be loaded for sg entities of
+# type publish but not show up on the Shotgun menu. The
+# launch_from_path() and launch_from_path_and_context()
+# methods for this app should be used for these environments
+# instead. These methods are normally accessed via a hook.
+SKIP_ENVIRONMENTS = frozenset(
+    [
+        "shotgun_tankpublishedfile",
+        "shotgun_publishedfile",
+        "shotgun_version",
+    ]
+)
+
+# Immutable snapshot of the configuration launch commands are registered
+# with, taken when a launcher is constructed so registering commands does not
+# query the settings over and over again.
+LauncherConfiguration = collections.namedtuple(
+    "LauncherConfiguration",
+    [
+        # "linux", "mac" or "windows".
+        "platform_name",
+        # Names of the Software entity path and args fields for the platform.
+        "app_path_field",
+        "app_args_field",
+        # Whether information costly to resolve is resolved when a command
+        # is invoked instead of when it is registered.
+        "lazy_registration",
+        # Set of the engine instances not to register commands for.
+        "skip_engine_instances",
+        # Whether commands are registered in the current environment.
+        "register_commands",
+        # Whether the current engine has a UI.
+        "has_ui",
+    ],
+)
+
 
 class BaseLauncher(object):
     """
@@ -43,33 +100,43 @@ class BaseLauncher(object):
         self._tk_app = sgtk.platform.current_bundle()
 
         # Store the current platform value
-        self._platform_name = (
+        platform_name = (
             "linux"
             if sgtk.util.is_linux()
             else "mac" if sgtk.util.is_macos() else "windows"
         )
 
-        try:
-            from packaging import version
+        self._config = LauncherConfiguration(
+            platform_name=platform_name,
+            app_path_field="%s_path" % platform_name,
+            app_args_field="%s_args" % platform_name,
+            # When registering commands lazily, information which is costly to
+            # resolve is only resolved when a command is invoked.
+            lazy_registration=bool(
+                self._tk_app.get_setting("lazy_command_registration")
+            ),
+            skip_engine_instances=frozenset(
+                self._tk_app.get_setting("skip_engine_instances") or []
+            ),
+            register_commands=(
+                self._tk_app.engine.environment.get("name") not in SKIP_ENVIRONMENTS
+            ),
+            has_ui=self._tk_app.engine.has_ui,
+        )
 
-            self.version_parse = version.parse
-        except ModuleNotFoundError:
-            try:
-                from distutils.version import LooseVersion
+        # Tracks the launched processes and records their startup metrics.
+        self._supervisor = LaunchSupervisor(self._tk_app)
 
-                self.version_parse = LooseVersion
-            except ModuleNotFoundError:
-                try:
-                    from setuptools._distutils.version import LooseVersion
+        # Emits the launch event log entries and metrics in the background.
+        self._telemetry = LaunchTelemetry(self._tk_app)
 
-                    self.version_parse = LooseVersion
-                except ModuleNotFoundError:
-                    # Fall back to string comparison
-                    self.version_parse = str
-                    self._tk_app.log_debug(
-                        "Modules packaging or distutils not found in the Python environment, "
-                        "falling back to string comparison."
-                    )
+        # Records the time spent registering the launch commands.
+        self._registration_timer = RegistrationTimer("register_launch_commands")
+
+        # Engine launchers created when scanning for software or preparing
+        # launches, keyed by engine and context, reused by later launches
+        # until the launch commands are registered again.
+        self._engine_launchers = {}
 
     def _register_launch_command(
         self,
@@ -83,12 +150,16 @@ class BaseLauncher(object):
         group_default=True,
         software_entity=None,
         description=None,
+        resolve_callback=None,
     ):
         """
         Register a launch command with the current engine.
 
         Also handles replacement of {version} tokens.
 
+        When the ``lazy_command_registration`` setting is on, resolving environment
+        variables in the application path is deferred until the command is invoked.
+
         :param str app_menu_name: Menu name to display to launch this DCC. This is also
                                   used to construct the associated command name.
         :param str app_icon: Icon to display for this DCC
@@ -107,6 +178,11 @@ class BaseLauncher(object):
         :param int software_entity: (Optional) If set, this is the entity representing the software entity that
                                     is associated with this launch command.
         :param str description: (Optional) Custom description/tooltip to use.
+        :param resolve_callback: (Optional) Callable run the first time the command
+                                 is invoked, to resolve information which was not
+                                 resolved at registration time. It is passed the
+                                 command properties, which it can update, and must
+                                 return False if the command can't be launched.
 
         """
         # do the {version} replacement if needed
@@ -116,8 +192,10 @@ class BaseLauncher(object):
         if description is None:
             description = "Launches and initializes an application environment."
 
-        # Resolve any env variables in the specified path to the application to launch.
-        app_path = os.path.expandvars(apply_version_to_setting(app_path, version))
+        app_path = apply_version_to_setting(app_path, version)
+        if not self._config.lazy_registration:
+            # Resolve any env variables in the specified path to the application to launch.
+            app_path = os.path.expandvars(app_path)
 
         # the command name mustn't contain spaces and funny chars, so sanitize it.
         # Also, should be nice for the shell engine.
@@ -126,18 +204,7 @@ class BaseLauncher(object):
         if command_name.endswith("..."):
             command_name = command_name[:-3]
 
-        # special case! @todo: fix this.
-        # this is to allow this app to be loaded for sg entities of
-        # type publish but not show up on the Shotgun menu. The
-        # launch_from_path() and launch_from_path_and_context()
-        # methods for this app should be used for these environments
-        # instead. These methods are normally accessed via a hook.
-        skip_environments = [
-            "shotgun_tankpublishedfile",
-            "shotgun_publishedfile",
-            "shotgun_version",
-        ]
-        if self._tk_app.engine.environment.get("name") not in skip_environments:
+        if self._should_register_commands():
             properties = {
                 "title": menu_name,
                 "short_name": command_name,
@@ -152,11 +219,24 @@ class BaseLauncher(object):
                 software_entity.get("id") if software_entity else None
             )
 
+            # Result of the resolve callback, only run once.
+            resolved = []
+
             def launch_version(*args, **kwargs):
+                if resolve_callback is not None:
+                    if not resolved:
+                        resolved.append(resolve_callback(properties))
+                    if not resolved[0]:
+                        return
+
                 self._launch_callback(
                     menu_name,
                     app_engine,
-                    app_path,
+                    (
+                        os.path.expandvars(app_path)
+                        if self._config.lazy_registration
+                        else app_path
+                    ),
                     app_args,
                     version,
                     group,
@@ -173,6 +253,24 @@ class BaseLauncher(object):
                 command_name, launch_version, properties
             )
 
+    def _reset_launch_caches(self):
+        """
+        Forget the engine launchers and the signature of the environment files
+        remembered for the launches, so the engines and environments updated
+        since the launch commands were last registered are picked up.
+        """
+        clear_engine_launchers(self._engine_launchers)
+        BootstrapCache.reset_environment_signature()
+
+    def _should_register_commands(self):
+        """
+        Tells if commands should be registered with the current engine.
+
+        :returns: False if the current environment is one of the environments
+                  commands should not be registered in.
+        """
+        return self._config.register_commands
+
     def _launch_app(
         self,
         menu_name,
@@ -184,11 +282,17 @@ class BaseLauncher(object):
         file_to_open=None,
         software_entity=None,
         group=None,
+        indicator=None,
+        pending_steps=None,
+        timer=None,
     ):
         """
         Launches an application. No environment variable change is
         leaked to the outside world.
 
+        Failures are reported to the user, except for the errors of the
+        pending steps which are raised to the caller.
+
         :param menu_name: Menu name to display to launch this DCC. This is
                           also used to construct the associated command name.
         :param app_engine: The TK engine associated with the DCC to be launched
@@ -204,67 +308,40 @@ class BaseLauncher(object):
                                 the software entity that is associated with
                                 this launch command.
         :param group: (Optional) Group name this command belongs to.
+        :param indicator: (Optional) Launch indicator already displayed for
+                          this launch. If None, one is displayed if needed.
+        :param list pending_steps: (Optional) Futures of the steps run in
+                                   parallel with the preparation of the launch.
+                                   They must complete before the launch hooks
+                                   are run.
+        :param timer: (Optional) :class:`LaunchTimer` the launch stages are timed
+                      with.
+        :raises Exception: If one of the pending steps failed.
         """
-        try:
-            # Clone the environment variables
-            environ_clone = os.environ.copy()
-            sys_path_clone = list(sys.path)
-
-            # Get the executable path path and args. Adjust according to
-            # the relevant engine.
-            app_path = apply_version_to_setting(app_path, version)
-            app_args = apply_version_to_setting(app_args, version)
-            if app_engine:
-                prepped_path, prepped_args = prepare_launch_for_engine(
-                    app_engine, app_path, app_args, context, file_to_open
-                )
-                # QUESTION: Since *some* of the "prep" methods may modify
-                # the app_path and app_args values (e.g. _prepare_flame_flare_launch),
-                # should they be reset here like this?
-                # (This is not what it does currently)
-                app_path = prepped_path or app_path
-                app_args = prepped_args or app_args
-
-            version_string = get_clean_version_string(version)
-
-            # run before launch hook
-            self._tk_app.log_debug("Running before app launch hook...")
-            self._tk_app.execute_hook(
-                "hook_before_app_launch",
-                app_path=app_path,
-                app_args=app_args,
-                version=version_string,
-                engine_name=app_engine,
-                software_entity=software_entity,
-            )
+        if indicator is None:
+            indicator = self._create_launch_indicator()
 
-            # Ticket 26741: Avoid having odd DLL loading issues on windows
-            # Desktop PySide sets an explicit DLL path, which is getting
-            # inherited by subprocess. The following undoes that to make
-            # sure that apps depending on not having a DLL path are set
-            # to work properly
-            dll_directory_cache = clear_dll_directory()
-
-            try:
-                # Launch the application
-                self._tk_app.log_debug(
-                    "Launching executable '%s' with args '%s'" % (app_path, app_args)
-                )
-                result = self._tk_app.execute_hook(
-                    "hook_app_launch",
-                    app_path=app_path,
-                    app_args=app_args,
-                    version=version_string,
-                    engine_name=app_engine,
-                    software_entity=software_entity,
+        try:
+            with self._profile_launch(group or menu_name, version):
+                launch = self._run_launch(
+                    menu_name,
+                    app_engine,
+                    app_path,
+                    app_args,
+                    context,
+                    version,
+                    file_to_open,
+                    software_entity,
+                    group,
+                    indicator=indicator,
+                    pending_steps=pending_steps,
+                    timer=timer,
                 )
-                launch_cmd = result.get("command")
-                return_code = result.get("return_code")
-            finally:
-                restore_dll_directory(dll_directory_cache)
+            launch_cmd = launch["command"]
+            if launch["return_code"] != 0:
+                if indicator:
+                    indicator.close()
 
-            self._tk_app.log_debug("Hook tried to launch '%s'" % launch_cmd)
-            if return_code != 0:
                 # some special logic here to decide how to display failure feedback
                 if app_engine == "tk-shotgun":
                     # for the shotgun engine, use the log info in order to
@@ -294,27 +371,29 @@ class BaseLauncher(object):
                         "documentation: %s" % (launch_cmd, self._tk_app.HELP_DOC_URL)
                     )
 
-            else:
-                # Emit a launched software metric
-                try:
-                    # Dedicated try/except block: we wouldn't want a metric-related
-                    # exception to prevent execution of the remaining code.
-                    engine = sgtk.platform.current_engine()
-                    engine._host_info["name"] = group or menu_name
-                    engine._host_info["version"] = version_string
-                    engine.log_metric("Launched Software")
-
-                except Exception:
-                    pass
-                # Write an event log entry
-                self._register_event_log(menu_name, app_engine, context, launch_cmd)
-                # got UI support. Launch dialog with nice message unless disabled in configuration.
-                if self._tk_app.engine.has_ui and self._tk_app.get_setting(
-                    "show_launch_indicator"
-                ):
-                    self.launch_indicator(app_path)
+            elif indicator:
+                # Keep the launch indicator up until the application is ready.
+                ready_file = launch["ready_file"]
+
+                def is_ready():
+                    return ENGINE_STARTED_EVENT in read_ready_events(ready_file)
+
+                # A launcher process, like the macOS open command, exits right
+                # away and can't tell whether the application is still starting.
+                indicator.wait_for_ready(
+                    launch["app_path"],
+                    None if launch["process_is_launcher"] else launch["process"],
+                    is_ready if launch["expects_ready_signal"] else None,
+                )
 
         except Exception as launch_app_error:
+            if indicator:
+                indicator.close()
+            # Errors of the pending steps, like folder creation, are raised to
+            # the caller, as they were when these steps ran before the launch.
+            for step in pending_steps or []:
+                if step.done() and step.exception() is launch_app_error:
+                    raise
             msg = str(launch_app_error)
             self._tk_app.log_error(msg)
             if self._tk_app.engine.has_ui:
@@ -322,14 +401,365 @@ class BaseLauncher(object):
 
                 show_generic_error_dialog(self._tk_app, error_message=msg)
 
+    @contextlib.contextmanager
+    def _profile_launch(self, name, version):
+        """
+        Context manager profiling a launch with the launch profiler hook, if
+        the ``profile_launches`` setting is on.
+
+        :param str name: Name of the launched DCC.
+        :param str version: Version of the launched DCC, if any.
+        """
+        if not self._tk_app.get_setting("profile_launches"):
+            yield
+            return
+
+        version_string = get_clean_version_string(version)
+        try:
+            profiling_state = self._tk_app.execute_hook_method(
+                "hook_launch_profiler",
+                "start_profiling",
+                name=name,
+                version=version_string,
+            )
+        except Exception:
+            self._tk_app.logger.debug(
+                "Unable to start profiling the launch.", exc_info=True
+            )
+            yield
+            return
+
+        try:
+            yield
         finally:
-            # Clear the original structures and add into them so
-            # that users who did from os import environ and from
-            # sys import path get the restored values.
-            os.environ.clear()
-            os.environ.update(environ_clone)
-            del sys.path[:]
-            sys.path.extend(sys_path_clone)
+            try:
+                self._tk_app.execute_hook_method(
+                    "hook_launch_profiler",
+                    "stop_profiling",
+                    name=name,
+                    version=version_string,
+                    profiling_state=profiling_state,
+                )
+            except Exception:
+                self._tk_app.logger.debug(
+                    "Unable to stop profiling the launch.", exc_info=True
+                )
+
+    def _run_launch(
+        self,
+        menu_name,
+        app_engine,
+        app_path,
+        app_args,
+        context,
+        version=None,
+        file_to_open=None,
+        software_entity=None,
+        group=None,
+        indicator=None,
+        engine_launchers=None,
+        pending_steps=None,
+        timer=None,
+    ):
+        """
+        Prepares the launch of an application and runs the launch hooks.
+
+        The environment of the application is recorded in a
+        :class:`LaunchEnvironment` while preparing the launch, and the
+        application is spawned with it. The environment of the current process
+        is only updated while running engine launchers, engine bootstrap code
+        and hooks, which may read and write os.environ directly. These run
+        under a process-wide lock, so concurrent launches don't interfere with
+        each other but are serialized through them.
+
+        Nothing is reported to the user, see :meth:`_launch_app`.
+
+        See :meth:`_launch_app` for the parameters.
+
+        :param indicator: (Optional) Launch indicator to report progress to.
+        :param dict engine_launchers: (Optional) Engine launchers shared between
+                                      launches, see :func:`prepare_launch_for_engine`.
+                                      Defaults to the ones of this launcher.
+        :param list pending_steps: (Optional) Futures of the steps run in
+                                   parallel with the preparation of the launch.
+        :param timer: (Optional) :class:`LaunchTimer` the launch stages are timed
+                      with. The timing record is logged once the launch is done.
+        :returns: Dictionary with the launched 'app_path', the 'command',
+                  'return_code', 'process' and 'process_is_launcher' returned
+                  by the app launch hook, the 'ready_file' of the application
+                  and whether it 'expects_ready_signal'.
+        :raises Exception: If the launch couldn't be prepared.
+        """
+        if timer is None:
+            timer = LaunchTimer(group or menu_name, get_clean_version_string(version))
+        if engine_launchers is None:
+            engine_launchers = self._engine_launchers
+
+        launch = {}
+        try:
+            environment = LaunchEnvironment()
+
+            # Get the executable path path and args. Adjust according to
+            # the relevant engine.
+            app_path = apply_version_to_setting(app_path, version)
+            app_args = apply_version_to_setting(app_args, version)
+            if app_engine:
+                if indicator:
+                    indicator.report(0.3, "Preparing %s" % app_engine)
+                with timer.stage("prepare_launch"):
+                    prepped_path, prepped_args = prepare_launch_for_engine(
+                        app_engine,
+                        app_path,
+                        app_args,
+                        context,
+                        file_to_open,
+                        environment=environment,
+                        engine_launchers=engine_launchers,
+                        timer=timer,
+                    )
+                # QUESTION: Since *some* of the "prep" methods may modify
+                # the app_path and app_args values (e.g. _prepare_flame_flare_launch),
+                # should they be reset here like this?
+                # (This is not what it does currently)
+                app_path = prepped_path or app_path
+                app_args = prepped_args or app_args
+
+            # Wait for the steps run in parallel, like folder creation, to be done
+            # before running the hooks. This raises their errors, if any.
+            with timer.stage("wait_for_pending_steps"):
+                for step in pending_steps or []:
+                    step.result()
+
+            version_string = get_clean_version_string(version)
+
+            # Let the startup scripts signal when the engine has started.
+            ready_file = self._supervisor.new_ready_file()
+            environment[READY_FILE_ENV_VAR] = ready_file
+            expects_ready_signal = self._uses_app_specific_startup(
+                app_args, environment
+            )
+            if expects_ready_signal:
+                environment[READY_SCRIPT_ENV_VAR] = os.path.join(
+                    self._tk_app.disk_location,
+                    "app_specific",
+                    "common",
+                    "launch_ready.py",
+                )
+
+            # Hooks may still read and write os.environ directly.
+            with environment.applied():
+                # run before launch hook
+                self._tk_app.log_debug("Running before app launch hook...")
+                with timer.stage("before_app_launch_hook"):
+                    self._tk_app.execute_hook(
+                        "hook_before_app_launch",
+                        app_path=app_path,
+                        app_args=app_args,
+                        version=version_string,
+                        engine_name=app_engine,
+                        software_entity=software_entity,
+                        environment=environment,
+                    )
+
+                # Ticket 26741: Avoid having odd DLL loading issues on windows
+                # Desktop PySide sets an explicit DLL path, which is getting
+                # inherited by subprocess. The following undoes that to make
+                # sure that apps depending on not having a DLL path are set
+                # to work properly
+                dll_directory_cache = clear_dll_directory()
+
+                try:
+                    # Launch the application
+                    self._tk_app.log_debug(
+                        "Launching executable '%s' with args '%s'"
+                        % (app_path, app_args)
+                    )
+                    if indicator:
+                        indicator.report(0.6, "Launching executable '%s'" % app_path)
+                    with timer.stage("app_launch_hook"):
+                        result = self._tk_app.execute_hook(
+                            "hook_app_launch",
+                            app_path=app_path,
+                            app_args=app_args,
+                            version=version_string,
+                            engine_name=app_engine,
+                            software_entity=software_entity,
+                            environment=environment.to_dict(),
+                        )
+                finally:
+                    restore_dll_directory(dll_directory_cache)
+
+            launch = {
+                "app_path": app_path,
+                "command": result.get("command"),
+                "return_code": result.get("return_code"),
+                # Only set by hooks launching the application as a subprocess.
+                "process": result.get("process"),
+                "process_is_launcher": bool(result.get("process_is_launcher")),
+                "ready_file": ready_file,
+                "expects_ready_signal": expects_ready_signal,
+            }
+
+            self._tk_app.log_debug("Hook tried to launch '%s'" % launch["command"])
+            if launch["return_code"] != 0:
+                return launch
+
+            process = launch["process"]
+            if process is not None:
+                self._tk_app.log_debug("Launched process %d." % process.pid)
+            # Applications launched without a process are still tracked until
+            # they are ready, so their ready file is deleted. The ready file is
+            # not polled when no startup script will write to it.
+            self._supervisor.track(
+                process,
+                group or menu_name,
+                version_string,
+                result.get("start_time") or time.time(),
+                ready_file if expects_ready_signal else None,
+                process_is_launcher=launch["process_is_launcher"],
+            )
+
+            with timer.stage("telemetry"):
+                # Emit a launched software metric
+                self._telemetry.log_metric(group or menu_name, version_string)
+                # Write an event log entry
+                self._register_event_log(
+                    menu_name, app_engine, context, launch["command"]
+                )
+            return launch
+        finally:
+            write_launch_timings(
+                self._tk_app,
+                timer.to_dict(
+                    command=launch.get("command"),
+                    return_code=launch.get("return_code"),
+                ),
+            )
+
+    def _launch_batch(
+        self, menu_name, app_engine, app_path, app_args, items, max_workers=None
+    ):
+        """
+        Launches an application once for each of the given files, in a pool
+        of threads.
+
+        Engine launchers are shared between the launches. Engine launchers,
+        engine bootstrap code and hooks still run one launch at a time, see
+        :meth:`_run_launch`. Failures are not reported to the user but returned
+        with the results.
+
+        :param menu_name: Menu name used to launch this DCC.
+        :param app_engine: The TK engine associated with the DCC to be launched
+        :param app_path: Full path name to the DCC. This may contain environment
+                         variables and/or the locally supported {version}, {v0},
+                         {v1}, ... variables
+        :param app_args: Args string to pass to the DCC at launch time
+        :param list items: List of (path, context, version) tuples. If the
+                           context is None, it is derived from the path.
+        :param int max_workers: (Optional) Maximum number of launches run at
+                                the same time. Defaults to the
+                                ``batch_launch_max_workers`` setting.
+        :returns: List of results, see :meth:`_get_batch_launch_result`, in
+                  the order of the items.
+        """
+        if not items:
+            return []
+
+        max_workers = max_workers or self._tk_app.get_setting(
+            "batch_launch_max_workers"
+        )
+
+        def launch_item(item):
+            path, context, version = item
+            try:
+                if context is None:
+                    context = self._tk_app.sgtk.context_from_path(path)
+                launch = self._run_launch(
+                    menu_name,
+                    app_engine,
+                    app_path,
+                    app_args,
+                    context,
+                    version,
+                    file_to_open=path,
+                )
+            except Exception as e:
+                self._tk_app.logger.debug("Unable to launch %s." % path, exc_info=True)
+                return self._get_batch_launch_result(item, error=str(e))
+            return self._get_batch_launch_result(item, launch)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(items))),
+            thread_name_prefix="BatchLaunch",
+        ) as executor:
+            return list(executor.map(launch_item, items))
+
+    @staticmethod
+    def _get_batch_launch_result(item, launch=None, error=None):
+        """
+        Build the result of a batch launch item.
+
+        :param tuple item: The (path, context, version) item.
+        :param dict launch: (Optional) Launch information returned by
+                            :meth:`_run_launch`.
+        :param str error: (Optional) Error which prevented the launch.
+        :returns: Dictionary with the 'path', 'context' and 'version' of the
+                  item, 'success' telling if the application was launched, the
+                  launch 'command', 'return_code' and 'pid' when known, and the
+                  'error' which prevented the launch, if any.
+        """
+        path, context, version = item
+        launch = launch or {}
+        process = launch.get("process")
+        if error is None and launch.get("return_code") != 0:
+            error = "Failed to launch '%s'." % launch.get("command")
+        return {
+            "path": path,
+            "context": context,
+            "version": version,
+            "success": error is None,
+            "command": launch.get("command"),
+            "return_code": launch.get("return_code"),
+            "pid": process.pid if process is not None else None,
+            "error": error,
+        }
+
+    def _create_launch_indicator(self):
+        """
+        Display the launch indicator, unless there is no UI or it is disabled
+        in the configuration.
+
+        :returns: A :class:`LaunchIndicator` instance or None.
+        """
+        if not self._tk_app.engine.has_ui or not self._tk_app.get_setting(
+            "show_launch_indicator"
+        ):
+            return None
+
+        from ..launch_indicator_dialog import LaunchIndicator
+
+        return LaunchIndicator(self._tk_app)
+
+    def _uses_app_specific_startup(self, app_args, environment):
+        """
+        Tells if the application about to be launched will run one of the
+        app_specific startup scripts, which report when the engine has started.
+
+        These scripts are passed to the application through its arguments or
+        through environment variables set when preparing the launch.
+
+        :param str app_args: Arguments the application is launched with.
+        :param environment: :class:`LaunchEnvironment` of the application.
+        :returns: True if an app_specific startup script will be run.
+        """
+        app_specific_path = os.path.join(self._tk_app.disk_location, "app_specific")
+        if app_args and app_specific_path in app_args:
+            return True
+        return any(
+            app_specific_path in value
+            for value in environment.changes.values()
+            if value
+        )
 
     def launch_indicator(self, app_path):
         """
@@ -342,26 +772,14 @@ class BaseLauncher(object):
                  {v1}, ... variables
         """
         if self._tk_app.engine.has_ui:
-            from ..launch_indicator_dialog import populate_launch_dialog
-
-            wid, dial = populate_launch_dialog(self._tk_app)
-            # Start spinner
-            wid.start_progress()
-            # Report progress
-            splash_message = "Launching executable '%s'" % (app_path)
-            wid.report_progress(0.00, splash_message)
-            splash_msg = "Launched successfully"
-            QtCore.QTimer.singleShot(
-                7000,
-                lambda: wid.report_progress(0.97, splash_msg),
-            )
-            # Hide the QDialog
-            QtCore.QTimer.singleShot(10000, lambda: dial.reject())
+            from ..launch_indicator_dialog import LaunchIndicator
+
+            LaunchIndicator(self._tk_app).wait_for_ready(app_path)
 
     def _register_event_log(self, menu_name, app_engine, ctx, command_executed):
         """
         Writes an event log entry to the shotgun event log, informing
-        about the app launch
+        about the app launch. The entry is created in the background.
 
         :param menu_name: Menu name displayed to launch a DCC.
         :param app_engine: The TK engine associated with the launched DCC.
@@ -390,9 +808,7 @@ class BaseLauncher(object):
         if ctx.task:
             meta["task"] = ctx.task["id"]
         desc = "%s %s: %s" % (self._tk_app.name, self._tk_app.version, menu_name)
-        sgtk.util.create_event_log_entry(
-            self._tk_app.sgtk, ctx, "Toolkit_App_Startup", desc, meta
-        )
+        self._telemetry.create_event_log_entry(ctx, "Toolkit_App_Startup", desc, meta)
 
     def _launch_callback(
         self,
@@ -404,10 +820,14 @@ class BaseLauncher(object):
         group=None,
         file_to_open=None,
         software_entity=None,
+        force_folders=False,
     ):
         """
         Default method to launch DCC application command based on the current context.
 
+        Folders are created for the context before launching the DCC, unless
+        they were recently created, see the ``folder_creation_cache_ttl`` setting.
+
         :param menu_name: Menu name displayed to launch this DCC.
         :param app_engine: The TK engine associated with the DCC to be launched.
         :param app_path: Full path to the DCC. May contain environment variables
@@ -420,6 +840,11 @@ class BaseLauncher(object):
         :param software_entity: (Optional) If set, this is the entity representing
                                 the software entity that is associated with
                                 this launch command.
+        :param bool force_folders: (Optional) Create folders even if they were
+                                   recently created. Folders are always created
+                                   when the ``force_folder_creation`` setting
+                                   is on.
+        :raises TankError: If folders could not be created.
         """
         # Verify a Project is defined in the context.
         if self._tk_app.context.project is None:
@@ -439,6 +864,12 @@ class BaseLauncher(object):
             entity_type = self._tk_app.context.task["type"]
             entity_id = self._tk_app.context.task["id"]
 
+        indicator = self._create_launch_indicator()
+        timer = LaunchTimer(group or menu_name, get_clean_version_string(version))
+
+        # Steps run in parallel with the preparation of the launch.
+        pending_steps = []
+
         if len(self._tk_app.sgtk.roots) == 0:
             # configuration doesn't have any filesystem roots defined
             self._tk_app.log_debug(
@@ -451,18 +882,53 @@ class BaseLauncher(object):
             # this takes precedence. Otherwise, use the engine name for the
             # DCC application by default.
             defer_keyword = self._tk_app.get_setting("defer_keyword") or app_engine
-            try:
+            folder_creation_cache = FolderCreationCache(
+                self._tk_app,
+                self._tk_app.get_setting("folder_creation_cache_ttl"),
+                self._tk_app.get_setting("folder_creation_cache_on_disk"),
+            )
+            force_folders = force_folders or self._tk_app.get_setting(
+                "force_folder_creation"
+            )
+            # Walking the schema is costly, only do it once per launch.
+            schema_signature = (
+                folder_creation_cache.get_schema_signature()
+                if folder_creation_cache.enabled
+                else None
+            )
+            if not force_folders and folder_creation_cache.is_created(
+                entity_type, entity_id, defer_keyword, schema_signature
+            ):
+                self._tk_app.log_debug(
+                    "Folders for %s %s were recently created with defer keyword "
+                    "'%s'. Skipping folder creation."
+                    % (entity_type, entity_id, defer_keyword)
+                )
+            else:
                 self._tk_app.log_debug(
                     "Creating folders for %s %s. Defer keyword: '%s'"
                     % (entity_type, entity_id, defer_keyword)
                 )
-                self._tk_app.sgtk.create_filesystem_structure(
-                    entity_type, entity_id, engine=defer_keyword
+                if indicator:
+                    indicator.report(0.1, "Creating folders")
+                # Folder creation walks the schema and hits the storage while
+                # engine preparation resolves engine paths and bootstrap
+                # scripts: run them at the same time.
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="FolderCreation"
                 )
-            except sgtk.TankError as err:
-                raise TankError(
-                    "Could not create folders on disk. Error reported: %s" % err
+                pending_steps.append(
+                    executor.submit(
+                        self._create_folders,
+                        entity_type,
+                        entity_id,
+                        defer_keyword,
+                        folder_creation_cache,
+                        schema_signature,
+                        timer,
+                    )
                 )
+                executor.shutdown(wait=False)
 
         # Launch the DCC
         self._launch_app(
@@ -475,8 +941,63 @@ class BaseLauncher(object):
             file_to_open,
             software_entity,
             group,
+            indicator=indicator,
+            pending_steps=pending_steps,
+            timer=timer,
         )
 
+    def _create_folders(
+        self,
+        entity_type,
+        entity_id,
+        defer_keyword,
+        folder_creation_cache,
+        schema_signature,
+        timer,
+    ):
+        """
+        Create folders for the given entity and remember they were created.
+
+        :param str entity_type: Type of the entity to create folders for.
+        :param int entity_id: Id of the entity to create folders for.
+        :param str defer_keyword: Deferred folder creation keyword.
+        :param folder_creation_cache: :class:`FolderCreationCache` to remember
+                                      the creation in.
+        :param str schema_signature: Signature of the schema the folders are
+                                     created from.
+        :param timer: :class:`LaunchTimer` to time the creation with.
+        :raises TankError: If folders could not be created.
+        """
+        try:
+            # Folder creation doesn't need the environment of the launch, so it
+            # doesn't take the os.environ lock, which would block the launch
+            # preparation until the folders are created.
+            with timer.stage("folder_creation"):
+                self._tk_app.sgtk.create_filesystem_structure(
+                    entity_type, entity_id, engine=defer_keyword
+                )
+        except sgtk.TankError as err:
+            raise TankError(
+                "Could not create folders on disk. Error reported: %s" % err
+            )
+        folder_creation_cache.add(
+            entity_type, entity_id, defer_keyword, schema_signature
+        )
+
+    @property
+    def registration_report(self):
+        """
+        Report of the time spent registering the launch commands, as returned
+        by :meth:`RegistrationTimer.to_dict`.
+        """
+        return self._registration_timer.to_dict()
+
+    def _log_registration_report(self):
+        """
+        Log the report of the time spent registering the launch commands.
+        """
+        log_registration_report(self._tk_app, self.registration_report)
+
     def register_launch_commands(self):
         """
         Abstract method implemented by derived classes to
@@ -505,15 +1026,26 @@ class BaseLauncher(object):
         """
         raise NotImplementedError
 
+    def launch_batch(self, items, max_workers=None):
+        """
+        Abstract method that can optionally be implemented by derived classes
+
+        :param list items: List of (path, context, version) tuples to launch the
+                           DCC with. If the context is None, it is derived from
+                           the path.
+        :param int max_workers: (Optional) Maximum number of launches run at
+                                the same time.
+        :returns: List of results, one per item.
+        """
+        raise NotImplementedError
+
     def _sort_versions(self, versions):
         """
-        Uses standard python modules to determine how to sort arbitrary version numbers.
-        A version number consists of a series of numbers, separated by either periods or
-        strings of letters. When comparing version numbers, the numeric components will
-        be compared numerically, and the alphabetic components lexically. For example:
+        Sort arbitrary version numbers, as described in
+        :func:`get_version_sort_key`. For example:
 
             1.1 < 1.2 < 1.3
-            1.2 < 1.2a < 1.2ab < 1.2b
+            1.0b1 < 1.0 < 1.0v1
 
         The input list of versions is not modified.
 
@@ -521,19 +1053,4 @@ class BaseLauncher(object):
         :returns: List of sorted versions in descending order. The highest version is
                   at index 0.
         """
-        # For Python 3.10: Try suppress_known_deprecation context manager on tk-core.
-        try:
-            ctx_mgr = sgtk.util.suppress_known_deprecation
-        except AttributeError:
-            ctx_mgr = contextlib.nullcontext
-        with ctx_mgr():
-            # Cast the incoming version strings to sort them
-            try:
-                sort_versions = [self.version_parse(v) for v in versions]
-            except Exception as e:
-                sort_versions = [get_clean_version_string(v) for v in versions]
-
-            sort_versions.sort(reverse=True)
-
-        # Convert the parsed versions back to strings on return.
-        return [str(v) for v in sort_versions]
+        return sorted(versions, key=get_version_sort_key, reverse=True)
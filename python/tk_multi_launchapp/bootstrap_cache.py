@@ -0,0 +1,259 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import hashlib
+import importlib
+import os
+import sys
+import threading
+
+import sgtk
+
+
+class BootstrapCache(object):
+    """
+    Memo of the engine paths and engine bootstrap modules used to prepare
+    application launches.
+
+    Engine paths are resolved from the environment of the launch context, which
+    parses the environment files. They are remembered for the lifetime of the
+    process, keyed by engine name, pipeline configuration and context, and by a
+    signature of the environment files, so editing the environment invalidates
+    them. The signature is computed once, until
+    :meth:`reset_environment_signature` is called when the launch commands are
+    registered again.
+
+    Bootstrap modules are imported once, with the modules they import from
+    their folder, and reused until their file changes, like regular imports.
+    """
+
+    # Engine paths keyed by (engine name, configuration path, context), with
+    # the signature of the environment files they were resolved for. Shared by
+    # all the app instances.
+    _engine_paths = {}
+    # Signatures of the environment files keyed by environment folder.
+    _environment_signatures = {}
+    # Bootstrap modules keyed by (folder, module name), with the modification
+    # time and size of the file they were loaded from and the modules they
+    # imported from their folder, including themselves.
+    _modules = {}
+    _lock = threading.Lock()
+
+    def __init__(self, tk_app):
+        """
+        :param tk_app: The TK Application instance owning the cache.
+        """
+        self._tk_app = tk_app
+
+    @classmethod
+    def clear(cls):
+        """
+        Forget all the remembered engine paths, environment signatures and
+        bootstrap modules.
+        """
+        with cls._lock:
+            cls._engine_paths.clear()
+            cls._environment_signatures.clear()
+            cls._modules.clear()
+
+    @classmethod
+    def reset_environment_signature(cls):
+        """
+        Compute the signature of the environment files again the next time
+        it is needed, picking up the environment changes made since.
+        """
+        with cls._lock:
+            cls._environment_signatures.clear()
+
+    def get_engine_path(self, engine_name, context):
+        """
+        Return the path to the given engine in the environment of the given
+        context.
+
+        :param str engine_name: Name of the engine instance.
+        :param context: The context the engine is launched in.
+        :returns: Path to the engine or None if it isn't configured in the
+                  environment.
+        """
+        tk = self._tk_app.sgtk
+        key = (
+            engine_name,
+            tk.pipeline_configuration.get_path(),
+            context.serialize(with_user_credentials=False, use_json=True),
+        )
+        signature = self.get_environment_signature()
+        with self._lock:
+            cached = self._engine_paths.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        engine_path = sgtk.platform.get_engine_path(engine_name, tk, context)
+        with self._lock:
+            self._engine_paths[key] = (signature, engine_path)
+        return engine_path
+
+    def get_environment_signature(self):
+        """
+        Return the signature of the environment files of the pipeline
+        configuration.
+
+        The environment files are only walked the first time, the signature is
+        then remembered until :meth:`reset_environment_signature` is called.
+
+        :returns: Hexadecimal digest changing when any of the environment
+                  files change.
+        """
+        env_location = os.path.dirname(self._tk_app.engine.environment["disk_location"])
+        with self._lock:
+            signature = self._environment_signatures.get(env_location)
+        if signature is None:
+            signature = self._compute_environment_signature(env_location)
+            with self._lock:
+                self._environment_signatures[env_location] = signature
+        return signature
+
+    @staticmethod
+    def _compute_environment_signature(env_location):
+        """
+        Compute a signature of the files in the given environment folder.
+
+        :param str env_location: Path to the environment folder.
+        :returns: Hexadecimal digest changing when any of the environment
+                  files change.
+        """
+        signature = hashlib.sha1()
+        for root, dirs, files in os.walk(env_location):
+            dirs.sort()
+            for file_name in sorted(files):
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                signature.update(
+                    repr((path, stat.st_mtime_ns, stat.st_size)).encode("utf-8")
+                )
+        return signature.hexdigest()
+
+    @contextlib.contextmanager
+    def loaded_module(self, python_path, module_name):
+        """
+        Context manager providing the given bootstrap module, importing it
+        from the given folder if it wasn't already or if it changed since.
+
+        The module is imported with the folder on sys.path, so it can import
+        its sibling modules. The modules imported from the folder are then
+        unloaded, so the bootstraps of other engines, or of other versions of
+        the engine, import their own. They are registered in sys.modules again
+        for the duration of the context, without altering sys.path, so the
+        module can still import them while it runs.
+
+        This must be run with the os.environ lock held, see
+        :meth:`LaunchEnvironment.applied`, which serializes the changes made to
+        sys.path and sys.modules.
+
+        :param str python_path: Folder to import the module from.
+        :param str module_name: Name of the module or package to import.
+        :yields: The loaded module.
+        :raises OSError: If the module file doesn't exist.
+        :raises ImportError: If the module can't be imported.
+        """
+        module_file = self._get_module_file(python_path, module_name)
+        stat = os.stat(module_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = (python_path, module_name)
+        with self._lock:
+            cached = self._modules.get(key)
+        if cached is not None and cached[0] == stamp:
+            modules = cached[1]
+        else:
+            modules = self._import_module(python_path, module_name)
+            self._tk_app.log_debug("Loaded bootstrap module %s" % module_file)
+            with self._lock:
+                self._modules[key] = (stamp, modules)
+
+        previous_modules = dict((name, sys.modules.get(name)) for name in modules)
+        sys.modules.update(modules)
+        loaded_modules = dict(sys.modules)
+        try:
+            yield modules[module_name]
+        finally:
+            # Modules the bootstrap imported from its folder while it ran are
+            # unloaded too, and reused by the next launches.
+            imported = _unload_modules(python_path, loaded_modules)
+            with self._lock:
+                modules.update(imported)
+            for name, module in previous_modules.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+
+    @staticmethod
+    def _get_module_file(python_path, module_name):
+        """
+        :returns: Path to the file of the given module, or of the __init__.py
+                  file of the given package, in the given folder.
+        """
+        module_path = os.path.join(python_path, module_name)
+        if os.path.isdir(module_path):
+            return os.path.join(module_path, "__init__.py")
+        return module_path + ".py"
+
+    @staticmethod
+    def _import_module(python_path, module_name):
+        """
+        Import the given module from the given folder, then unload the modules
+        imported from the folder.
+
+        :param str python_path: Folder to import the module from.
+        :param str module_name: Name of the module or package to import.
+        :returns: Dictionary of the modules imported from the folder, keyed
+                  by name.
+        """
+        modules = dict(sys.modules)
+        # A module with the same name imported from another folder is not
+        # reused, e.g. the bootstrap module of another engine.
+        sys.modules.pop(module_name, None)
+        sys.path.insert(0, python_path)
+        try:
+            importlib.import_module(module_name)
+        finally:
+            sys.path.remove(python_path)
+            imported = _unload_modules(python_path, modules)
+            if module_name in modules and module_name not in sys.modules:
+                sys.modules[module_name] = modules[module_name]
+        return imported
+
+
+def _unload_modules(python_path, modules):
+    """
+    Unload the modules imported from the given path, restoring the modules
+    they replaced.
+
+    :param str python_path: Path the modules were imported from.
+    :param dict modules: Copy of sys.modules before the modules were imported.
+    :returns: Dictionary of the unloaded modules, keyed by name.
+    """
+    python_path = os.path.join(os.path.abspath(python_path), "")
+    unloaded = {}
+    for name, module in list(sys.modules.items()):
+        if modules.get(name) is module:
+            continue
+        module_file = getattr(module, "__file__", None) or ""
+        if not os.path.abspath(module_file).startswith(python_path):
+            continue
+        unloaded[name] = module
+        if name in modules:
+            sys.modules[name] = modules[name]
+        else:
+            del sys.modules[name]
+    return unloaded
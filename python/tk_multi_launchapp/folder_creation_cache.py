@@ -0,0 +1,158 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import os
+import threading
+import time
+
+from .util import load_cache_file, save_cache_file
+
+
+class FolderCreationCache(object):
+    """
+    Memo of the folder creations completed before launching applications.
+
+    Creating folders evaluates the folder schema and checks the storage and
+    Flow Production Tracking, even when the same folders were created by a
+    previous launch. Completed creations are remembered for the current session
+    and optionally on disk, keyed by entity, defer keyword and a signature of
+    the storage roots and folder schema of the pipeline configuration. Editing
+    the schema invalidates all the memos, which also expire after a TTL.
+    """
+
+    # Bump this if the layout of the cached data changes.
+    CACHE_VERSION = 1
+
+    # Completed creations of the current session, keyed by cache file path,
+    # then by creation key. Shared by all the app instances.
+    _session_creations = {}
+    _lock = threading.Lock()
+
+    def __init__(self, tk_app, cache_ttl, persistent=False):
+        """
+        :param tk_app: The TK Application instance owning the cache.
+        :param int cache_ttl: Number of seconds completed creations are
+                              remembered for. 0 disables the cache.
+        :param bool persistent: Whether completed creations are also stored on
+                                disk and remembered across sessions.
+        """
+        self._tk_app = tk_app
+        self._cache_ttl = cache_ttl
+        self._persistent = persistent
+        self._path = os.path.join(tk_app.cache_location, "folder_creations.pickle")
+
+    @property
+    def enabled(self):
+        """
+        Whether completed creations are remembered.
+        """
+        return self._cache_ttl > 0
+
+    def is_created(self, entity_type, entity_id, defer_keyword, schema_signature):
+        """
+        Tells if folders were recently created for the given entity.
+
+        :param str entity_type: Type of the entity folders are created for.
+        :param int entity_id: Id of the entity folders are created for.
+        :param str defer_keyword: Deferred folder creation keyword.
+        :param str schema_signature: Signature of the schema, as returned by
+                                     :meth:`get_schema_signature`.
+        :returns: True if the creation is remembered and didn't expire.
+        """
+        if not self.enabled:
+            return False
+
+        key = (entity_type, entity_id, defer_keyword, schema_signature)
+        with self._lock:
+            timestamp = self._get_creations().get(key)
+        return timestamp is not None and time.time() - timestamp < self._cache_ttl
+
+    def add(self, entity_type, entity_id, defer_keyword, schema_signature):
+        """
+        Remember folders were just created for the given entity.
+
+        :param str entity_type: Type of the entity folders were created for.
+        :param int entity_id: Id of the entity folders were created for.
+        :param str defer_keyword: Deferred folder creation keyword.
+        :param str schema_signature: Signature of the schema, as returned by
+                                     :meth:`get_schema_signature`.
+        """
+        if not self.enabled:
+            return
+
+        key = (entity_type, entity_id, defer_keyword, schema_signature)
+        now = time.time()
+        with self._lock:
+            creations = self._get_creations()
+            creations[key] = now
+            # Forget about expired creations so the memo doesn't grow forever.
+            for expired_key in [
+                k for k, t in creations.items() if now - t >= self._cache_ttl
+            ]:
+                del creations[expired_key]
+
+            if self._persistent:
+                save_cache_file(
+                    self._path,
+                    {"version": self.CACHE_VERSION, "creations": creations},
+                )
+
+    def _get_creations(self):
+        """
+        Return the completed creations, loading them from disk the first time
+        if the cache is persistent. Must be called with the lock held.
+
+        :returns: Dictionary of creation timestamps keyed by creation key.
+        """
+        creations = self._session_creations.get(self._path)
+        if creations is not None:
+            return creations
+
+        creations = {}
+        if self._persistent and os.path.exists(self._path):
+            try:
+                data = load_cache_file(self._path)
+                if data.get("version") == self.CACHE_VERSION:
+                    creations = data["creations"]
+            except Exception:
+                self._tk_app.logger.debug(
+                    "Unable to read folder creation cache %s, ignoring it.",
+                    self._path,
+                    exc_info=True,
+                )
+        self._session_creations[self._path] = creations
+        return creations
+
+    def get_schema_signature(self):
+        """
+        Compute a signature of the storage roots and of the folder schema of
+        the pipeline configuration. This walks the schema, so it should be
+        computed once per launch.
+
+        :returns: Hexadecimal digest changing when any of the schema files,
+                  or the roots, change.
+        """
+        tk = self._tk_app.sgtk
+        signature = hashlib.sha1(repr(sorted(tk.roots.items())).encode("utf-8"))
+
+        schema_location = tk.pipeline_configuration.get_schema_config_location()
+        for root, dirs, files in os.walk(schema_location):
+            dirs.sort()
+            for file_name in sorted(files):
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                signature.update(
+                    repr((path, stat.st_mtime_ns, stat.st_size)).encode("utf-8")
+                )
+        return signature.hexdigest()
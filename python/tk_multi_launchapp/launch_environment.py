@@ -0,0 +1,183 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import os
+import threading
+
+# Serializes the code temporarily applying a launch environment to os.environ,
+# so concurrent launches don't see each other's environment.
+_os_environ_lock = threading.RLock()
+
+
+class LaunchEnvironment(object):
+    """
+    Environment of an application being launched.
+
+    The environment is stored as a set of changes on top of the current process
+    environment, which is never modified, except temporarily by :meth:`applied`.
+    Preparing a launch only records the changes, and the full environment is
+    only built once, to spawn the application.
+
+    Engine launchers, engine bootstrap code and hooks still read and write
+    os.environ directly, so they are run with the environment applied. Only
+    one environment can be applied at a time, so this part of concurrent
+    launches is serialized.
+    """
+
+    def __init__(self):
+        # Changed variables. A value of None means the variable is unset.
+        self._changes = {}
+        # True while the environment is applied to os.environ.
+        self._applied = False
+
+    def get(self, name, default=None):
+        """
+        Return the value of the given environment variable.
+
+        :param str name: Name of the environment variable.
+        :param default: Value returned if the variable is not set.
+        """
+        if name in self._changes:
+            value = self._changes[name]
+            return default if value is None else value
+        return os.environ.get(name, default)
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name, value):
+        self.update({name: value})
+
+    def __delitem__(self, name):
+        self.update({name: None})
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def update(self, environment):
+        """
+        Set the given environment variables.
+
+        :param dict environment: Values keyed by environment variable names.
+                                 Variables with a value of None are unset.
+        """
+        self._changes.update(environment)
+        if self._applied:
+            _set_variables(os.environ, environment)
+
+    def append_path(self, name, path):
+        """
+        Append a path to a path-style environment variable, unless it is
+        already in it. This is the equivalent of
+        :func:`sgtk.util.append_path_to_env_var`.
+
+        :param str name: Name of the environment variable.
+        :param str path: Path to append.
+        """
+        paths = self._get_paths(name)
+        if path not in paths:
+            paths.append(path)
+        self[name] = os.pathsep.join(paths)
+
+    def prepend_path(self, name, path):
+        """
+        Prepend a path to a path-style environment variable, moving it to the
+        front if it is already in it. This is the equivalent of
+        :func:`sgtk.util.prepend_path_to_env_var`.
+
+        :param str name: Name of the environment variable.
+        :param str path: Path to prepend.
+        """
+        paths = [p for p in self._get_paths(name) if p != path]
+        self[name] = os.pathsep.join([path] + paths)
+
+    def _get_paths(self, name):
+        """
+        :param str name: Name of a path-style environment variable.
+        :returns: List of the non empty paths in the variable.
+        """
+        return [p for p in self.get(name, "").split(os.pathsep) if p]
+
+    @property
+    def changes(self):
+        """
+        Dictionary of the changed environment variables. Unset variables have
+        a value of None.
+        """
+        return dict(self._changes)
+
+    def to_dict(self):
+        """
+        Build the full environment to launch the application with.
+
+        :returns: Dictionary of environment variable values.
+        """
+        environment = dict(os.environ)
+        for name, value in self._changes.items():
+            if value is None:
+                environment.pop(name, None)
+            else:
+                environment[name] = value
+        return environment
+
+    def export(self):
+        """
+        Apply the changes to os.environ for good.
+        """
+        with _os_environ_lock:
+            _set_variables(os.environ, self._changes)
+
+    @contextlib.contextmanager
+    def applied(self):
+        """
+        Context manager temporarily applying the environment to os.environ.
+
+        This is used to run code which reads or writes os.environ directly,
+        like engine bootstrap scripts and hooks. Any change made to os.environ
+        within the context is recorded in the environment, then os.environ is
+        restored. Only one environment can be applied at a time.
+        """
+        with _os_environ_lock:
+            # Original values of the variables changed in os.environ.
+            original = dict((name, os.environ.get(name)) for name in self._changes)
+            _set_variables(os.environ, self._changes)
+
+            applied_environ = dict(os.environ)
+            self._applied = True
+            try:
+                yield self
+            finally:
+                self._applied = False
+                for name in set(applied_environ).union(os.environ):
+                    value = os.environ.get(name)
+                    if value != applied_environ.get(name):
+                        self._changes[name] = value
+                        original.setdefault(name, applied_environ.get(name))
+
+                _set_variables(os.environ, original)
+
+
+def _set_variables(environ, values):
+    """
+    Set or unset the given variables in the given environment.
+
+    :param environ: Environment to update, usually os.environ.
+    :param dict values: Values keyed by variable names. Variables with a
+                        value of None are unset.
+    """
+    for name, value in values.items():
+        if value is None:
+            environ.pop(name, None)
+        else:
+            environ[name] = value
@@ -0,0 +1,377 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import json
+import os
+import threading
+import time
+import uuid
+
+import sgtk
+
+# Environment variable holding the path to the file launched applications
+# write their readiness events to. See the app_specific startup scripts.
+READY_FILE_ENV_VAR = "SGTK_LAUNCHAPP_READY_FILE"
+
+# Environment variable holding the path to the script the app_specific startup
+# scripts run to write the engine started event to the ready file.
+READY_SCRIPT_ENV_VAR = "SGTK_LAUNCHAPP_READY_SCRIPT"
+
+# Event written to the ready file once the engine has started in the DCC.
+ENGINE_STARTED_EVENT = "engine_started"
+
+
+def read_ready_events(ready_file):
+    """
+    Read the events written to the given ready file by a launched application.
+
+    Each line of the file holds an event name and the time it was sent at.
+
+    :param str ready_file: Path to the ready file.
+    :returns: Dictionary of event times keyed by event names. Empty if the
+              file doesn't exist yet.
+    """
+    events = {}
+    try:
+        with open(ready_file, "r") as fh:
+            for line in fh:
+                tokens = line.split()
+                if not tokens:
+                    continue
+                try:
+                    events[tokens[0]] = float(tokens[1])
+                except (IndexError, ValueError):
+                    events[tokens[0]] = time.time()
+    except (IOError, OSError):
+        pass
+    return events
+
+
+class LaunchSupervisor(object):
+    """
+    Tracks launched processes by pid and records their startup time, exit code
+    and lifetime.
+
+    The startup time is the time between the launch and the engine started
+    event written by the launched application to its ready file. Only
+    applications launched through the app_specific startup scripts send it.
+
+    The exit code and lifetime are only recorded when the launched process is
+    the application itself, not a launcher like the macOS open command.
+
+    Per DCC and version percentiles of these values are kept in a local
+    metrics file, shared by all the processes running the app.
+    """
+
+    # Seconds between two checks of the ready file.
+    POLL_INTERVAL = 0.5
+
+    # Seconds after which the ready file is not checked anymore.
+    READY_TIMEOUT = 600
+
+    # Seconds to wait for the lock of the metrics file, and after which a lock
+    # is considered left over by a process which died while holding it.
+    METRICS_LOCK_TIMEOUT = 10
+    METRICS_LOCK_STALE_AGE = 60
+
+    # Number of samples kept per DCC and version to compute percentiles.
+    MAX_SAMPLES = 100
+
+    # Percentiles written to the metrics file.
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, tk_app):
+        """
+        :param tk_app: The TK Application instance.
+        """
+        self._tk_app = tk_app
+        self._ready_folder = os.path.join(tk_app.cache_location, "launch_ready")
+        self._metrics_path = os.path.join(
+            tk_app.site_cache_location, "launch_metrics.json"
+        )
+        self._lock = threading.Lock()
+        # Launched processes still running, keyed by pid.
+        self._processes = {}
+        # Whether ready files left over by previous sessions were deleted.
+        self._ready_folder_purged = False
+
+    @property
+    def metrics_path(self):
+        """
+        Path to the metrics file.
+        """
+        return self._metrics_path
+
+    @property
+    def processes(self):
+        """
+        Dictionary of the launched processes still running, keyed by pid.
+        """
+        with self._lock:
+            return dict(self._processes)
+
+    def new_ready_file(self):
+        """
+        Return the path to a new ready file for an application about to be launched.
+
+        :returns: Path to a file which doesn't exist yet.
+        """
+        sgtk.util.filesystem.ensure_folder_exists(self._ready_folder)
+        if not self._ready_folder_purged:
+            self._ready_folder_purged = True
+            self._purge_ready_files()
+        return os.path.join(self._ready_folder, "%s.ready" % uuid.uuid4().hex)
+
+    def _purge_ready_files(self):
+        """
+        Delete the ready files older than the ready timeout, left over by
+        sessions which exited before their launched applications were ready.
+        """
+        expiry_time = time.time() - self.READY_TIMEOUT
+        try:
+            file_names = os.listdir(self._ready_folder)
+        except OSError:
+            return
+        for file_name in file_names:
+            path = os.path.join(self._ready_folder, file_name)
+            try:
+                if os.path.getmtime(path) < expiry_time:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def track(
+        self,
+        process,
+        dcc_name,
+        dcc_version,
+        start_time,
+        ready_file,
+        process_is_launcher=False,
+    ):
+        """
+        Track the given launched process in a background thread until it exits.
+
+        Applications launched without a known process are only tracked until
+        they are ready, so their startup time is recorded and their ready file
+        is deleted.
+
+        :param process: The launched :class:`subprocess.Popen` instance, or None.
+        :param str dcc_name: Name of the launched DCC.
+        :param str dcc_version: Version of the launched DCC. Can be None.
+        :param float start_time: Time the process was launched at.
+        :param str ready_file: Path to the ready file of the process or None.
+        :param bool process_is_launcher: True if the process is a launcher which
+                                         exits once the application is started,
+                                         like the macOS open command.
+        """
+        if process is not None:
+            with self._lock:
+                self._processes[process.pid] = process
+
+        thread = threading.Thread(
+            target=self._supervise,
+            args=(
+                process,
+                dcc_name,
+                dcc_version,
+                start_time,
+                ready_file,
+                process_is_launcher,
+            ),
+            name="LaunchSupervisor-%s"
+            % (process.pid if process is not None else dcc_name),
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _supervise(
+        self,
+        process,
+        dcc_name,
+        dcc_version,
+        start_time,
+        ready_file,
+        process_is_launcher,
+    ):
+        """
+        Wait for the given process to be ready and to exit, and record metrics.
+        """
+        key = "%s %s" % (dcc_name, dcc_version) if dcc_version else dcc_name
+        # Only a process which is the application itself tells when the
+        # application exited, and with which exit code.
+        is_app = process is not None and not process_is_launcher
+        try:
+            # Poll the ready file while waiting for the engine to start.
+            startup_time = None
+            while ready_file:
+                ready_time = read_ready_events(ready_file).get(ENGINE_STARTED_EVENT)
+                if ready_time is not None:
+                    startup_time = ready_time - start_time
+                    self._tk_app.log_debug("%s started in %.2fs." % (key, startup_time))
+                    break
+                if is_app and process.poll() is not None:
+                    break
+                if time.time() - start_time >= self.READY_TIMEOUT:
+                    break
+                time.sleep(self.POLL_INTERVAL)
+
+            if not is_app:
+                if process is not None:
+                    # Reap the launcher process.
+                    process.wait()
+                self._record(key, startup_time=startup_time, launched=True)
+                return
+
+            if startup_time is not None:
+                self._record(key, startup_time=startup_time)
+            return_code = process.wait()
+            lifetime = time.time() - start_time
+            self._tk_app.log_debug(
+                "%s (pid %d) exited with code %s after %.2fs."
+                % (key, process.pid, return_code, lifetime)
+            )
+            self._record(key, exit_code=return_code, lifetime=lifetime, launched=True)
+        except Exception:
+            self._tk_app.logger.debug("Unable to supervise %s." % key, exc_info=True)
+        finally:
+            if ready_file and os.path.exists(ready_file):
+                sgtk.util.filesystem.safe_delete_file(ready_file)
+            if process is not None:
+                with self._lock:
+                    self._processes.pop(process.pid, None)
+
+    def _record(
+        self, key, startup_time=None, exit_code=None, lifetime=None, launched=False
+    ):
+        """
+        Add the given samples to the metrics file.
+
+        :param str key: DCC name and version the samples are for.
+        :param float startup_time: Seconds the DCC took to start.
+        :param int exit_code: Exit code of the DCC.
+        :param float lifetime: Seconds the DCC ran for.
+        :param bool launched: True to count a launch, once it is not supervised
+                              anymore.
+        """
+        # The metrics file is shared with other processes, e.g. the DCCs
+        # themselves, so it is read and written under a lock file.
+        with self._lock, self._metrics_file_lock() as locked:
+            if not locked:
+                self._tk_app.logger.debug(
+                    "Unable to lock %s, launch metrics are not recorded."
+                    % self._metrics_path
+                )
+                return
+            metrics = self.load_metrics()
+            dcc_metrics = metrics.setdefault(
+                key,
+                {"launches": 0, "startup_time": {}, "lifetime": {}, "exit_codes": {}},
+            )
+            if startup_time is not None:
+                self._add_sample(dcc_metrics["startup_time"], startup_time)
+            if launched:
+                dcc_metrics["launches"] += 1
+            if lifetime is not None:
+                self._add_sample(dcc_metrics["lifetime"], lifetime)
+            if exit_code is not None:
+                exit_codes = dcc_metrics["exit_codes"]
+                exit_codes[str(exit_code)] = exit_codes.get(str(exit_code), 0) + 1
+
+            tmp_path = "%s.%d.tmp" % (self._metrics_path, os.getpid())
+            try:
+                with open(tmp_path, "w") as fh:
+                    json.dump(metrics, fh, indent=2, sort_keys=True)
+                os.replace(tmp_path, self._metrics_path)
+            except Exception:
+                self._tk_app.logger.debug(
+                    "Unable to write launch metrics to %s." % self._metrics_path,
+                    exc_info=True,
+                )
+
+    @contextlib.contextmanager
+    def _metrics_file_lock(self):
+        """
+        Context manager holding the lock file of the metrics file.
+
+        The lock file is created exclusively, waiting for other processes to
+        release it. A lock file older than :attr:`METRICS_LOCK_STALE_AGE` is
+        considered left over by a process which died and is broken.
+
+        Yields True if the lock was acquired, False if it timed out.
+        """
+        lock_path = "%s.lock" % self._metrics_path
+        deadline = time.time() + self.METRICS_LOCK_TIMEOUT
+        fd = None
+        try:
+            sgtk.util.filesystem.ensure_folder_exists(os.path.dirname(lock_path))
+        except Exception:
+            deadline = 0
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except OSError:
+                pass
+            try:
+                lock_age = time.time() - os.path.getmtime(lock_path)
+                if lock_age > self.METRICS_LOCK_STALE_AGE:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                pass
+            if time.time() >= deadline:
+                break
+            time.sleep(0.05)
+
+        if fd is None:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            os.close(fd)
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+    def _add_sample(self, stats, value):
+        """
+        Add a sample to the given statistics and update their percentiles.
+
+        :param dict stats: Statistics holding a list of samples and percentiles.
+        :param float value: Sample to add.
+        """
+        samples = stats.setdefault("samples", [])
+        samples.append(round(value, 3))
+        del samples[: -self.MAX_SAMPLES]
+
+        sorted_samples = sorted(samples)
+        for percentile in self.PERCENTILES:
+            index = min(
+                len(sorted_samples) - 1,
+                int(round(percentile / 100.0 * (len(sorted_samples) - 1))),
+            )
+            stats["p%d" % percentile] = sorted_samples[index]
+
+    def load_metrics(self):
+        """
+        Load the metrics file.
+
+        :returns: Dictionary of metrics keyed by DCC name and version.
+        """
+        try:
+            with open(self._metrics_path, "r") as fh:
+                return json.load(fh)
+        except (IOError, OSError, ValueError):
+            return {}
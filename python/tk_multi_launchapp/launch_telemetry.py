@@ -0,0 +1,306 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+
+import sgtk
+
+
+class LaunchTelemetry(object):
+    """
+    Emits the launch telemetry, event log entries and metrics, from a
+    background thread so launches don't wait on network round-trips.
+
+    Event log entries queued within a short delay are created in a single
+    Flow Production Tracking batch request. Entries which can't be sent, for
+    example because the connection dropped, are written to a local spool file
+    and sent with the next batch.
+
+    When the process exits, the queued telemetry is emitted right away, without
+    waiting for more entries, for up to :attr:`EXIT_TIMEOUT` seconds. Entries
+    still queued or being sent after that are spooled too. An entry whose
+    request completes while the process is exiting may then be sent twice.
+    """
+
+    # Seconds to wait for more entries once one is queued, to batch them.
+    BATCH_DELAY = 0.5
+
+    # Seconds to wait for the queued telemetry to be emitted when the process
+    # exits.
+    EXIT_TIMEOUT = 2.0
+
+    # Maximum number of event log entries created in a single batch request.
+    MAX_BATCH_SIZE = 50
+
+    def __init__(self, tk_app):
+        """
+        :param tk_app: The TK Application instance.
+        """
+        self._tk_app = tk_app
+        self._spool_path = os.path.join(
+            tk_app.site_cache_location, "event_log_spool.jsonl"
+        )
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        # Event log entries taken off the queue which are not sent or spooled
+        # yet.
+        self._in_flight = []
+        # Set when the process exits, to stop waiting for more entries.
+        self._exiting = threading.Event()
+
+    @property
+    def spool_path(self):
+        """
+        Path to the spool file unsent event log entries are written to.
+        """
+        return self._spool_path
+
+    def log_metric(self, host_name, host_version):
+        """
+        Queue the launched software metric.
+
+        :param str host_name: Name of the launched DCC.
+        :param str host_version: Version of the launched DCC. Can be None.
+        """
+        self._put(("metric", (sgtk.platform.current_engine(), host_name, host_version)))
+
+    def create_event_log_entry(self, context, event_type, description, metadata):
+        """
+        Queue the creation of an event log entry.
+
+        :param context: Context the entry is created for.
+        :param str event_type: Event type of the entry.
+        :param str description: Description of the entry.
+        :param dict metadata: Meta data of the entry.
+        """
+        data = {
+            "description": description,
+            "event_type": event_type,
+            "entity": context.entity,
+            "project": context.project,
+            "meta": metadata,
+        }
+        self._put(("event_log", data))
+
+    def flush(self, timeout=None):
+        """
+        Wait for all the queued telemetry to be emitted.
+
+        :param float timeout: Maximum number of seconds to wait for, or None
+                              to wait as long as needed.
+        :returns: True if everything was emitted.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _put(self, item):
+        """
+        Queue the given item and make sure the emitter thread is running.
+
+        :param tuple item: (kind, data) tuple.
+        """
+        self._queue.put(item)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="LaunchTelemetry"
+                )
+                self._thread.daemon = True
+                self._thread.start()
+                atexit.register(self._spool_pending_entries)
+
+    def _run(self):
+        """
+        Emit the queued telemetry until the process exits.
+        """
+        while True:
+            items = [self._get()]
+            # Give other launches a chance to queue their entries, unless the
+            # process is exiting.
+            deadline = time.time() + self.BATCH_DELAY
+            while len(items) < self.MAX_BATCH_SIZE:
+                remaining = deadline - time.time()
+                if remaining <= 0 or self._exiting.is_set():
+                    break
+                try:
+                    items.append(self._get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                entries = []
+                for kind, data in items:
+                    if kind == "metric":
+                        self._emit_metric(*data)
+                    else:
+                        entries.append(data)
+                if entries:
+                    self._create_event_log_entries(entries)
+            except Exception:
+                self._tk_app.logger.debug(
+                    "Unable to emit launch telemetry.", exc_info=True
+                )
+            finally:
+                with self._lock:
+                    del self._in_flight[:]
+                for _ in items:
+                    self._queue.task_done()
+
+    def _get(self, timeout=None):
+        """
+        Take the next item off the queue, tracking event log entries as in
+        flight until they are sent or spooled.
+
+        :param float timeout: Maximum number of seconds to wait for an item,
+                              or None to wait as long as needed.
+        :returns: A (kind, data) tuple.
+        :raises queue.Empty: If no item was queued before the timeout.
+        """
+        item = self._queue.get(timeout=timeout)
+        kind, data = item
+        if kind == "event_log":
+            with self._lock:
+                self._in_flight.append(data)
+        return item
+
+    def _emit_metric(self, engine, host_name, host_version):
+        """
+        Log the launched software metric through the given engine.
+        """
+        if engine is None:
+            return
+        try:
+            # We wouldn't want a metric-related exception to prevent the
+            # event log entries from being created.
+            engine._host_info["name"] = host_name
+            engine._host_info["version"] = host_version
+            engine.log_metric("Launched Software")
+        except Exception:
+            pass
+
+    def _create_event_log_entries(self, entries):
+        """
+        Create the given event log entries, along with the spooled ones, in a
+        single batch request. Entries are spooled if the request fails.
+
+        :param list entries: List of EventLogEntry data dictionaries.
+        """
+        spooled_entries = self._claim_spooled_entries()
+        with self._lock:
+            self._in_flight.extend(spooled_entries)
+        entries = spooled_entries + entries
+
+        user = sgtk.util.get_current_user(self._tk_app.sgtk)
+        requests = []
+        for data in entries:
+            if user and "user" not in data:
+                data = dict(data, user=user)
+            requests.append(
+                {"request_type": "create", "entity_type": "EventLogEntry", "data": data}
+            )
+
+        try:
+            for i in range(0, len(requests), self.MAX_BATCH_SIZE):
+                self._tk_app.shotgun.batch(requests[i : i + self.MAX_BATCH_SIZE])
+                # Only keep the entries which were not sent yet.
+                entries = entries[self.MAX_BATCH_SIZE :]
+        except Exception:
+            self._tk_app.logger.debug(
+                "Unable to create %d event log entries, spooling them to %s."
+                % (len(entries), self._spool_path),
+                exc_info=True,
+            )
+            self._spool(entries)
+
+    def _spool(self, entries):
+        """
+        Append the given event log entries to the spool file.
+
+        :param list entries: List of EventLogEntry data dictionaries.
+        """
+        try:
+            sgtk.util.filesystem.ensure_folder_exists(os.path.dirname(self._spool_path))
+            with open(self._spool_path, "a") as fh:
+                for data in entries:
+                    fh.write(json.dumps(data, default=str) + "\n")
+        except Exception:
+            self._tk_app.logger.debug(
+                "Unable to spool event log entries to %s." % self._spool_path,
+                exc_info=True,
+            )
+
+    def _claim_spooled_entries(self):
+        """
+        Read and remove the spooled event log entries.
+
+        The spool file is first renamed, so entries spooled by other processes
+        meanwhile are not lost, nor sent twice.
+
+        :returns: List of EventLogEntry data dictionaries.
+        """
+        if not os.path.exists(self._spool_path):
+            return []
+
+        claimed_path = "%s.%s" % (self._spool_path, uuid.uuid4().hex)
+        try:
+            os.replace(self._spool_path, claimed_path)
+        except OSError:
+            # Claimed by another process.
+            return []
+
+        entries = []
+        try:
+            with open(claimed_path, "r") as fh:
+                for line in fh:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        pass
+        except (IOError, OSError):
+            self._tk_app.logger.debug(
+                "Unable to read spooled event log entries %s." % claimed_path,
+                exc_info=True,
+            )
+        finally:
+            sgtk.util.filesystem.safe_delete_file(claimed_path)
+        return entries
+
+    def _spool_pending_entries(self):
+        """
+        Emit the queued telemetry when the process exits, then spool the event
+        log entries which are still queued or being sent.
+        """
+        self._exiting.set()
+        if self.flush(timeout=self.EXIT_TIMEOUT):
+            return
+
+        with self._lock:
+            entries = list(self._in_flight)
+            del self._in_flight[:]
+        while True:
+            try:
+                kind, data = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "event_log":
+                entries.append(data)
+        if entries:
+            self._spool(entries)
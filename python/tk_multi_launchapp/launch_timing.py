@@ -0,0 +1,219 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+import sgtk
+
+# Serializes the writes to timing files.
+_timings_file_lock = threading.Lock()
+
+
+class LaunchTimer(object):
+    """
+    Structured record of the time spent in each stage of a launch.
+
+    Stages can be timed from any thread, for example folder creation, which
+    runs in parallel with the preparation of the launch.
+    """
+
+    def __init__(self, name, version=None):
+        """
+        :param str name: Name of the launched DCC, or of the timed operation.
+        :param str version: Version of the launched DCC, if any.
+        """
+        self._name = name
+        self._version = version
+        self._start_time = time.time()
+        self._start = time.perf_counter()
+        self._stages = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name, **details):
+        """
+        Context manager timing a stage of the launch.
+
+        :param str name: Name of the stage.
+        :param details: Additional values to record with the stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, start, time.perf_counter(), **details)
+
+    def add_stage(self, name, start, end, **details):
+        """
+        Record a stage of the launch.
+
+        :param str name: Name of the stage.
+        :param float start: Start of the stage, as returned by time.perf_counter().
+        :param float end: End of the stage, as returned by time.perf_counter().
+        :param details: Additional values to record with the stage.
+        """
+        stage = {
+            "name": name,
+            "start": round(start - self._start, 4),
+            "duration": round(end - start, 4),
+            "thread": threading.current_thread().name,
+        }
+        stage.update(details)
+        with self._lock:
+            self._stages.append(stage)
+
+    def to_dict(self, **extra):
+        """
+        Return the timing record of the launch.
+
+        :param extra: Additional values to add to the record.
+        :returns: Dictionary with the 'name' and 'version' of the launched DCC,
+                  the 'start_time' and 'duration' of the launch and the list of
+                  its 'stages', ordered by start. Each stage has a 'name', a
+                  'start' offset and a 'duration' in seconds, and the 'thread'
+                  it ran in.
+        """
+        with self._lock:
+            stages = sorted(self._stages, key=lambda stage: stage["start"])
+        record = {
+            "name": self._name,
+            "version": self._version,
+            "start_time": self._start_time,
+            "duration": round(time.perf_counter() - self._start, 4),
+            "stages": stages,
+        }
+        record.update(extra)
+        return record
+
+
+class RegistrationTimer(LaunchTimer):
+    """
+    Structured record of the time spent registering the launch commands.
+
+    Stages related to Software entities carry the label of their entity, as
+    returned by :meth:`get_entity_label`, in an 'entity' value, or the labels
+    of all the entities they are shared by in an 'entities' value.
+    """
+
+    @staticmethod
+    def get_entity_label(entity):
+        """
+        :param dict entity: Entity dictionary.
+        :returns: Label identifying the entity in the stages.
+        """
+        return "%s %s" % (entity["type"], entity["id"])
+
+    def to_dict(self, **extra):
+        """
+        Return the registration report.
+
+        :param extra: Additional values to add to the report.
+        :returns: Dictionary with the values returned by
+                  :meth:`LaunchTimer.to_dict` and the list of 'entities' the
+                  commands were registered for, slowest first. Each entity has
+                  an 'entity' label, a total 'duration' and the duration of
+                  each of its 'stages', keyed by stage name.
+        """
+        report = super(RegistrationTimer, self).to_dict(**extra)
+
+        entities = {}
+        for stage in report["stages"]:
+            labels = stage.get("entities") or [stage.get("entity")]
+            for label in filter(None, labels):
+                entity = entities.setdefault(
+                    label, {"entity": label, "duration": 0.0, "stages": {}}
+                )
+                entity["duration"] = round(entity["duration"] + stage["duration"], 4)
+                entity["stages"][stage["name"]] = round(
+                    entity["stages"].get(stage["name"], 0.0) + stage["duration"], 4
+                )
+        report["entities"] = sorted(
+            entities.values(), key=lambda entity: entity["duration"], reverse=True
+        )
+        return report
+
+
+def log_registration_report(tk_app, report, max_entities=10):
+    """
+    Log a summary of the given registration report at debug level.
+
+    :param tk_app: The TK Application instance.
+    :param dict report: Registration report, as returned by
+                        :meth:`RegistrationTimer.to_dict`.
+    :param int max_entities: Maximum number of entities to list, slowest first.
+    """
+    stage_durations = {}
+    for stage in report["stages"]:
+        stage_durations[stage["name"]] = (
+            stage_durations.get(stage["name"], 0.0) + stage["duration"]
+        )
+
+    lines = ["%s took %.3fs." % (report["name"], report["duration"])]
+    lines.extend(
+        "  %s: %.3fs" % (name, duration)
+        for name, duration in sorted(
+            stage_durations.items(), key=lambda item: item[1], reverse=True
+        )
+    )
+    if report["entities"]:
+        lines.append("Slowest entities:")
+        lines.extend(
+            "  %s: %.3fs (%s)"
+            % (
+                entity["entity"],
+                entity["duration"],
+                ", ".join(
+                    "%s %.3fs" % stage_duration
+                    for stage_duration in sorted(entity["stages"].items())
+                ),
+            )
+            for entity in report["entities"][:max_entities]
+        )
+    tk_app.log_debug("\n".join(lines))
+
+
+def write_launch_timings(tk_app, record):
+    """
+    Log the given launch timing record and append it to the timings file set
+    with the ``launch_timings_file`` setting, if any.
+
+    :param tk_app: The TK Application instance.
+    :param dict record: Timing record, as returned by :meth:`LaunchTimer.to_dict`.
+    """
+    tk_app.log_debug(
+        "Launch of %s took %.3fs: %s"
+        % (
+            " ".join(filter(None, [record["name"], record["version"]])),
+            record["duration"],
+            ", ".join(
+                "%s %.3fs" % (stage["name"], stage["duration"])
+                for stage in record["stages"]
+            ),
+        )
+    )
+
+    timings_file = tk_app.get_setting("launch_timings_file")
+    if not timings_file:
+        return
+
+    timings_file = os.path.expanduser(os.path.expandvars(timings_file))
+    try:
+        sgtk.util.filesystem.ensure_folder_exists(os.path.dirname(timings_file))
+        with _timings_file_lock:
+            with open(timings_file, "a") as fh:
+                fh.write(json.dumps(record, sort_keys=True, default=str) + "\n")
+    except Exception:
+        tk_app.logger.debug(
+            "Unable to write launch timings to %s." % timings_file, exc_info=True
+        )
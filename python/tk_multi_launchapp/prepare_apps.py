@@ -8,15 +8,47 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
+import collections
+import contextlib
 import os
-import sys
+import threading
 
 import sgtk
 from sgtk import TankError
 
+from .bootstrap_cache import BootstrapCache
+from .launch_environment import LaunchEnvironment
+from .launch_timing import LaunchTimer
+
+# Serializes the creation of engine launchers shared between launches.
+_engine_launchers_lock = threading.Lock()
+
+# Launch being prepared for an engine without an engine launcher, passed to the
+# engine preparers.
+LaunchPreparation = collections.namedtuple(
+    "LaunchPreparation",
+    [
+        "tk_app",
+        "engine_name",
+        "context",
+        "app_path",
+        "app_args",
+        "file_to_open",
+        "environment",
+        "timer",
+    ],
+)
+
 
 def prepare_launch_for_engine(
-    engine_name, app_path, app_args, context, file_to_open=None
+    engine_name,
+    app_path,
+    app_args,
+    context,
+    file_to_open=None,
+    environment=None,
+    engine_launchers=None,
+    timer=None,
 ):
     """
     Prepares the environment to launch a DCC application in for the
@@ -27,11 +59,67 @@ def prepare_launch_for_engine(
     :param app_args: External app arguments
     :param context: The context that the application is being launched in
     :param file_to_open: (optional) File path to open once DCC finishes launching
+    :param environment: (optional) :class:`LaunchEnvironment` the environment
+                        changes needed by the DCC are recorded in. If None,
+                        os.environ is updated instead.
+    :param engine_launchers: (optional) Dictionary of the engine launchers already
+                             created, shared between launches. Engine launchers
+                             created for this launch are added to it.
+    :param timer: (optional) :class:`LaunchTimer` the preparation stages are
+                  timed with.
 
     :returns: Tuple (app_path, app_args) Potentially modified app_path or
               app_args value, depending on preparation requirements for
               the specific DCC.
     """
+    if timer is None:
+        timer = LaunchTimer(engine_name)
+
+    if environment is None:
+        environment = LaunchEnvironment()
+        result = _prepare_launch(
+            engine_name,
+            app_path,
+            app_args,
+            context,
+            file_to_open,
+            environment,
+            engine_launchers,
+            timer,
+        )
+        environment.export()
+        return result
+
+    return _prepare_launch(
+        engine_name,
+        app_path,
+        app_args,
+        context,
+        file_to_open,
+        environment,
+        engine_launchers,
+        timer,
+    )
+
+
+def _prepare_launch(
+    engine_name,
+    app_path,
+    app_args,
+    context,
+    file_to_open,
+    environment,
+    engine_launchers,
+    timer,
+):
+    """
+    Prepares the environment to launch a DCC application in for the
+    specified TK engine name.
+
+    See :func:`prepare_launch_for_engine` for the parameters.
+
+    :returns: Tuple (app_path, app_args).
+    """
     # Retrieve the TK Application instance from the current bundle
     tk_app = sgtk.platform.current_bundle()
 
@@ -41,15 +129,18 @@ def prepare_launch_for_engine(
         # Use the TK engine to perform the necessary preparations
         # to launch the DCC. If launcher is None, then chances are the
         # installed version of the specified engine isn't up-to-date.
-        launcher = sgtk.platform.create_engine_launcher(
-            tk_app.sgtk, context, engine_name
-        )
+        with timer.stage("create_engine_launcher"):
+            launcher = _get_engine_launcher(
+                tk_app, engine_name, context, engine_launchers
+            )
         if launcher:
             tk_app.log_debug(
                 "Created %s engine launcher : %s" % (engine_name, launcher)
             )
-            launch_info = launcher.prepare_launch(app_path, app_args, file_to_open)
-            os.environ.update(launch_info.environment)
+            # Some engine launchers update os.environ while preparing the launch.
+            with timer.stage("engine_launcher_prepare"), environment.applied():
+                launch_info = launcher.prepare_launch(app_path, app_args, file_to_open)
+            environment.update(launch_info.environment)
             tk_app.log_debug(
                 "Engine launcher prepared launch info:\n  path : %s"
                 "\n  args : %s\n  env  : %s"
@@ -75,68 +166,160 @@ def prepare_launch_for_engine(
     # we have an engine we should start as part of this app launch
     # pass down the file to open into the startup script via env var.
     if file_to_open:
-        os.environ["TANK_FILE_TO_OPEN"] = file_to_open
+        environment["TANK_FILE_TO_OPEN"] = file_to_open
         tk_app.log_debug("Setting TANK_FILE_TO_OPEN to '%s'" % file_to_open)
 
     # serialize the context into an env var
     # Do not use pickle for serialization.
-    os.environ["TANK_CONTEXT"] = context.serialize(context, use_json=True)
+    environment["TANK_CONTEXT"] = context.serialize(context, use_json=True)
     tk_app.log_debug("Setting TANK_CONTEXT to '%r'" % context)
 
     # Set environment variables used by apps to prep Tank engine
-    os.environ["TANK_ENGINE"] = engine_name
+    environment["TANK_ENGINE"] = engine_name
+
+    preparation = LaunchPreparation(
+        tk_app,
+        engine_name,
+        context,
+        app_path,
+        app_args,
+        file_to_open,
+        environment,
+        timer,
+    )
+
+    # Preparers provided by the studio take precedence over the ones of
+    # launchapp, so they can replace them or add preparers for their own
+    # engines.
+    studio_preparer = _get_studio_preparer(tk_app, engine_name)
+    if studio_preparer:
+        tk_app.log_debug("Using studio preparer for %s." % engine_name)
+        # Like engine bootstrap code, studio preparers update os.environ.
+        with _engine_bootstrap_scope(environment, timer):
+            return studio_preparer(
+                engine_name=engine_name,
+                context=context,
+                app_path=app_path,
+                app_args=app_args,
+                file_to_open=file_to_open,
+            )
 
     # Prep any application specific things now that we know we don't
     # have an engine-specific bootstrap to use.
-    if engine_name == "tk-maya":
-        _prepare_maya_launch()
-    elif engine_name == "tk-motionbuilder":
-        app_args = _prepare_motionbuilder_launch(app_args)
-    elif engine_name == "tk-3dsmax":
-        app_args = _prepare_3dsmax_launch(app_args)
-    elif engine_name == "tk-3dsmaxplus":
-        app_args = _prepare_3dsmaxplus_launch(context, app_args, app_path)
-    elif engine_name == "tk-photoshop":
-        _prepare_photoshop_launch(context)
-    elif engine_name == "tk-houdini":
-        _prepare_houdini_launch(context)
-    elif engine_name == "tk-mari":
-        _prepare_mari_launch(engine_name, context)
-    elif engine_name in ["tk-flame", "tk-flare"]:
-        app_path, app_args = _prepare_flame_flare_launch(
-            engine_name, context, app_path, app_args
-        )
-    else:
-        # This should really be the first thing we try, but some of
-        # the engines (like tk-3dsmaxplus, as an example) have bootstrapping
-        # logic that doesn't properly stand alone and still requires
-        # their "prepare" method here in launchapp to be run. As engines
-        # are updated to handle all their own bootstrapping, they can be
-        # pulled out from above and moved into the except block below in
-        # the way that tk-nuke and tk-hiero have.
-        try:
-            app_path, app_args = _prepare_generic_launch(
-                tk_app, engine_name, context, app_path, app_args
+    preparer = _ENGINE_PREPARERS.get(engine_name, _prepare_default_launch)
+    return preparer(preparation)
+
+
+def _get_studio_preparer(tk_app, engine_name):
+    """
+    Return the preparer of the given engine provided by the engine_preparers
+    hook, if any.
+
+    :param tk_app: Toolkit Application instance
+    :param engine_name: Name of the TK engine to launch
+    :returns: Callable preparing the launch or None.
+    """
+    preparers = tk_app.execute_hook_method(
+        "hook_engine_preparers", "get_engine_preparers"
+    )
+    return (preparers or {}).get(engine_name)
+
+
+def _prepare_default_launch(preparation):
+    """
+    Prepares the launch of engines without a launchapp preparer, with the
+    bootstrap of the engine.
+
+    :param preparation: :class:`LaunchPreparation` of the launch.
+    :returns: Tuple (app_path, app_args).
+    """
+    # This should really be the first thing we try, but some of
+    # the engines (like tk-3dsmaxplus, as an example) have bootstrapping
+    # logic that doesn't properly stand alone and still requires
+    # their "prepare" method here in launchapp to be run. As engines
+    # are updated to handle all their own bootstrapping, they can be
+    # pulled out of _ENGINE_PREPARERS and moved into
+    # _BOOTSTRAP_NOT_FOUND_PREPARERS in the way that tk-nuke and tk-hiero have.
+    try:
+        return _prepare_generic_launch(preparation)
+    except TankBootstrapNotFoundError:
+        # Backwards compatibility here for earlier engine versions.
+        preparer = _BOOTSTRAP_NOT_FOUND_PREPARERS.get(preparation.engine_name)
+        if preparer is None:
+            # We have neither an engine-specific nor launchapp-specific
+            # bootstrap for this engine, so we have to bail out here.
+            raise TankError(
+                "No bootstrap routine found for %s. The engine will not be started."
+                % (preparation.engine_name)
             )
-        except TankBootstrapNotFoundError:
-            # Backwards compatibility here for earlier engine versions.
-            if engine_name == "tk-nuke":
-                app_args = _prepare_nuke_launch(file_to_open, app_args)
-            elif engine_name == "tk-hiero":
-                _prepare_hiero_launch()
-            else:
-                # We have neither an engine-specific nor launchapp-specific
-                # bootstrap for this engine, so we have to bail out here.
-                raise TankError(
-                    "No bootstrap routine found for %s. The engine will not be started."
-                    % (engine_name)
-                )
-
-    # Return resolved app path and args
-    return (app_path, app_args)
+        return preparer(preparation)
+
+
+def add_engine_launcher(engine_launchers, engine_name, context, launcher):
+    """
+    Add an engine launcher created beforehand, e.g. to scan for software, to
+    the engine launchers shared between launches, so launches in the same
+    context reuse it instead of creating a new one.
+
+    An engine launcher already added for the same engine and context is kept.
+
+    :param dict engine_launchers: Dictionary of the engine launchers shared
+                                  between launches.
+    :param engine_name: Name of the TK engine of the launcher
+    :param context: The context the launcher was created for
+    :param launcher: The :class:`sgtk.platform.SoftwareLauncher` instance.
+    """
+    key = _get_engine_launcher_key(engine_name, context)
+    with _engine_launchers_lock:
+        engine_launchers.setdefault(key, launcher)
+
+
+def clear_engine_launchers(engine_launchers):
+    """
+    Remove all the engine launchers shared between launches, e.g. when
+    launch commands are registered again, so launches don't use engine
+    launchers created for engine versions which are no longer configured.
+
+    :param dict engine_launchers: Dictionary of the engine launchers shared
+                                  between launches.
+    """
+    with _engine_launchers_lock:
+        engine_launchers.clear()
+
+
+def _get_engine_launcher(tk_app, engine_name, context, engine_launchers):
+    """
+    Return the engine launcher of the given engine for the given context.
+
+    :param tk_app: Toolkit Application instance
+    :param engine_name: Name of the TK engine to launch
+    :param context: The context that the application is being launched in
+    :param engine_launchers: Dictionary of the engine launchers already created,
+                             or None to always create a new one.
+    :returns: A :class:`sgtk.platform.SoftwareLauncher` instance or None if
+              the engine does not implement one.
+    """
+    if engine_launchers is None:
+        return sgtk.platform.create_engine_launcher(tk_app.sgtk, context, engine_name)
+
+    key = _get_engine_launcher_key(engine_name, context)
+    with _engine_launchers_lock:
+        if key not in engine_launchers:
+            engine_launchers[key] = sgtk.platform.create_engine_launcher(
+                tk_app.sgtk, context, engine_name
+            )
+        return engine_launchers[key]
+
+
+def _get_engine_launcher_key(engine_name, context):
+    """
+    :returns: The key of the engine launcher of the given engine for the given
+              context in the engine launchers shared between launches.
+    """
+    return (engine_name, context.serialize(with_user_credentials=False, use_json=True))
 
 
-def _prepare_generic_launch(tk_app, engine_name, context, app_path, app_args):
+def _prepare_generic_launch(preparation):
     """
     Generic engine launcher.
 
@@ -144,18 +327,19 @@ def _prepare_generic_launch(tk_app, engine_name, context, app_path, app_args):
     python/startup/bootstrap.py file if it exists.  That bootstrap will be
     called if possible.
 
-    :param tk_app: Toolkit Application instance used for log messages
-    :param engine_name: The name of the engine being launched
-    :param context: The context that the application is being launched in
-    :param app_path: Path to DCC executable or launch script
-    :param app_args: External app arguments
+    :param preparation: :class:`LaunchPreparation` of the launch.
 
     :returns: Tuple (app_path, app_args) Potentially modified app_path or
               app_args value, depending on preparation requirements for
               the specific DCC.
+    :raises TankBootstrapNotFoundError: If the engine has no bootstrap.
     """
+    tk_app, engine_name, context, app_path, app_args = preparation[:5]
+    environment, timer = preparation.environment, preparation.timer
+    bootstrap_cache = BootstrapCache(tk_app)
+
     # find the path to the engine on disk where the startup script can be found:
-    engine_path = sgtk.platform.get_engine_path(engine_name, tk_app.sgtk, context)
+    engine_path = bootstrap_cache.get_engine_path(engine_name, context)
     if engine_path is None:
         raise TankError(
             "Could not find the path to the '%s' engine. It may not be configured "
@@ -165,60 +349,48 @@ def _prepare_generic_launch(tk_app, engine_name, context, app_path, app_args):
 
     # find bootstrap file located in the engine and load that up
     startup_path = os.path.join(engine_path, "python", "startup", "bootstrap.py")
-    if not os.path.exists(startup_path):
+    if not os.path.isfile(startup_path):
         raise TankBootstrapNotFoundError(
             "Could not find the bootstrap for the '%s' engine at '%s'"
             % (engine_name, startup_path)
         )
 
-    python_path = os.path.dirname(startup_path)
-
-    # add our bootstrap location to the pythonpath
-    sys.path.insert(0, python_path)
     try:
-        import bootstrap
-
-        extra_args = tk_app.get_setting("extra", {})
-
-        # bootstrap should take kwargs in order to protect from changes in
-        # this signature in the future.  For example:
-        # def bootstrap(engine, context, app_path, app_args, **kwargs)
-        app_path, new_args = bootstrap.bootstrap(
-            engine_name=engine_name,
-            context=context,
-            app_path=app_path,
-            app_args=app_args,
-            extra_args=extra_args,
-        )
+        with _engine_bootstrap_scope(environment, timer), bootstrap_cache.loaded_module(
+            os.path.dirname(startup_path), "bootstrap"
+        ) as bootstrap:
+            extra_args = tk_app.get_setting("extra", {})
+
+            # bootstrap should take kwargs in order to protect from changes in
+            # this signature in the future.  For example:
+            # def bootstrap(engine, context, app_path, app_args, **kwargs)
+            app_path, new_args = bootstrap.bootstrap(
+                engine_name=engine_name,
+                context=context,
+                app_path=app_path,
+                app_args=app_args,
+                extra_args=extra_args,
+            )
     except Exception:
         tk_app.log_exception("Error executing engine bootstrap script.")
         raise TankError("Error executing bootstrap script. Please see log for details.")
-    finally:
-        # Remove bootstrap from sys.path
-        sys.path.pop(0)
-
-        # We also need to unload the bootstrap module so that any
-        # subsequent launches that import a different bootstrap
-        # will succeed.
-        if "bootstrap" in sys.modules:
-            tk_app.log_debug("Removing 'bootstrap' from sys.modules.")
-            del sys.modules["bootstrap"]
 
     return (app_path, new_args)
 
 
-def _prepare_nuke_launch(file_to_open, app_args):
+def _prepare_nuke_launch(preparation):
     """
     Nuke specific pre-launch environment setup.
 
-    :param file_to_open: File name to open when Nuke is launched.
-    :param app_args: External app arguments
+    :param preparation: :class:`LaunchPreparation` of the launch.
 
-    :returns: (string) Command line arguments to launch DCC with.
+    :returns: Tuple (app_path, app_args).
     """
+    file_to_open, app_args = preparation.file_to_open, preparation.app_args
+
     # Make sure Nuke can find the Tank menu
     startup_path = _get_app_startup_path("nuke")
-    sgtk.util.append_path_to_env_var("NUKE_PATH", startup_path)
+    preparation.environment.append_path("NUKE_PATH", startup_path)
 
     # it's not possible to open a nuke script from within the initialization
     # scripts so if we have a path then we need to pass it through the start
@@ -229,34 +401,45 @@ def _prepare_nuke_launch(file_to_open, app_args):
         else:
             app_args = file_to_open
 
-    return app_args
+    return (preparation.app_path, app_args)
 
 
-def _prepare_hiero_launch():
+def _prepare_hiero_launch(preparation):
     """
     Hiero specific pre-launch environment setup.
+
+    :param preparation: :class:`LaunchPreparation` of the launch.
+
+    :returns: Tuple (app_path, app_args).
     """
     startup_path = _get_app_startup_path("hiero")
-    sgtk.util.append_path_to_env_var("HIERO_PLUGIN_PATH", startup_path)
+    preparation.environment.append_path("HIERO_PLUGIN_PATH", startup_path)
+    return (preparation.app_path, preparation.app_args)
 
 
-def _prepare_maya_launch():
+def _prepare_maya_launch(preparation):
     """
     Maya specific pre-launch environment setup.
+
+    :param preparation: :class:`LaunchPreparation` of the launch.
+
+    :returns: Tuple (app_path, app_args).
     """
     # Make sure Maya can find the Tank menu
     startup_path = _get_app_startup_path("maya")
-    sgtk.util.append_path_to_env_var("PYTHONPATH", startup_path)
+    preparation.environment.append_path("PYTHONPATH", startup_path)
+    return (preparation.app_path, preparation.app_args)
 
 
-def _prepare_motionbuilder_launch(app_args):
+def _prepare_motionbuilder_launch(preparation):
     """
     Motionbuilder specific pre-launch environment setup.
 
-    :param app_args: External app arguments
+    :param preparation: :class:`LaunchPreparation` of the launch.
 
-    :returns: (string) Command line arguments to launch DCC with.
+    :returns: Tuple (app_path, app_args).
     """
+    app_args = preparation.app_args
     new_args = '"%s"' % os.path.join(
         _get_app_specific_path("motionbuilder"), "startup", "init_tank.py"
     )
@@ -265,48 +448,50 @@ def _prepare_motionbuilder_launch(app_args):
     else:
         app_args = new_args
 
-    return app_args
+    return (preparation.app_path, app_args)
 
 
-def _prepare_3dsmax_launch(app_args):
+def _prepare_3dsmax_launch(preparation):
     """
     3DSMax specific pre-launch environment setup.
 
     Make sure launch args include a maxscript to load the python engine:
     3dsmax.exe somefile.max -U MAXScript somescript.ms
 
-    :param app_args: External app arguments
+    :param preparation: :class:`LaunchPreparation` of the launch.
 
-    :returns: (string) Command line arguments to launch DCC with.
+    :returns: Tuple (app_path, app_args).
     """
+    app_args = preparation.app_args
     startup_dir = _get_app_startup_path("3dsmax")
-    os.environ["TANK_BOOTSTRAP_SCRIPT"] = os.path.join(startup_dir, "tank_startup.py")
+    preparation.environment["TANK_BOOTSTRAP_SCRIPT"] = os.path.join(
+        startup_dir, "tank_startup.py"
+    )
     new_args = '-U MAXScript "%s"' % os.path.join(startup_dir, "init_tank.ms")
     if app_args:
         app_args = "%s %s" % (new_args, app_args)
     else:
         app_args = new_args
 
-    return app_args
+    return (preparation.app_path, app_args)
 
 
-def _prepare_3dsmaxplus_launch(context, app_args, app_path):
+def _prepare_3dsmaxplus_launch(preparation):
     """
     3DSMax Plus specific pre-launch environment setup.
 
     Make sure launch args include a bootstrap to load the python engine:
     3dsmax.exe somefile.max -U PythonHost somescript.py
 
-    :param context: The context that the application is being launched in
-    :param app_args: External app arguments
-    :param app_path: Path to DCC executable or launch script
+    :param preparation: :class:`LaunchPreparation` of the launch.
 
-    :returns: (string) Command line arguments to launch DCC with.
+    :returns: Tuple (app_path, app_args).
     """
-    # Retrieve the TK Application instance from the current bundle
-    tk_app = sgtk.platform.current_bundle()
+    app_path, app_args = preparation.app_path, preparation.app_args
 
-    engine_path = sgtk.platform.get_engine_path("tk-3dsmaxplus", tk_app.sgtk, context)
+    engine_path = BootstrapCache(preparation.tk_app).get_engine_path(
+        "tk-3dsmaxplus", preparation.context
+    )
     if engine_path is None:
         raise TankError("Path to 3dsmaxplus engine (tk-3dsmaxplus) could not be found.")
 
@@ -316,7 +501,7 @@ def _prepare_3dsmaxplus_launch(context, app_args, app_path):
     # up with dlls loaded from Flow Production Tracking's bin and we have a mismatch that
     # results in complete breakage.
     max_root = os.path.dirname(app_path)
-    sgtk.util.prepend_path_to_env_var("PATH", max_root)
+    preparation.environment.prepend_path("PATH", max_root)
 
     startup_file = os.path.abspath(
         os.path.join(engine_path, "python", "startup", "bootstrap.py")
@@ -327,69 +512,71 @@ def _prepare_3dsmaxplus_launch(context, app_args, app_path):
     else:
         app_args = new_args
 
-    return app_args
+    return (app_path, app_args)
 
 
-def _prepare_houdini_launch(context):
+def _prepare_houdini_launch(preparation):
     """
     Houdini specific pre-launch environment setup.
 
-    :param context: The context that the application is being launched in
+    :param preparation: :class:`LaunchPreparation` of the launch.
+
+    :returns: Tuple (app_path, app_args).
     """
-    # Retrieve the TK Application instance from the current bundle
-    tk_app = sgtk.platform.current_bundle()
+    tk_app, context = preparation.tk_app, preparation.context
 
-    engine_path = sgtk.platform.get_engine_path("tk-houdini", tk_app.sgtk, context)
+    engine_path = BootstrapCache(tk_app).get_engine_path("tk-houdini", context)
     if engine_path is None:
         raise TankError("Path to houdini engine (tk-houdini) could not be found.")
 
     # let the houdini engine take care of initializing itself
-    sys.path.append(os.path.join(engine_path, "python"))
     try:
-        import tk_houdini
-
-        tk_houdini.bootstrap.bootstrap(tk_app.sgtk, context)
+        with _engine_bootstrap_scope(
+            preparation.environment, preparation.timer
+        ), BootstrapCache(tk_app).loaded_module(
+            os.path.join(engine_path, "python"), "tk_houdini"
+        ) as tk_houdini:
+            tk_houdini.bootstrap.bootstrap(tk_app.sgtk, context)
     except:
         tk_app.log_exception("Error executing engine bootstrap script.")
         raise TankError("Error executing bootstrap script. Please see log for details.")
 
+    return (preparation.app_path, preparation.app_args)
+
 
-def _prepare_flame_flare_launch(engine_name, context, app_path, app_args):
+def _prepare_flame_flare_launch(preparation):
     """
     Flame specific pre-launch environment setup.
 
-    :param engine_name: The name of the engine being launched (tk-flame or tk-flare)
-    :param context: The context that the application is being launched in
-    :param app_path: Path to DCC executable or launch script
-    :param app_args: External app arguments
+    :param preparation: :class:`LaunchPreparation` of the launch of tk-flame
+                        or tk-flare.
 
     :returns: Tuple (app_path, app_args) Potentially modified app_path or
               app_args value, depending on preparation requirements for
               flame.
     """
-    # Retrieve the TK Application instance from the current bundle
-    tk_app = sgtk.platform.current_bundle()
+    tk_app, engine_name, context, app_path, app_args = preparation[:5]
+    environment, timer = preparation.environment, preparation.timer
+
+    bootstrap_cache = BootstrapCache(tk_app)
 
     # find the path to the engine on disk where the startup script can be found:
-    engine_path = sgtk.platform.get_engine_path(engine_name, tk_app.sgtk, context)
+    engine_path = bootstrap_cache.get_engine_path(engine_name, context)
     if engine_path is None:
         raise TankError("Path to '%s' engine could not be found." % engine_name)
 
     # find bootstrap file located in the engine and load that up
     startup_path = os.path.join(engine_path, "python", "startup", "bootstrap.py")
-    if not os.path.exists(startup_path):
+    if not os.path.isfile(startup_path):
         raise Exception("Cannot find bootstrap script '%s'" % startup_path)
 
-    python_path = os.path.dirname(startup_path)
-
-    # add our bootstrap location to the pythonpath
-    sys.path.insert(0, python_path)
     try:
-        import bootstrap
-
-        app_path, new_args = bootstrap.bootstrap(
-            engine_name, context, app_path, app_args
-        )
+        with _engine_bootstrap_scope(environment, timer), bootstrap_cache.loaded_module(
+            os.path.dirname(startup_path), "bootstrap"
+        ) as bootstrap:
+            app_path, new_args = bootstrap.bootstrap(
+                engine_name, context, app_path, app_args
+            )
 
     except Exception as e:
         tk_app.log_exception("Error executing engine bootstrap script.")
@@ -400,62 +587,67 @@ def _prepare_flame_flare_launch(engine_name, context, app_path, app_args):
             not_found_dialog.show_generic_error_dialog(tk_app, str(e))
 
         raise TankError("Error executing bootstrap script. Please see log for details.")
-    finally:
-        # remove bootstrap from sys.path
-        sys.path.pop(0)
 
     return (app_path, new_args)
 
 
-def _prepare_mari_launch(engine_name, context):
+def _prepare_mari_launch(preparation):
     """
     Mari specific pre-launch environment setup.
 
-    :param engine_name: The name of the Mari engine being launched
-    :param context:     The context that the application is being launched in
+    :param preparation: :class:`LaunchPreparation` of the launch.
+
+    :returns: Tuple (app_path, app_args).
     """
-    # Retrieve the TK Application instance from the current bundle
-    tk_app = sgtk.platform.current_bundle()
+    engine_name = preparation.engine_name
 
     # find the path to the engine on disk where the startup script
     # can be found:
-    engine_path = sgtk.platform.get_engine_path(engine_name, tk_app.sgtk, context)
+    engine_path = BootstrapCache(preparation.tk_app).get_engine_path(
+        engine_name, preparation.context
+    )
     if engine_path is None:
         raise TankError("Path to '%s' engine could not be found." % engine_name)
 
     # add the location of our init.py script to the MARI_SCRIPT_PATH
     startup_folder = os.path.join(engine_path, "startup")
-    sgtk.util.append_path_to_env_var("MARI_SCRIPT_PATH", startup_folder)
+    preparation.environment.append_path("MARI_SCRIPT_PATH", startup_folder)
+    return (preparation.app_path, preparation.app_args)
 
 
-def _prepare_photoshop_launch(context):
+def _prepare_photoshop_launch(preparation):
     """
     Photoshop specific pre-launch environment setup.
 
-    :param context: The context that the application is being launched in
+    :param preparation: :class:`LaunchPreparation` of the launch.
+
+    :returns: Tuple (app_path, app_args).
     """
-    # Retrieve the TK Application instance from the current bundle
-    tk_app = sgtk.platform.current_bundle()
+    tk_app, context = preparation.tk_app, preparation.context
+    environment, timer = preparation.environment, preparation.timer
 
-    engine_path = sgtk.platform.get_engine_path("tk-photoshop", tk_app.sgtk, context)
+    bootstrap_cache = BootstrapCache(tk_app)
+    engine_path = bootstrap_cache.get_engine_path("tk-photoshop", context)
     if engine_path is None:
         raise TankError("Path to photoshop engine (tk-photoshop) could not be found.")
 
     # if the photoshop engine has the bootstrap logic with it, run it from there
     startup_path = os.path.join(engine_path, "bootstrap")
     env_setup = os.path.join(startup_path, "photoshop_environment_setup.py")
-    if os.path.exists(env_setup):
-        sys.path.append(startup_path)
+    if os.path.isfile(env_setup):
         try:
-            import photoshop_environment_setup
-
-            photoshop_environment_setup.setup(tk_app, context)
+            with _engine_bootstrap_scope(
+                environment, timer
+            ), bootstrap_cache.loaded_module(
+                startup_path, "photoshop_environment_setup"
+            ) as photoshop_environment_setup:
+                photoshop_environment_setup.setup(tk_app, context)
         except:
             tk_app.log_exception("Error executing engine bootstrap script.")
             raise TankError(
                 "Error executing bootstrap script. Please see log for details."
             )
-        return
+        return (preparation.app_path, preparation.app_args)
 
     # no bootstrap logic with the engine, run the legacy version
     extra_configs = tk_app.get_setting("extra", {})
@@ -483,14 +675,14 @@ def _prepare_photoshop_launch(context):
             "Your photoshop app launch config is missing the extra setting %s!"
             % (manager_setting)
         )
-    os.environ["TANK_PHOTOSHOP_EXTENSION_MANAGER"] = manager_path
+    environment["TANK_PHOTOSHOP_EXTENSION_MANAGER"] = manager_path
 
     # make sure the extension is up to date
-    sys.path.append(os.path.join(engine_path, "bootstrap"))
     try:
-        import photoshop_extension_manager
-
-        photoshop_extension_manager.update()
+        with _engine_bootstrap_scope(environment, timer), bootstrap_cache.loaded_module(
+            startup_path, "photoshop_extension_manager"
+        ) as photoshop_extension_manager:
+            photoshop_extension_manager.update()
     except Exception as e:
         raise TankError(
             "Could not run the Adobe Extension Manager. Please double check your "
@@ -498,18 +690,59 @@ def _prepare_photoshop_launch(context):
         )
 
     # Store data needed for bootstrapping Tank in env vars. Used in startup/menu.py
-    os.environ["TANK_PHOTOSHOP_PYTHON"] = python_path
-    os.environ["TANK_PHOTOSHOP_BOOTSTRAP"] = os.path.join(
+    environment["TANK_PHOTOSHOP_PYTHON"] = python_path
+    environment["TANK_PHOTOSHOP_BOOTSTRAP"] = os.path.join(
         engine_path, "bootstrap", "engine_bootstrap.py"
     )
 
     # unused values, but the photoshop engine code still looks for these...
-    os.environ["TANK_PHOTOSHOP_ENGINE"] = "dummy_value"
-    os.environ["TANK_PHOTOSHOP_PROJECT_ROOT"] = "dummy_value"
+    environment["TANK_PHOTOSHOP_ENGINE"] = "dummy_value"
+    environment["TANK_PHOTOSHOP_PROJECT_ROOT"] = "dummy_value"
 
     # add our startup path to the photoshop init path
     startup_path = _get_app_startup_path("photoshop")
-    sgtk.util.append_path_to_env_var("PYTHONPATH", startup_path)
+    environment.append_path("PYTHONPATH", startup_path)
+    return (preparation.app_path, preparation.app_args)
+
+
+# Preparers of the engines which still need launchapp to prepare their launch,
+# keyed by engine name. Other engines are prepared with their own bootstrap.
+_ENGINE_PREPARERS = {
+    "tk-maya": _prepare_maya_launch,
+    "tk-motionbuilder": _prepare_motionbuilder_launch,
+    "tk-3dsmax": _prepare_3dsmax_launch,
+    "tk-3dsmaxplus": _prepare_3dsmaxplus_launch,
+    "tk-photoshop": _prepare_photoshop_launch,
+    "tk-houdini": _prepare_houdini_launch,
+    "tk-mari": _prepare_mari_launch,
+    "tk-flame": _prepare_flame_flare_launch,
+    "tk-flare": _prepare_flame_flare_launch,
+}
+
+# Preparers of earlier versions of engines which didn't have a bootstrap yet,
+# keyed by engine name.
+_BOOTSTRAP_NOT_FOUND_PREPARERS = {
+    "tk-nuke": _prepare_nuke_launch,
+    "tk-hiero": _prepare_hiero_launch,
+}
+
+
+@contextlib.contextmanager
+def _engine_bootstrap_scope(environment, timer):
+    """
+    Context manager to load and run engine bootstrap code, which reads and
+    writes os.environ directly.
+
+    The launch environment is applied to os.environ for the duration of the
+    context, which is timed as the engine_bootstrap stage of the launch.
+    Bootstrap modules are loaded with :meth:`BootstrapCache.loaded_module`
+    under the same lock.
+
+    :param environment: :class:`LaunchEnvironment` of the launch.
+    :param timer: :class:`LaunchTimer` of the launch.
+    """
+    with timer.stage("engine_bootstrap"), environment.applied():
+        yield
 
 
 def _get_app_specific_path(app_dir):
@@ -0,0 +1,227 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import os
+import re
+import threading
+
+import sgtk
+
+
+class RegistrationCache(object):
+    """
+    Memo of the decisions taken when registering launch commands for the
+    software found by automatic Software entities.
+
+    The engine instance name returned by the before_register_command hook for
+    a given software version, and whether an engine instance exists in the
+    environment, are remembered for the lifetime of the process. They are
+    shared by all the Software entities and by the app instances of later
+    engine restarts. Decisions are keyed by a fingerprint of the pipeline
+    configuration, environment, context and hook, and of the environment and
+    hook files, so editing the environment or the hook invalidates them.
+    """
+
+    # Decisions keyed by (fingerprint, kind, ...) tuples. Shared by all the
+    # app instances.
+    _decisions = {}
+    _lock = threading.Lock()
+
+    def __init__(self, tk_app, enabled=False):
+        """
+        :param tk_app: The TK Application instance owning the cache.
+        :param bool enabled: Whether decisions are remembered.
+        """
+        self._tk_app = tk_app
+        self._enabled = enabled
+        self._fingerprint = (
+            self._get_environment_fingerprint() if self._enabled else None
+        )
+
+    @classmethod
+    def clear(cls):
+        """
+        Forget all the remembered decisions.
+        """
+        with cls._lock:
+            cls._decisions.clear()
+
+    def determine_engine_instance_name(self, software_version, engine_instance_name):
+        """
+        Return the engine instance to launch the given software version with,
+        as returned by the before_register_command hook.
+
+        :param software_version: The :class:`SoftwareVersion` to register.
+        :param str engine_instance_name: Engine instance of the Software entity.
+        :returns: Name of the engine instance to launch with.
+        """
+        key = (
+            "engine_instance_name",
+            engine_instance_name,
+            software_version.product,
+            software_version.version,
+            software_version.path,
+            software_version.display_name,
+            tuple(software_version.args or []),
+        )
+        return self._get(
+            key,
+            lambda: self._tk_app.execute_hook_method(
+                "hook_before_register_command",
+                "determine_engine_instance_name",
+                software_version=software_version,
+                engine_instance_name=engine_instance_name,
+            ),
+        )
+
+    def engine_instance_exists(self, engine_instance_name):
+        """
+        Tells if the given engine instance exists in the environment for the
+        current context.
+
+        :param str engine_instance_name: Name of the engine instance.
+        :returns: True if the engine instance exists.
+        """
+        return self._get(
+            ("engine_instance_exists", engine_instance_name),
+            lambda: self._check_engine_instance(engine_instance_name),
+        )
+
+    def _check_engine_instance(self, engine_instance_name):
+        """
+        :returns: True if the given engine instance exists.
+        """
+        try:
+            # We don't need the returned env and descriptor. We only
+            # care whether it raises or not.
+            sgtk.platform.engine.get_env_and_descriptor_for_engine(
+                engine_instance_name, self._tk_app.sgtk, self._tk_app.context
+            )
+        except sgtk.platform.TankMissingEngineError:
+            return False
+        return True
+
+    def _get(self, key, compute):
+        """
+        Return the remembered decision for the given key, computing and
+        remembering it if needed.
+
+        :param tuple key: Key of the decision.
+        :param compute: Callable returning the decision.
+        :returns: The decision.
+        """
+        if not self._enabled:
+            return compute()
+
+        key = (self._fingerprint,) + key
+        with self._lock:
+            if key in self._decisions:
+                return self._decisions[key]
+
+        # Computed without holding the lock, hooks may be slow. Concurrent
+        # registrations may compute the same decision twice, which is harmless.
+        decision = compute()
+        with self._lock:
+            self._decisions[key] = decision
+        return decision
+
+    def _get_environment_fingerprint(self):
+        """
+        Compute a fingerprint of the pipeline configuration, environment,
+        context and before_register_command hook the decisions are taken for,
+        and of the environment and hook files.
+
+        :returns: Hexadecimal digest changing when any of the environment or
+                  hook files, or the configuration, environment, context or
+                  hook, change.
+        """
+        environment = self._tk_app.engine.environment
+        signature = hashlib.sha1(
+            repr(
+                (
+                    self._tk_app.sgtk.pipeline_configuration.get_path(),
+                    environment["name"],
+                    self._tk_app.context.serialize(
+                        with_user_credentials=False, use_json=True
+                    ),
+                    self._tk_app.get_setting("hook_before_register_command"),
+                )
+            ).encode("utf-8")
+        )
+
+        env_location = os.path.dirname(environment["disk_location"])
+        for root, dirs, files in os.walk(env_location):
+            dirs.sort()
+            for file_name in sorted(files):
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                signature.update(
+                    repr((path, stat.st_mtime_ns, stat.st_size)).encode("utf-8")
+                )
+
+        for path in self._get_hook_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # A hook file which doesn't exist may be created later.
+                signature.update(repr((path, None)).encode("utf-8"))
+                continue
+            signature.update(
+                repr((path, stat.st_mtime_ns, stat.st_size)).encode("utf-8")
+            )
+        return signature.hexdigest()
+
+    def _get_hook_paths(self):
+        """
+        Resolve the paths to the files of the before_register_command hook,
+        including the hooks it derives from.
+
+        Only the {self}, {config}, {engine}, {engine_name} and {$ENV_VAR}
+        tokens of hook expressions are resolved. Hooks from frameworks are left
+        out.
+
+        :returns: List of paths, which may not exist.
+        """
+        hook_name = "before_register_command"
+        app_hooks = os.path.join(self._tk_app.disk_location, "hooks")
+        config_hooks = self._tk_app.sgtk.pipeline_configuration.get_hooks_location()
+        engine = self._tk_app.engine
+        tokens = {
+            "{self}": app_hooks,
+            "{config}": config_hooks,
+            "{engine}": os.path.join(engine.disk_location, "hooks"),
+            "{engine_name}": engine.name,
+        }
+
+        paths = []
+        expression = self._tk_app.get_setting("hook_%s" % hook_name) or "default"
+        for hook_path in expression.split(":"):
+            if hook_path == "default":
+                paths.append(os.path.join(app_hooks, "%s.py" % hook_name))
+            elif "{" not in hook_path:
+                # Legacy hook names are looked up in the configuration, then
+                # in the app.
+                paths.append(os.path.join(config_hooks, "%s.py" % hook_path))
+                paths.append(os.path.join(app_hooks, "%s.py" % hook_path))
+            elif not re.search(r"\{tk-framework-", hook_path):
+                for token, value in tokens.items():
+                    hook_path = hook_path.replace(token, value)
+                paths.append(
+                    re.sub(
+                        r"\{\$(\w+)\}",
+                        lambda match: os.environ.get(match.group(1), ""),
+                        hook_path,
+                    )
+                )
+        return paths
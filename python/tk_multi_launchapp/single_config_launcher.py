@@ -28,8 +28,8 @@ class SingleConfigLauncher(BaseLauncher):
         BaseLauncher.__init__(self)
 
         # Store required information to launch the app as members.
-        self._app_path = self._tk_app.get_setting("%s_path" % self._platform_name, "")
-        self._app_args = self._tk_app.get_setting("%s_args" % self._platform_name, "")
+        self._app_path = self._tk_app.get_setting(self._config.app_path_field, "")
+        self._app_args = self._tk_app.get_setting(self._config.app_args_field, "")
         self._app_menu_name = self._tk_app.get_setting("menu_name")
         self._app_engine = self._tk_app.get_setting("engine")
         self._app_group = self._tk_app.get_setting("group")
@@ -41,6 +41,10 @@ class SingleConfigLauncher(BaseLauncher):
         Multiple commands may be registered based on the 'versions' configuration
         setting.
         """
+        # Engines and environments may have been updated since the commands
+        # were last registered.
+        self._reset_launch_caches()
+
         if not self._app_path:
             # no application path defined for this os. So don't register a menu item!
             return
@@ -49,9 +53,12 @@ class SingleConfigLauncher(BaseLauncher):
         app_icon = self._tk_app.get_setting("icon")
         if app_icon.startswith("{target_engine}"):
             if self._app_engine:
-                engine_path = sgtk.platform.get_engine_path(
-                    self._app_engine, self._tk_app.sgtk, self._tk_app.context
-                )
+                with self._registration_timer.stage(
+                    "get_engine_path", engine_instance=self._app_engine
+                ):
+                    engine_path = sgtk.platform.get_engine_path(
+                        self._app_engine, self._tk_app.sgtk, self._tk_app.context
+                    )
                 if engine_path:
                     app_icon = app_icon.replace("{target_engine}", engine_path, 1)
                 else:
@@ -93,32 +100,38 @@ class SingleConfigLauncher(BaseLauncher):
             )
 
             for i, version in enumerate(app_versions):
+                with self._registration_timer.stage(
+                    "register_command", version=version
+                ):
+                    self._register_launch_command(
+                        self._app_menu_name,
+                        app_icon,
+                        self._app_engine,
+                        self._app_path,
+                        self._app_args,
+                        version,
+                        self._app_group,
+                        (i == 0),  # First version is group_default
+                        # We don't pass in a software entity id, since app is coming
+                        # from the configuration.
+                    )
+        else:
+            # No replacements defined, just register with the raw values
+            with self._registration_timer.stage("register_command"):
                 self._register_launch_command(
                     self._app_menu_name,
                     app_icon,
                     self._app_engine,
                     self._app_path,
                     self._app_args,
-                    version,
+                    None,
                     self._app_group,
-                    (i == 0),  # First version is group_default
+                    self._is_group_default,
                     # We don't pass in a software entity id, since app is coming from
                     # the configuration.
                 )
-        else:
-            # No replacements defined, just register with the raw values
-            self._register_launch_command(
-                self._app_menu_name,
-                app_icon,
-                self._app_engine,
-                self._app_path,
-                self._app_args,
-                None,
-                self._app_group,
-                self._is_group_default,
-                # We don't pass in a software entity id, since app is coming from
-                # the configuration.
-            )
+
+        self._log_registration_report()
 
     def launch_from_path(self, path, version=None):
         """
@@ -167,3 +180,24 @@ class SingleConfigLauncher(BaseLauncher):
                 version=version,
                 file_to_open=path,
             )
+
+    def launch_batch(self, items, max_workers=None):
+        """
+        Entry point if you want to launch the app for many paths at once, for
+        example to open files in headless DCC sessions. Launches are run in a
+        pool of threads and failures are returned rather than reported.
+
+        :param list items: List of (path, context, version) tuples. If the
+                           context is None, it is derived from the path.
+        :param int max_workers: (Optional) Maximum number of launches run at
+                                the same time.
+        :returns: List of results, one per item in the same order.
+        """
+        return self._launch_batch(
+            self._app_menu_name,
+            self._app_engine,
+            self._app_path,
+            self._app_args,
+            items,
+            max_workers,
+        )
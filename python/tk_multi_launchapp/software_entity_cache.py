@@ -0,0 +1,160 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import os
+import time
+
+from .util import load_cache_file, save_cache_file
+
+
+class SoftwareEntityCache(object):
+    """
+    On-disk cache of the Software entities returned by a Flow Production
+    Tracking query.
+
+    One cache file is stored per site and per set of query filters and
+    fields. Since the filters embed the current project and user, this
+    effectively gives a cache per site, project and user.
+
+    Each cache file holds the time it was written, a summary of the
+    matching Software entities (used to revalidate the cache without
+    fetching all the entities again) and the entities themselves.
+    """
+
+    # Bump this if the layout of the cached data changes.
+    CACHE_VERSION = 1
+
+    def __init__(self, tk_app, filters, fields):
+        """
+        :param tk_app: The TK Application instance owning the cache.
+        :param list filters: Filters used to query the Software entities.
+        :param list fields: Fields requested for the Software entities.
+        """
+        self._tk_app = tk_app
+
+        key = repr(
+            (
+                self.CACHE_VERSION,
+                tk_app.shotgun.base_url,
+                filters,
+                sorted(fields),
+            )
+        )
+        file_name = "%s.pickle" % hashlib.sha1(key.encode("utf-8")).hexdigest()
+        self._path = os.path.join(
+            tk_app.site_cache_location, "software_entities", file_name
+        )
+
+    @property
+    def path(self):
+        """
+        Path to the cache file on disk.
+        """
+        return self._path
+
+    def load(self):
+        """
+        Load the cached data from disk.
+
+        :returns: A :class:`CachedSoftwareEntities` instance or None if
+                  there is no usable cache on disk.
+        """
+        if not os.path.exists(self._path):
+            return None
+
+        try:
+            data = load_cache_file(self._path)
+            if data.get("version") != self.CACHE_VERSION:
+                return None
+            return CachedSoftwareEntities(
+                data["timestamp"], data["summary"], data["entities"]
+            )
+        except Exception:
+            self._tk_app.logger.debug(
+                "Unable to read Software entity cache %s, ignoring it.",
+                self._path,
+                exc_info=True,
+            )
+            return None
+
+    def save(self, entities, summary):
+        """
+        Write the given Software entities to disk.
+
+        :param list entities: Software entity dictionaries to cache.
+        :param summary: Summary of the matching Software entities, as
+                        returned by :meth:`summarize`. Can be None.
+        """
+        data = {
+            "version": self.CACHE_VERSION,
+            "timestamp": time.time(),
+            "summary": summary,
+            "entities": entities,
+        }
+        save_cache_file(self._path, data)
+
+    def touch(self, cached):
+        """
+        Mark previously loaded cached data as fresh again. This is used
+        after the cache was successfully revalidated.
+
+        :param cached: A :class:`CachedSoftwareEntities` instance.
+        """
+        self.save(cached.entities, cached.summary)
+
+    @staticmethod
+    def summarize(shotgun, filters):
+        """
+        Summarize the Software entities matching the given filters.
+
+        The summary holds the most recent ``updated_at`` value and the number
+        of matching entities, which is enough to detect added, removed or
+        modified Software entities without fetching all of them.
+
+        :param shotgun: Shotgun API connection to use.
+        :param list filters: Filters used to query the Software entities.
+        :returns: A dictionary or None if the summary could not be retrieved.
+        """
+        try:
+            result = shotgun.summarize(
+                "Software",
+                filters,
+                [
+                    {"field": "updated_at", "type": "maximum"},
+                    {"field": "id", "type": "count"},
+                ],
+            )
+            return result["summaries"]
+        except Exception:
+            return None
+
+
+class CachedSoftwareEntities(object):
+    """
+    Software entities loaded from a :class:`SoftwareEntityCache`.
+    """
+
+    def __init__(self, timestamp, summary, entities):
+        """
+        :param float timestamp: Time at which the data was cached.
+        :param summary: Summary of the cached Software entities.
+        :param list entities: Cached Software entity dictionaries.
+        """
+        self.timestamp = timestamp
+        self.summary = summary
+        self.entities = entities
+
+    @property
+    def age(self):
+        """
+        Number of seconds since the data was cached.
+        """
+        return time.time() - self.timestamp
@@ -7,13 +7,22 @@
 # By accessing, using, copying or modifying this work you indicate your
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
+import concurrent.futures
 import os
 import pprint
+import threading
+import time
 import traceback
 
 import sgtk
 
 from .base_launcher import BaseLauncher
+from .launch_timing import RegistrationTimer, log_registration_report
+from .prepare_apps import add_engine_launcher
+from .registration_cache import RegistrationCache
+from .software_entity_cache import SoftwareEntityCache
+from .software_scan_cache import SoftwareScanCache
+from .thumbnail_cache import ThumbnailCache
 
 
 class SoftwareEntityLauncher(BaseLauncher):
@@ -57,118 +66,437 @@ class SoftwareEntityLauncher(BaseLauncher):
 
     """
 
+    # Seconds registration waits in total for missing thumbnails to download
+    # before registering their commands with the default icon.
+    THUMBNAIL_TIMEOUT = 2.0
+
+    def __init__(self):
+        """
+        Initialize base class and member values
+        """
+        BaseLauncher.__init__(self)
+
+        # Remembers the before_register_command hook results and engine
+        # instance checks across Software entities and engine restarts.
+        self._registration_cache = RegistrationCache(
+            self._tk_app, self._tk_app.get_setting("cache_before_register_command")
+        )
+
+        # Signatures of the installed engines keying the software scan cache,
+        # computed once per registration, keyed by engine instance name.
+        self._engine_signatures = {}
+
+    def _reset_launch_caches(self):
+        """
+        Forget the engine signatures of the software scan cache, on top of
+        the caches of :meth:`BaseLauncher._reset_launch_caches`.
+        """
+        BaseLauncher._reset_launch_caches(self)
+        self._engine_signatures.clear()
+
+    def _get_engine_signature(self, engine_name):
+        """
+        Return the signature of the installed version of the given engine,
+        see :meth:`SoftwareScanCache.get_engine_signature`.
+
+        :param str engine_name: Name of the engine instance.
+        :returns: Tuple (engine path, startup module modification time).
+        """
+        signature = self._engine_signatures.get(engine_name)
+        if signature is None:
+            signature = SoftwareScanCache.get_engine_signature(
+                self._tk_app, engine_name
+            )
+            self._engine_signatures[engine_name] = signature
+        return signature
+
     def register_launch_commands(self):
         """
         Determine what launch command(s) to register with the current TK engine.
         Multiple commands may be registered based on the number of retrieved
         Software entities and their corresponding 'versions' field.
         """
+        timer = self._registration_timer
+
+        # Engines and environments may have been updated since the commands
+        # were last registered.
+        self._reset_launch_caches()
+
         # Retrieve the Software entities from PTR and record how many were found.
-        sw_entities = self._get_sg_software_entities()
+        with timer.stage("get_software_entities"):
+            sw_entities = self._get_sg_software_entities()
+
+        # Scan for the software of all the automatic mode Software entities
+        # up front and in parallel. Commands are still registered below in the
+        # order the Software entities were retrieved in.
+        scanned_software = self._scan_for_all_software(sw_entities, timer)
+
+        # Download the missing thumbnails of the manual mode Software entities
+        # up front and in parallel. Engines may read the command icons as soon
+        # as the commands are registered, so each thumbnail is waited for before
+        # its commands are registered, with a bounded timeout.
+        thumbnail_cache = ThumbnailCache(self._tk_app)
+        thumbnail_downloads = self._download_thumbnails(
+            sw_entities, thumbnail_cache, timer
+        )
+        thumbnail_deadline = time.time() + self.THUMBNAIL_TIMEOUT
 
         for sw_entity in sw_entities:
 
-            self._tk_app.log_debug("-" * 20)
+            with timer.stage(
+                "register_software_entity",
+                entity=RegistrationTimer.get_entity_label(sw_entity),
+                code=sw_entity["code"],
+            ):
+                self._tk_app.log_debug("-" * 20)
+                self._tk_app.log_debug(
+                    "Parsing Software entity for launch commands:\n%s"
+                    % pprint.pformat(sw_entity, indent=4)
+                )
+
+                # Parse the Software `versions` and `products` fields to determine the
+                # specific list of versions and product variations to load.
+                dcc_versions, dcc_products = self._get_versions_and_products(sw_entity)
+
+                # get the group settings
+                app_group = sw_entity["group_name"]
+                is_group_default = sw_entity["group_default"]
+
+                # get associated engine (can be none)
+                engine_str = sw_entity["engine"]
+
+                # get description, fall back to None
+                description = (
+                    sw_entity["description"] if sw_entity["description"] else None
+                )
+
+                # The app path and args field names for the current platform
+                app_path_field = self._config.app_path_field
+                app_args_field = self._config.app_args_field
+
+                # determine if we are in 'automatic' mode or manual
+                if self._is_automatic_software_entity(sw_entity):
+
+                    # all paths are none - we are in automatic mode
+                    self._tk_app.log_debug("All path fields are None. Automatic mode.")
+
+                    # make sure we have an engine defined when running in automatic mode
+                    # the engine implements the software discovery logic and is therefore required
+                    if engine_str is None:
+                        self._tk_app.log_debug(
+                            "No engine set. Skipping this software entity."
+                        )
+                        continue
+
+                    # Not the same as saying get(app_args_field, "") since the key might exist but the value may still
+                    # be None. If we have no args we should provide an empty string.
+                    app_args = sw_entity[app_args_field] or ""
+
+                    # defer to the automatic DCC scan to enumerate and register DCCs
+                    self._scan_for_software_and_register(
+                        engine_str,
+                        dcc_versions,
+                        dcc_products,
+                        app_group,
+                        app_args,
+                        is_group_default,
+                        sw_entity,
+                        description=description,
+                        software_versions=scanned_software[
+                            (engine_str, tuple(dcc_versions), tuple(dcc_products))
+                        ],
+                    )
+
+                else:
+                    # one or more path fields are not none. This means manual mode.
+                    self._tk_app.log_debug(
+                        "One or more path fields are not None. Manual mode."
+                    )
+
+                    if sw_entity[app_path_field] is None:
+                        # manual mode but nothing to do for our os
+                        self._tk_app.log_debug(
+                            "No path defined for current platform (field %s) - skipping."
+                            % app_path_field
+                        )
+                        continue
+
+                    app_path = sw_entity[app_path_field]
+                    app_display_name = sw_entity["code"]
+                    app_args = sw_entity[app_args_field] or ""
+
+                    # get icon, use the cached or downloaded thumbnail if there is one.
+                    icon_path = self._get_default_thumbnail_location()
+                    if sw_entity["image"] is not None and self._config.has_ui:
+                        icon_path = (
+                            thumbnail_cache.get(sw_entity["image"])
+                            or self._wait_for_thumbnail(
+                                sw_entity,
+                                thumbnail_downloads,
+                                thumbnail_deadline,
+                                timer,
+                            )
+                            or icon_path
+                        )
+
+                    # manual mode!
+                    self._manual_register(
+                        engine_str,
+                        dcc_versions,
+                        app_group,
+                        is_group_default,
+                        app_display_name,
+                        app_path,
+                        app_args,
+                        icon_path,
+                        sw_entity,
+                        description=description,
+                    )
+
+        # Allow the cached software scan results to be refreshed on demand.
+        if self._tk_app.get_setting("software_scan_cache_ttl"):
+            self._register_rescan_command()
+
+        self._log_registration_report()
+
+    def _download_thumbnails(self, sw_entities, thumbnail_cache, timer):
+        """
+        Start downloading the thumbnails of the given manual mode Software
+        entities which are not cached yet.
+
+        :param list sw_entities: Software entity dictionaries.
+        :param thumbnail_cache: :class:`ThumbnailCache` to download with.
+        :param timer: :class:`RegistrationTimer` to time the downloads with.
+        :returns: Dictionary of futures of the downloaded thumbnail paths,
+                  keyed by thumbnail url.
+        """
+        if not self._config.has_ui:
+            return {}
+
+        requests = [
+            (sw_entity["type"], sw_entity["id"], sw_entity["image"])
+            for sw_entity in sw_entities
+            if sw_entity["image"] is not None
+            and not self._is_automatic_software_entity(sw_entity)
+            and sw_entity[self._config.app_path_field] is not None
+            and thumbnail_cache.get(sw_entity["image"]) is None
+        ]
+        return thumbnail_cache.download_in_background(requests, timer)
+
+    def _wait_for_thumbnail(self, sw_entity, thumbnail_downloads, deadline, timer):
+        """
+        Wait for the thumbnail of the given Software entity to be downloaded,
+        until the given deadline.
+
+        :param dict sw_entity: Software entity dictionary.
+        :param dict thumbnail_downloads: Futures of the downloaded thumbnail
+                                         paths, keyed by thumbnail url.
+        :param float deadline: Time after which downloads are not waited for.
+        :param timer: :class:`RegistrationTimer` to time the wait with.
+        :returns: Path to the downloaded thumbnail, or None if it wasn't
+                  downloaded in time.
+        """
+        download = thumbnail_downloads.get(sw_entity["image"])
+        if download is None:
+            return None
+
+        try:
+            with timer.stage("wait_for_thumbnail", code=sw_entity["code"]):
+                return download.result(timeout=max(0, deadline - time.time()))
+        except concurrent.futures.TimeoutError:
             self._tk_app.log_debug(
-                "Parsing Software entity for launch commands:\n%s"
-                % pprint.pformat(sw_entity, indent=4)
+                "Thumbnail of %s is still downloading, using the default icon."
+                % sw_entity["code"]
             )
+            return None
 
-            # Parse the Software `versions` field to determine the specific list of versions to
-            # load. Assume the list of versions is stored as a comma-separated string in Shotgun.
-            dcc_versions_str = sw_entity["version_names"] or ""
-            dcc_versions = [v.strip() for v in dcc_versions_str.split(",") if v.strip()]
+    def _register_rescan_command(self):
+        """
+        Register a command which clears the software scan cache and scans
+        for the installed software again.
+        """
+        if not self._should_register_commands():
+            return
+
+        properties = {
+            "title": "Rescan Installed Software",
+            "short_name": "rescan_software",
+            "description": "Scans again for the locally installed software. "
+            "Newly found software is available after the next restart.",
+            "type": "context_menu",
+        }
+        self._tk_app.engine.register_command(
+            "rescan_software", self._rescan_software, properties
+        )
 
-            # Parse the Software `products` field to determine the specific list
-            # of product variations to load. Assume the list of products is
-            # stored as a comma-separated string in Shotgun.
-            dcc_products_str = sw_entity["products"] or ""
-            dcc_products = [p.strip() for p in dcc_products_str.split(",") if p.strip()]
+    def _rescan_software(self, *args, **kwargs):
+        """
+        Clear the software scan cache and scan for the installed software
+        of all the automatic Software entities again, caching the results.
+        """
+        SoftwareScanCache.clear(self._tk_app)
+        timer = RegistrationTimer("rescan_software")
+        scanned_software = self._scan_for_all_software(
+            self._get_sg_software_entities(), timer
+        )
+        log_registration_report(self._tk_app, timer.to_dict())
+        self._tk_app.log_info(
+            "Found %d software versions. Restart to update the launch commands."
+            % sum(len(versions) for versions in scanned_software.values())
+        )
 
-            # get the group settings
-            app_group = sw_entity["group_name"]
-            is_group_default = sw_entity["group_default"]
+    @staticmethod
+    def _is_automatic_software_entity(sw_entity):
+        """
+        Tells if the given Software entity is an "automatic" record, i.e. all
+        its path fields are set to None.
 
-            # get associated engine (can be none)
-            engine_str = sw_entity["engine"]
+        :param dict sw_entity: Software entity dictionary.
+        :returns: True if the Software entity is an automatic record.
+        """
+        return (
+            sw_entity.get("windows_path") is None
+            and sw_entity.get("mac_path") is None
+            and sw_entity.get("linux_path") is None
+        )
 
-            # get description, fall back to None
-            description = sw_entity["description"] if sw_entity["description"] else None
+    @staticmethod
+    def _get_versions_and_products(sw_entity):
+        """
+        Parse the `versions` and `products` fields of the given Software entity.
+        Both are stored as comma-separated strings in Shotgun.
 
-            # Resolve the app path and args field names for the current platform
-            app_path_field = "%s_path" % self._platform_name
-            app_args_field = "%s_args" % self._platform_name
+        :param dict sw_entity: Software entity dictionary.
+        :returns: Tuple (versions, products) of lists of strings.
+        """
+        dcc_versions_str = sw_entity["version_names"] or ""
+        dcc_versions = [v.strip() for v in dcc_versions_str.split(",") if v.strip()]
 
-            # determine if we are in 'automatic' mode or manual
+        dcc_products_str = sw_entity["products"] or ""
+        dcc_products = [p.strip() for p in dcc_products_str.split(",") if p.strip()]
+
+        return dcc_versions, dcc_products
+
+    def _scan_for_all_software(self, sw_entities, timer):
+        """
+        Scan for the installed software of all the given automatic mode Software
+        entities.
+
+        Scans are run in a pool of threads, since they mostly wait on the
+        filesystem. Software entities with the same engine, versions and products
+        share a single scan.
+
+        :param list sw_entities: Software entity dictionaries.
+        :param timer: :class:`RegistrationTimer` to time the scans with.
+        :returns: Dictionary of lists of SoftwareVersions, keyed by
+                  (engine, versions, products) tuples.
+        """
+        scan_keys = []
+        # Labels of the Software entities sharing each scan.
+        scan_entities = {}
+        for sw_entity in sw_entities:
             if (
-                sw_entity.get("windows_path") is None
-                and sw_entity.get("mac_path") is None
-                and sw_entity.get("linux_path") is None
+                not self._is_automatic_software_entity(sw_entity)
+                or sw_entity["engine"] is None
             ):
+                continue
+            dcc_versions, dcc_products = self._get_versions_and_products(sw_entity)
+            scan_key = (sw_entity["engine"], tuple(dcc_versions), tuple(dcc_products))
+            if scan_key not in scan_keys:
+                scan_keys.append(scan_key)
+            scan_entities.setdefault(scan_key, []).append(
+                RegistrationTimer.get_entity_label(sw_entity)
+            )
 
-                # all paths are none - we are in automatic mode
-                self._tk_app.log_debug("All path fields are None. Automatic mode.")
-
-                # make sure we have an engine defined when running in automatic mode
-                # the engine implements the software discovery logic and is therefore required
-                if engine_str is None:
-                    self._tk_app.log_debug(
-                        "No engine set. Skipping this software entity."
-                    )
-                    continue
+        max_workers = min(
+            self._tk_app.get_setting("software_scan_max_workers"), len(scan_keys)
+        )
 
-                # Not the same as saying get(app_args_field, "") since the key might exist but the value may still
-                # be None. If we have no args we should provide an empty string.
-                app_args = sw_entity[app_args_field] or ""
+        if max_workers <= 1:
+            return dict(
+                (
+                    scan_key,
+                    self._scan_for_software_for_key(
+                        scan_key, timer, scan_entities[scan_key]
+                    ),
+                )
+                for scan_key in scan_keys
+            )
 
-                # defer to the automatic DCC scan to enumerate and register DCCs
-                self._scan_for_software_and_register(
-                    engine_str,
-                    dcc_versions,
-                    dcc_products,
-                    app_group,
-                    app_args,
-                    is_group_default,
-                    sw_entity,
-                    description=description,
+        self._tk_app.log_debug(
+            "Scanning for software of %d automatic Software entities with %d threads."
+            % (len(scan_keys), max_workers)
+        )
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="SoftwareScan"
+        ) as executor:
+            futures = [
+                (
+                    scan_key,
+                    executor.submit(
+                        self._scan_for_software_for_key,
+                        scan_key,
+                        timer,
+                        scan_entities[scan_key],
+                    ),
                 )
+                for scan_key in scan_keys
+            ]
+        return dict((scan_key, future.result()) for scan_key, future in futures)
 
-            else:
-                # one or more path fields are not none. This means manual mode.
+    def _scan_for_software_for_key(self, scan_key, timer=None, entities=None):
+        """
+        Run :meth:`_scan_for_software` for the given scan key.
+
+        If the software scan cache is enabled, cached results are returned
+        when the scanned install directories did not change, and fresh scan
+        results are cached.
+
+        :param tuple scan_key: (engine, versions, products) tuple.
+        :param timer: (Optional) :class:`RegistrationTimer` to time the scan
+                      with. Defaults to the registration timer.
+        :param list entities: (Optional) Labels of the Software entities
+                              sharing the scan.
+        :returns: List of SoftwareVersions.
+        """
+        if timer is None:
+            timer = self._registration_timer
+
+        engine_str, dcc_versions, dcc_products = scan_key
+        stage_details = {
+            "entities": entities,
+            "engine_instance": engine_str,
+            "versions": dcc_versions,
+            "products": dcc_products,
+        }
+
+        cache_ttl = self._tk_app.get_setting("software_scan_cache_ttl")
+        if cache_ttl:
+            cache = SoftwareScanCache(
+                self._tk_app, scan_key, self._get_engine_signature(engine_str)
+            )
+            with timer.stage("load_software_scan_cache", **stage_details):
+                software_versions = cache.load(cache_ttl)
+            if software_versions is not None:
                 self._tk_app.log_debug(
-                    "One or more path fields are not None. Manual mode."
+                    "Using cached software scan results for %s." % (scan_key,)
                 )
+                return software_versions
 
-                if sw_entity[app_path_field] is None:
-                    # manual mode but nothing to do for our os
-                    self._tk_app.log_debug(
-                        "No path defined for current platform (field %s) - skipping."
-                        % app_path_field
-                    )
-                    continue
-
-                app_path = sw_entity[app_path_field]
-                app_display_name = sw_entity["code"]
-                app_args = sw_entity[app_args_field] or ""
+        self._tk_app.log_debug(
+            "Attempting to auto discover software for %s." % engine_str
+        )
+        with timer.stage("scan_software", **stage_details):
+            software_versions = self._scan_for_software(
+                engine_str, list(dcc_versions), list(dcc_products)
+            )
 
-                # get icon
-                icon_path = self._extract_thumbnail(
-                    sw_entity["type"], sw_entity["id"], sw_entity["image"]
-                )
+        # Empty results are not cached: they are also returned when the scan
+        # failed, and there is no install directory to watch for changes anyway.
+        if cache_ttl and software_versions:
+            cache.save(software_versions)
 
-                # manual mode!
-                self._manual_register(
-                    engine_str,
-                    dcc_versions,
-                    app_group,
-                    is_group_default,
-                    app_display_name,
-                    app_path,
-                    app_args,
-                    icon_path,
-                    sw_entity,
-                    description=description,
-                )
+        return software_versions
 
     def launch_from_path(self, path, version=None):
         """
@@ -201,6 +529,24 @@ class SoftwareEntityLauncher(BaseLauncher):
             "functionality."
         )
 
+    def launch_batch(self, items, max_workers=None):
+        """
+        Entry point if you want to launch the app for many paths at once.
+
+        :param list items: List of (path, context, version) tuples.
+        :param int max_workers: (Optional) Maximum number of launches run at
+                                the same time.
+        :returns: List of failed results, one per item in the same order.
+        """
+        # This functionality is not supported for Software entities.
+        error = (
+            "launch_batch() is not supported by SoftwareEntityLauncher. "
+            "Please register individual application launch commands in your "
+            "Project's configuration to use this functionality."
+        )
+        self._tk_app.log_error(error)
+        return [self._get_batch_launch_result(item, error=error) for item in items]
+
     def _get_sg_software_entities(self):
         """
         Retrieve a list of Software entities from Shotgun that
@@ -304,6 +650,129 @@ class SoftwareEntityLauncher(BaseLauncher):
         # Add any user defined fields to the list of fields we should request.
         sw_fields += self._tk_app.get_setting("software_entity_extra_fields")
 
+        cache_ttl = self._tk_app.get_setting("software_entity_cache_ttl")
+        if not cache_ttl:
+            return self._find_sg_software_entities(sw_filters, sw_fields)
+
+        return self._get_cached_sg_software_entities(sw_filters, sw_fields, cache_ttl)
+
+    def _get_cached_sg_software_entities(self, sw_filters, sw_fields, cache_ttl):
+        """
+        Retrieve a list of Software entities, using the on-disk Software entity
+        cache when possible.
+
+        Fresh cached data is returned straight away. Stale cached data is
+        either revalidated before being returned or returned as is and
+        revalidated in the background, depending on the
+        ``software_entity_cache_stale_behavior`` setting. If nothing is cached,
+        Flow Production Tracking is queried.
+
+        :param list sw_filters: Filters to query the Software entities with.
+        :param list sw_fields: Software entity fields to retrieve.
+        :param int cache_ttl: Number of seconds cached data is considered fresh.
+        :returns: A list of shotgun software entity dictionaries
+        """
+        cache = SoftwareEntityCache(self._tk_app, sw_filters, sw_fields)
+        cached = cache.load()
+
+        if cached is None:
+            self._tk_app.log_debug(
+                "No cached Software entities found in %s." % cache.path
+            )
+            return self._refresh_software_entity_cache(
+                cache, None, sw_filters, sw_fields
+            )
+
+        if cached.age < cache_ttl:
+            self._tk_app.log_debug(
+                "Using cached Software entities from %s." % cache.path
+            )
+            return cached.entities
+
+        stale_behavior = self._tk_app.get_setting(
+            "software_entity_cache_stale_behavior"
+        )
+        if stale_behavior == "use_stale":
+            self._tk_app.log_debug(
+                "Using stale cached Software entities from %s." % cache.path
+            )
+            self._refresh_software_entity_cache_in_background(
+                cache, cached, sw_filters, sw_fields
+            )
+            return cached.entities
+
+        if stale_behavior != "refresh":
+            self._tk_app.log_warning(
+                "Unknown software_entity_cache_stale_behavior value '%s', "
+                "refreshing the Software entity cache." % stale_behavior
+            )
+
+        return self._refresh_software_entity_cache(cache, cached, sw_filters, sw_fields)
+
+    def _refresh_software_entity_cache(self, cache, cached, sw_filters, sw_fields):
+        """
+        Revalidate cached Software entities against Flow Production Tracking
+        and update the cache on disk.
+
+        The cached entities are kept if the ``updated_at`` and count summary
+        of the matching Software entities did not change. Otherwise all the
+        Software entities are queried again.
+
+        :param cache: The :class:`SoftwareEntityCache` to refresh.
+        :param cached: The previously cached data or None.
+        :param list sw_filters: Filters to query the Software entities with.
+        :param list sw_fields: Software entity fields to retrieve.
+        :returns: A list of shotgun software entity dictionaries
+        """
+        summary = SoftwareEntityCache.summarize(self._tk_app.shotgun, sw_filters)
+        if cached is not None and summary is not None and summary == cached.summary:
+            self._tk_app.log_debug(
+                "Cached Software entities are up to date with Flow Production "
+                "Tracking."
+            )
+            cache.touch(cached)
+            return cached.entities
+
+        sw_entities = self._find_sg_software_entities(sw_filters, sw_fields)
+        cache.save(sw_entities, summary)
+        return sw_entities
+
+    def _refresh_software_entity_cache_in_background(
+        self, cache, cached, sw_filters, sw_fields
+    ):
+        """
+        Run :meth:`_refresh_software_entity_cache` in a background thread.
+
+        :param cache: The :class:`SoftwareEntityCache` to refresh.
+        :param cached: The previously cached data.
+        :param list sw_filters: Filters to query the Software entities with.
+        :param list sw_fields: Software entity fields to retrieve.
+        """
+
+        def refresh():
+            try:
+                self._refresh_software_entity_cache(
+                    cache, cached, sw_filters, sw_fields
+                )
+            except Exception:
+                self._tk_app.logger.debug(
+                    "Unable to refresh the Software entity cache in the background.",
+                    exc_info=True,
+                )
+
+        thread = threading.Thread(target=refresh, name="SoftwareEntityCacheRefresh")
+        thread.daemon = True
+        thread.start()
+
+    def _find_sg_software_entities(self, sw_filters, sw_fields):
+        """
+        Query Flow Production Tracking for the Software entities matching
+        the given filters.
+
+        :param list sw_filters: Filters to query the Software entities with.
+        :param list sw_fields: Software entity fields to retrieve.
+        :returns: A list of shotgun software entity dictionaries
+        """
         # Log the resolved filter.
         self._tk_app.log_debug(
             "Searching for Software entities matching filters:\n%s"
@@ -331,6 +800,7 @@ class SoftwareEntityLauncher(BaseLauncher):
         is_group_default,
         software_entity,
         description=None,
+        software_versions=None,
     ):
         """
         Scan for installed software and register commands for all entries detected.
@@ -354,15 +824,17 @@ class SoftwareEntityLauncher(BaseLauncher):
         :param int software_entity: If set, this is the entity representing the software entity that
                                     is associated with this launch command.
         :param str description: (Optional) Custom description/tooltip to use.
+        :param list software_versions: (Optional) SoftwareVersions already found
+            by a previous scan. If None, a scan is performed.
         """
-        # No application path was specified, triggering "auto discovery" mode. Attempt to
-        # find relevant application path(s) from the engine launcher.
-        self._tk_app.log_debug(
-            "Attempting to auto discover software for %s." % engine_str
-        )
-        software_versions = self._scan_for_software(
-            engine_str, dcc_versions, dcc_products
-        )
+        if software_versions is None:
+            # No application path was specified, triggering "auto discovery" mode. Attempt to
+            # find relevant application path(s) from the engine launcher.
+            software_versions = self._scan_for_software_for_key(
+                (engine_str, tuple(dcc_versions or []), tuple(dcc_products or [])),
+                self._registration_timer,
+                [RegistrationTimer.get_entity_label(software_entity)],
+            )
 
         self._tk_app.log_debug(
             "Scan detected %d software versions" % len(software_versions)
@@ -384,12 +856,16 @@ class SoftwareEntityLauncher(BaseLauncher):
         for software_version in software_versions:
             # run before launch hook
             self._tk_app.log_debug("Running before register command hook...")
-            launch_engine_str = self._tk_app.execute_hook_method(
-                "hook_before_register_command",
-                "determine_engine_instance_name",
-                software_version=software_version,
-                engine_instance_name=engine_str,
-            )
+            with self._registration_timer.stage(
+                "before_register_command_hook",
+                engine_instance=engine_str,
+                version=software_version.version,
+            ):
+                launch_engine_str = (
+                    self._registration_cache.determine_engine_instance_name(
+                        software_version, engine_str
+                    )
+                )
 
             # If the engine name was transformed by the hook, then we need to
             # make sure that the new engine instance that's requested exists
@@ -400,6 +876,7 @@ class SoftwareEntityLauncher(BaseLauncher):
             # Software entity, but that occurs before the launch engine instance
             # is determined by the hook. We need to check for the same possible
             # issue here since the requested engine instance has changed.
+            resolve_callback = None
             if launch_engine_str != engine_str:
                 self._tk_app.logger.debug(
                     "The before_register_command hook changed the engine instance "
@@ -407,13 +884,12 @@ class SoftwareEntityLauncher(BaseLauncher):
                     launch_engine_str,
                 )
 
-                try:
-                    # We don't need the returned env and descriptor. We only
-                    # care whether it raises or not.
-                    sgtk.platform.engine.get_env_and_descriptor_for_engine(
-                        launch_engine_str, self._tk_app.sgtk, self._tk_app.context
+                if self._config.lazy_registration:
+                    # Only check the engine instance when the command is invoked.
+                    resolve_callback = self._get_engine_instance_resolver(
+                        launch_engine_str
                     )
-                except sgtk.platform.TankMissingEngineError:
+                elif not self._check_engine_instance_exists(launch_engine_str):
                     self._tk_app.logger.debug(
                         "The engine instance requested by before_register_command (%s) "
                         "does not exist in the current environment. The launcher will "
@@ -424,7 +900,7 @@ class SoftwareEntityLauncher(BaseLauncher):
 
             # We need to check to see if the engine instance associated with
             # the launch command is something we've been configured to skip.
-            if launch_engine_str in self._tk_app.get_setting("skip_engine_instances"):
+            if launch_engine_str in self._config.skip_engine_instances:
                 self._tk_app.logger.debug(
                     "The %s engine instance has been configured to be skipped by way "
                     "of the skip_engine_instances app setting. The launcher command "
@@ -464,8 +940,52 @@ class SoftwareEntityLauncher(BaseLauncher):
                 group_default,
                 software_entity,
                 description=description,
+                resolve_callback=resolve_callback,
             )
 
+    def _engine_instance_exists(self, engine_instance_name):
+        """
+        Tells if the given engine instance exists in the environment for the
+        current context.
+
+        :param str engine_instance_name: Name of the engine instance.
+        :returns: True if the engine instance exists.
+        """
+        return self._registration_cache.engine_instance_exists(engine_instance_name)
+
+    def _check_engine_instance_exists(self, engine_instance_name):
+        """
+        Run :meth:`_engine_instance_exists`, timing it as a registration stage.
+
+        :param str engine_instance_name: Name of the engine instance.
+        :returns: True if the engine instance exists.
+        """
+        with self._registration_timer.stage(
+            "engine_instance_check", engine_instance=engine_instance_name
+        ):
+            return self._engine_instance_exists(engine_instance_name)
+
+    def _get_engine_instance_resolver(self, engine_instance_name):
+        """
+        Return a resolve callback for :meth:`_register_launch_command` which
+        checks the given engine instance exists before launching.
+
+        :param str engine_instance_name: Name of the engine instance.
+        :returns: A callable.
+        """
+
+        def resolve(properties):
+            if self._engine_instance_exists(engine_instance_name):
+                return True
+            self._tk_app.log_error(
+                "The engine instance requested by before_register_command (%s) "
+                "does not exist in the current environment. %s can't be launched."
+                % (engine_instance_name, properties["title"])
+            )
+            return False
+
+        return resolve
+
     def _manual_register(
         self,
         engine_str,
@@ -478,6 +998,7 @@ class SoftwareEntityLauncher(BaseLauncher):
         icon_path,
         software_entity,
         description=None,
+        resolve_callback=None,
     ):
         """
         Parse manual software definition given by input params and register
@@ -498,6 +1019,8 @@ class SoftwareEntityLauncher(BaseLauncher):
         :param icon_path: Path to an icon thumbnail on disk.
         :param software_entity: A dict representing the Shotgun Software entity.
         :param str description: (Optional) Custom description/tooltip to use.
+        :param resolve_callback: (Optional) Callable run the first time a
+            registered command is invoked. See :meth:`_register_launch_command`.
         """
         if dcc_versions:
             # Construct a command for each version.
@@ -532,6 +1055,7 @@ class SoftwareEntityLauncher(BaseLauncher):
                     group_default,
                     software_entity,
                     description=description,
+                    resolve_callback=resolve_callback,
                 )
 
         else:
@@ -547,66 +1071,14 @@ class SoftwareEntityLauncher(BaseLauncher):
                 is_group_default,
                 software_entity,
                 description=description,
+                resolve_callback=resolve_callback,
             )
 
-    def _extract_thumbnail(self, entity_type, entity_id, sg_thumb_url):
+    def _get_default_thumbnail_location(self):
         """
-        Extracts the large size thumbnail from the given Shotgun entity.
-        If no thumbnail can be found in Shotgun, a default one is returned.
-
-        :param entity_type: The corresponding Shotgun entity type
-        :param entity_id: The corresponding entity id
-        :param sg_thumb_url: The thumbnail url for the given record
-        :returns: path to local image
+        :returns: Path to the icon used when a Software entity has no thumbnail.
         """
-        self._tk_app.log_debug(
-            "Attempting to extract high res thumbnail from %s %s"
-            % (entity_type, entity_id)
-        )
-
-        default_thumbnail_location = os.path.join(
-            self._tk_app.disk_location, "icon_256.png"
-        )
-
-        if sg_thumb_url is None:
-            self._tk_app.log_debug(
-                "No thumbnail is set in Flow Production Tracking. Falling back on default."
-            )
-            # use the launch app icon
-            return default_thumbnail_location
-
-        if not self._tk_app.engine.has_ui:
-            self._tk_app.log_debug(
-                "Runtime environment does not have Qt. Skipping extraction."
-            )
-            # use the launch app icon
-            return default_thumbnail_location
-
-        # all good to go - download the target icon
-
-        # Import sgutils after ui has been confirmed because it has dependencies on Qt.
-        shotgun_data = sgtk.platform.import_framework(
-            "tk-framework-shotgunutils", "shotgun_data"
-        )
-
-        # Download the Software thumbnail source from Shotgun and cache for reuse.
-        self._tk_app.log_debug(
-            "Downloading app icon from %s %s ..." % (entity_type, entity_id)
-        )
-
-        try:
-            icon_path = shotgun_data.ShotgunDataRetriever.download_thumbnail_source(
-                entity_type, entity_id, self._tk_app
-            )
-        except Exception:
-            self._tk_app.logger.exception(
-                "There was a problem downloading the thumbnail:"
-            )
-            return default_thumbnail_location
-        else:
-            self._tk_app.log_debug("...download complete: %s" % icon_path)
-
-        return icon_path
+        return os.path.join(self._tk_app.disk_location, "icon_256.png")
 
     def _scan_for_software(self, engine, versions, products):
         """
@@ -647,6 +1119,12 @@ class SoftwareEntityLauncher(BaseLauncher):
             )
             return []
 
+        # The versions and products only filter the scan, launches in the
+        # current context can be prepared with the same launcher.
+        add_engine_launcher(
+            self._engine_launchers, engine, self._tk_app.context, engine_launcher
+        )
+
         # Next try to scan for available applications for this engine.
         try:
             self._tk_app.log_debug(
@@ -0,0 +1,206 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import os
+import time
+
+import sgtk
+
+from .bootstrap_cache import BootstrapCache
+from .util import load_cache_file, save_cache_file
+
+
+class SoftwareScanCache(object):
+    """
+    On-disk cache of the SoftwareVersions found by an engine software scan.
+
+    One cache file is stored per (engine, versions, products) scan key and per
+    installed version of the engine in the app cache location, which is specific
+    to the current site and pipeline configuration. Updating the engine, which
+    implements the scan, starts a new cache.
+
+    The cached results are invalidated when the signature (modification time
+    and inode) of the scanned install directories changes. Since the directories
+    globbed by the engines are not known, the executables found by the scan and
+    a few of their parent directories are watched instead. Installing a new
+    version of a DCC next to an existing one or removing one changes the
+    modification time of one of these directories.
+    """
+
+    # Bump this if the layout of the cached data changes.
+    CACHE_VERSION = 1
+
+    # Number of parent directories of each scanned executable to watch.
+    WATCHED_PARENT_DEPTH = 3
+
+    def __init__(self, tk_app, scan_key, engine_signature=None):
+        """
+        :param tk_app: The TK Application instance owning the cache.
+        :param tuple scan_key: (engine, versions, products) tuple.
+        :param tuple engine_signature: (Optional) Signature of the installed
+                                       engine, see :meth:`get_engine_signature`.
+                                       Computed if not given.
+        """
+        self._tk_app = tk_app
+
+        if engine_signature is None:
+            engine_signature = self.get_engine_signature(tk_app, scan_key[0])
+        key = repr(
+            (
+                self.CACHE_VERSION,
+                sgtk.util.is_windows(),
+                scan_key,
+                engine_signature,
+            )
+        )
+        file_name = "%s.pickle" % hashlib.sha1(key.encode("utf-8")).hexdigest()
+        self._path = os.path.join(self.get_cache_folder(tk_app), file_name)
+
+    @staticmethod
+    def get_engine_signature(tk_app, engine_name):
+        """
+        Compute the signature of the installed version of the given engine.
+
+        The path to the engine changes with its version for most descriptors.
+        The modification time of the engine startup module, which implements
+        the scan, is also used for descriptors whose path doesn't change, like
+        dev descriptors.
+
+        :param tk_app: The TK Application instance owning the cache.
+        :param str engine_name: Name of the engine instance.
+        :returns: Tuple (engine path, startup module modification time). Items
+                  are None if they can't be determined.
+        """
+        try:
+            engine_path = BootstrapCache(tk_app).get_engine_path(
+                engine_name, tk_app.context
+            )
+        except Exception:
+            tk_app.logger.debug(
+                "Unable to resolve the path to the %s engine.",
+                engine_name,
+                exc_info=True,
+            )
+            return (None, None)
+
+        if engine_path is None:
+            return (None, None)
+
+        try:
+            startup_mtime = os.stat(os.path.join(engine_path, "startup.py")).st_mtime_ns
+        except OSError:
+            startup_mtime = None
+        return (engine_path, startup_mtime)
+
+    @staticmethod
+    def get_cache_folder(tk_app):
+        """
+        Return the folder the scan results are cached in.
+
+        :param tk_app: The TK Application instance owning the cache.
+        :returns: Path to the folder.
+        """
+        return os.path.join(tk_app.cache_location, "software_scans")
+
+    @classmethod
+    def clear(cls, tk_app):
+        """
+        Delete all the cached scan results.
+
+        :param tk_app: The TK Application instance owning the cache.
+        """
+        cache_folder = cls.get_cache_folder(tk_app)
+        if os.path.isdir(cache_folder):
+            tk_app.log_debug("Clearing software scan cache %s." % cache_folder)
+            sgtk.util.filesystem.safe_delete_folder(cache_folder)
+
+    def load(self, cache_ttl):
+        """
+        Load the cached SoftwareVersions from disk.
+
+        :param int cache_ttl: Number of seconds cached results are valid for.
+        :returns: A list of SoftwareVersions or None if there is no valid
+                  cached result.
+        """
+        if not os.path.exists(self._path):
+            return None
+
+        try:
+            data = load_cache_file(self._path)
+        except Exception:
+            self._tk_app.logger.debug(
+                "Unable to read software scan cache %s, ignoring it.",
+                self._path,
+                exc_info=True,
+            )
+            return None
+
+        if data.get("version") != self.CACHE_VERSION:
+            return None
+
+        if time.time() - data["timestamp"] >= cache_ttl:
+            self._tk_app.log_debug("Software scan cache %s expired." % self._path)
+            return None
+
+        if data["signature"] != self._get_signature(data["signature"]):
+            self._tk_app.log_debug(
+                "Scanned install directories changed, ignoring software scan "
+                "cache %s." % self._path
+            )
+            return None
+
+        return data["software_versions"]
+
+    def save(self, software_versions):
+        """
+        Write the given SoftwareVersions to disk, with the signature of
+        their install directories.
+
+        :param list software_versions: SoftwareVersions to cache.
+        """
+        watched_paths = set()
+        for software_version in software_versions:
+            path = software_version.path
+            if not path:
+                continue
+            watched_paths.add(path)
+            for _ in range(self.WATCHED_PARENT_DEPTH):
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                watched_paths.add(parent)
+                path = parent
+
+        data = {
+            "version": self.CACHE_VERSION,
+            "timestamp": time.time(),
+            "signature": self._get_signature(watched_paths),
+            "software_versions": software_versions,
+        }
+        save_cache_file(self._path, data)
+
+    @staticmethod
+    def _get_signature(paths):
+        """
+        Compute the signature of the given paths.
+
+        :param paths: Iterable of paths.
+        :returns: Dictionary of (modification time, inode) tuples keyed by
+                  path. The value is None for paths which do not exist.
+        """
+        signature = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signature[path] = (stat.st_mtime_ns, stat.st_ino)
+            except OSError:
+                signature[path] = None
+        return signature
@@ -0,0 +1,175 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import concurrent.futures
+import glob
+import hashlib
+import os
+import uuid
+from urllib.parse import urlsplit
+
+import sgtk
+
+
+class ThumbnailCache(object):
+    """
+    Content addressed on-disk cache of Software entity thumbnails.
+
+    Thumbnails are stored under a name derived from their Flow Production
+    Tracking url, ignoring the query string which holds short lived signing
+    information. Uploading a new thumbnail changes its url, which is the only
+    thing triggering a new download.
+
+    Transient urls, like the placeholder shown while a thumbnail is being
+    processed, are shared by many entities and are never cached.
+    """
+
+    # Maximum number of thumbnails downloaded at the same time.
+    MAX_WORKERS = 4
+
+    # Url path of the transient images, like the "thumbnail pending"
+    # placeholder.
+    TRANSIENT_URL_PATH = "/images/status/transient/"
+
+    def __init__(self, tk_app):
+        """
+        :param tk_app: The TK Application instance owning the cache.
+        """
+        self._tk_app = tk_app
+        self._cache_folder = os.path.join(tk_app.site_cache_location, "thumbnails")
+
+    def _get_base_path(self, sg_thumb_url):
+        """
+        Return the path, without extension, a thumbnail is cached at.
+
+        :param str sg_thumb_url: The thumbnail url.
+        :returns: Path to the cached thumbnail, without extension.
+        """
+        url = urlsplit(sg_thumb_url)
+        key = "%s%s" % (url.netloc, url.path)
+        return os.path.join(
+            self._cache_folder, hashlib.sha1(key.encode("utf-8")).hexdigest()
+        )
+
+    def is_transient(self, sg_thumb_url):
+        """
+        Return whether the given url is a transient image, which is not the
+        actual thumbnail of an entity and must not be cached.
+
+        :param str sg_thumb_url: The thumbnail url.
+        :returns: True if the url is transient.
+        """
+        return self.TRANSIENT_URL_PATH in urlsplit(sg_thumb_url).path
+
+    def get(self, sg_thumb_url):
+        """
+        Return the path to the cached thumbnail for the given url.
+
+        :param str sg_thumb_url: The thumbnail url.
+        :returns: Path to the cached thumbnail or None if it isn't cached.
+        """
+        if self.is_transient(sg_thumb_url):
+            return None
+        # The extension of the file is taken from the downloaded url.
+        cached_files = glob.glob("%s.*" % self._get_base_path(sg_thumb_url))
+        return cached_files[0] if cached_files else None
+
+    def download(self, entity_type, entity_id, sg_thumb_url):
+        """
+        Download the full resolution thumbnail of the given entity, unless it
+        is already cached or its url is transient.
+
+        The thumbnail is downloaded to a temporary file which is then moved in
+        place, so an interrupted download never leaves a partial thumbnail in
+        the cache.
+
+        :param entity_type: The corresponding Shotgun entity type
+        :param entity_id: The corresponding entity id
+        :param sg_thumb_url: The thumbnail url for the given record
+        :returns: Path to the downloaded thumbnail, or None if the url is
+                  transient.
+        """
+        if self.is_transient(sg_thumb_url):
+            return None
+
+        cached_path = self.get(sg_thumb_url)
+        if cached_path:
+            return cached_path
+
+        shotgun = self._tk_app.shotgun
+        url = "%s/thumbnail/full/%s/%s" % (shotgun.base_url, entity_type, entity_id)
+        sgtk.util.filesystem.ensure_folder_exists(self._cache_folder)
+        base_path = self._get_base_path(sg_thumb_url)
+        # The temporary name doesn't start like the cached name, so it is never
+        # returned by get().
+        temp_base_path = os.path.join(
+            self._cache_folder,
+            "tmp_%s_%s" % (uuid.uuid4().hex, os.path.basename(base_path)),
+        )
+        try:
+            temp_path = sgtk.util.download_url(
+                shotgun, url, temp_base_path, use_url_extension=True
+            )
+            icon_path = base_path + os.path.splitext(temp_path)[1]
+            os.replace(temp_path, icon_path)
+        except Exception:
+            # Don't leave partial downloads behind.
+            for partial_path in glob.glob("%s*" % temp_base_path):
+                sgtk.util.filesystem.safe_delete_file(partial_path)
+            raise
+        return icon_path
+
+    def download_in_background(self, requests, timer):
+        """
+        Start downloading the thumbnails of the given entities in a pool of
+        background threads.
+
+        :param list requests: List of (entity_type, entity_id, sg_thumb_url)
+                              tuples.
+        :param timer: :class:`RegistrationTimer` to time the downloads with.
+        :returns: Dictionary of :class:`concurrent.futures.Future` keyed by
+                  thumbnail url. Each future returns the path to the downloaded
+                  thumbnail, or None if it couldn't be downloaded.
+        """
+        if not requests:
+            return {}
+
+        def download(entity_type, entity_id, sg_thumb_url):
+            try:
+                with timer.stage(
+                    "thumbnail_download", entity="%s %s" % (entity_type, entity_id)
+                ):
+                    icon_path = self.download(entity_type, entity_id, sg_thumb_url)
+            except Exception:
+                self._tk_app.logger.exception(
+                    "There was a problem downloading the thumbnail:"
+                )
+                return None
+            self._tk_app.log_debug(
+                "...download of %s %s thumbnail complete: %s"
+                % (entity_type, entity_id, icon_path)
+            )
+            return icon_path
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.MAX_WORKERS, len(requests)),
+            thread_name_prefix="ThumbnailDownload",
+        )
+        futures = {}
+        for entity_type, entity_id, sg_thumb_url in requests:
+            # Transient urls are shared by many entities and not downloaded.
+            if sg_thumb_url not in futures and not self.is_transient(sg_thumb_url):
+                futures[sg_thumb_url] = executor.submit(
+                    download, entity_type, entity_id, sg_thumb_url
+                )
+        # Downloads which are not waited for complete in the background, and
+        # are cached for the next registration.
+        executor.shutdown(wait=False)
+        return futures
@@ -8,43 +8,195 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
+import functools
+import os
 import sys
 import re
 import sgtk
+from sgtk.util import pickle
 
+logger = sgtk.platform.get_logger(__name__)
 
-def _translate_version_tokens(raw_string, version):
+
+# Groups of a version string defined by ()s, e.g. "9.0" and "beta1" in
+# "(9.0)v4(beta1)".
+_VERSION_TOKENS_REGEX = re.compile(r"\(([^\)]+)\)")
+_VERSION_PARENTHESES_REGEX = re.compile("[()]")
+
+# Numeric and alphabetic components of a version string.
+_VERSION_COMPONENTS_REGEX = re.compile(r"[0-9]+|[a-zA-Z]+")
+
+# Pre-release tags of a version, ranked as in PEP 440: 1.0dev < 1.0a1 < 1.0b1
+# < 1.0rc1 < 1.0.
+_PRE_RELEASE_TAGS = {
+    "dev": 0,
+    "a": 1,
+    "alpha": 1,
+    "b": 2,
+    "beta": 2,
+    "c": 3,
+    "rc": 3,
+    "pre": 3,
+    "preview": 3,
+}
+
+# Ranks of the components of a version sort key. Pre-release tags sort before
+# the end of a version, other alphabetic components, like the v in 14.0v3,
+# after it.
+_PRE_RELEASE_RANK = 0
+_END_RANK = 1
+_ALPHA_RANK = 2
+_NUMERIC_RANK = 3
+
+# Version tokens in a setting: {version}, {v0}, {v1}, ...
+_TEMPLATE_TOKEN_REGEX = re.compile(r"\{(?:version|v(0|[1-9][0-9]*))\}")
+
+
+class VersionTemplate(object):
     """
-    Returns string with version tokens replaced by their values. Replaces
-    {version} and {v0}, {v1}, etc. tokens in raw_string with their values.
+    Setting value containing version tokens, like {version}, {v0}, {v1}, ...,
+    parsed once so it can be rendered for many versions.
+
     The {v} tokens are created by using groups defined by () within the
     version string. For example, if the version setting is "(9.0)v4(beta1)"
         {version} = "9.0v4"
         {v0} = "9.0"
         {v1} = "beta1"
 
-    :param raw_string: raw string with un-translated tokens
-    :param version: version string to use for replacement tokens
+    {v} tokens without a matching group in the version are left as is.
+    Templates are best retrieved with :func:`get_version_template`, which
+    caches them.
+    """
 
-    :returns: (string) Version string resolved from inputs
+    # Marker of the {version} token in the segments.
+    _VERSION = -1
+
+    def __init__(self, raw_string):
+        """
+        :param str raw_string: Raw string with un-translated tokens.
+        """
+        self._raw_string = raw_string
+
+        # Literal strings and token indices, _VERSION for {version}.
+        self._segments = []
+        literals = []
+        position = 0
+        for match in _TEMPLATE_TOKEN_REGEX.finditer(raw_string):
+            if match.start() > position:
+                self._segments.append(raw_string[position : match.start()])
+                literals.append(self._segments[-1])
+            index = match.group(1)
+            self._segments.append(self._VERSION if index is None else int(index))
+            position = match.end()
+        if position < len(raw_string):
+            self._segments.append(raw_string[position:])
+            literals.append(self._segments[-1])
+        self._segments = tuple(self._segments)
+
+        self._has_tokens = len(literals) < len(self._segments)
+        # Braces outside of the tokens could combine with substituted values
+        # into new tokens, which only the token by token replacement handles.
+        self._has_stray_braces = any(
+            "{" in literal or "}" in literal for literal in literals
+        )
+
+    @property
+    def raw_string(self):
+        """
+        The raw string with un-translated tokens.
+        """
+        return self._raw_string
+
+    def render(self, version):
+        """
+        Returns the string with version tokens replaced by their values.
+
+        :param str version: Version string to use for replacement tokens. If
+                            None or empty, the raw string is returned.
+        :returns: String with the version tokens replaced.
+        """
+        if not version or not self._has_tokens:
+            return self._raw_string
+
+        clean_version, version_tokens = _parse_version(version)
+        if self._has_stray_braces or "{" in version or "}" in version:
+            return _replace_version_tokens(
+                self._raw_string, clean_version, version_tokens
+            )
+
+        rendered = []
+        for segment in self._segments:
+            if isinstance(segment, str):
+                rendered.append(segment)
+            elif segment == self._VERSION:
+                rendered.append(clean_version)
+            elif segment < len(version_tokens):
+                rendered.append(version_tokens[segment])
+            else:
+                # No matching group in the version, leave the token as is.
+                rendered.append("{v%d}" % segment)
+        return "".join(rendered)
+
+
+@functools.lru_cache(maxsize=4096)
+def get_version_template(raw_string):
     """
-    # Verify there's something to replace.
-    if not raw_string:
-        return raw_string
+    Returns the :class:`VersionTemplate` for the given raw string. Templates
+    are cached, so each raw string is only parsed once.
+
+    :param str raw_string: Raw string with un-translated tokens.
+    :returns: A :class:`VersionTemplate`.
+    """
+    return VersionTemplate(raw_string)
 
-    # split version string into tokens defined by ()s
-    version_tokens = re.findall(r"\(([^\)]+)\)", version)
 
-    # ensure we have a clean complete version string without ()s
-    clean_version = get_clean_version_string(version)
+@functools.lru_cache(maxsize=4096)
+def _parse_version(version):
+    """
+    Split a version string into its clean version string and its tokens
+    defined by ()s.
+
+    :param str version: Version string, e.g. "(9.0)v4(beta1)".
+    :returns: Tuple (clean version, tokens), e.g. ("9.0v4", ("9.0", "beta1")).
+    """
+    return (
+        _VERSION_PARENTHESES_REGEX.sub("", version),
+        tuple(_VERSION_TOKENS_REGEX.findall(version)),
+    )
 
-    # do the substitution
+
+def _replace_version_tokens(raw_string, clean_version, version_tokens):
+    """
+    Replace the version tokens in the given string one after the other.
+
+    :param str raw_string: Raw string with un-translated tokens.
+    :param str clean_version: Value of the {version} token.
+    :param tuple version_tokens: Values of the {v0}, {v1}, ... tokens.
+    :returns: String with the version tokens replaced.
+    """
     ver_string = raw_string.replace("{version}", clean_version)
     for i, token in enumerate(version_tokens):
         ver_string = ver_string.replace("{v%d}" % i, token)
     return ver_string
 
 
+def _translate_version_tokens(raw_string, version):
+    """
+    Returns string with version tokens replaced by their values. Replaces
+    {version} and {v0}, {v1}, etc. tokens in raw_string with their values.
+    See :class:`VersionTemplate`.
+
+    :param raw_string: raw string with un-translated tokens
+    :param version: version string to use for replacement tokens
+
+    :returns: (string) Version string resolved from inputs
+    """
+    # Verify there's something to replace.
+    if not raw_string:
+        return raw_string
+    return get_version_template(raw_string).render(version)
+
+
 def get_clean_version_string(version):
     """
     Returns version string used for current app launch stripped of
@@ -58,7 +210,57 @@ def get_clean_version_string(version):
 
     :returns: Version string used to launch application.
     """
-    return re.sub("[()]", "", version) if version else None
+    return _parse_version(version)[0] if version else None
+
+
+@functools.lru_cache(maxsize=4096)
+def get_version_sort_key(version):
+    """
+    Returns a key to sort version strings with.
+
+    A version number consists of a series of numbers, separated by either
+    periods or strings of letters. Numeric components are compared
+    numerically and alphabetic components lexically, ignoring case. Other
+    characters, like periods and the ()s defining version tokens, only
+    separate components. For example:
+
+        1.1 < 1.2 < 1.3
+        1.2 < 1.2v < 1.2va < 1.2x
+        14.0 < 14.0v3 < 14.1v1
+        (8.0)v1 < 2024.2
+
+    Pre-release tags, like a, b and rc, sort before the release they lead
+    to, as with packaging.version:
+
+        1.0dev1 < 1.0a1 < 1.0b1 < 1.0rc1 < 1.0 < 1.0v1 < 1.0.1
+
+    When a numeric and an alphabetic component are compared, the alphabetic
+    one sorts first. Versions with equal components are ordered by their
+    clean version string, so the ordering is stable.
+
+    :param str version: Version string.
+    :returns: A tuple.
+    """
+    clean_version = get_clean_version_string(version) or ""
+    components = []
+    for component in _VERSION_COMPONENTS_REGEX.findall(clean_version):
+        if component.isdigit():
+            components.append((_NUMERIC_RANK, int(component), ""))
+            continue
+        component = component.lower()
+        # Only a tag following a number, like the b in 1.0b1, is a pre-release.
+        if (
+            components
+            and components[-1][0] == _NUMERIC_RANK
+            and component in _PRE_RELEASE_TAGS
+        ):
+            components.append(
+                (_PRE_RELEASE_RANK, _PRE_RELEASE_TAGS[component], component)
+            )
+        else:
+            components.append((_ALPHA_RANK, 0, component))
+    components.append((_END_RANK, 0, ""))
+    return tuple(components), clean_version
 
 
 def apply_version_to_setting(raw_string, version=None):
@@ -84,6 +286,39 @@ def apply_version_to_setting(raw_string, version=None):
     return raw_string
 
 
+def load_cache_file(path):
+    """
+    Load data pickled to disk by :func:`save_cache_file`.
+
+    :param path: Path to the cache file.
+
+    :returns: The unpickled data.
+    """
+    with open(path, "r") as fh:
+        return pickle.loads(fh.read())
+
+
+def save_cache_file(path, data):
+    """
+    Atomically pickle the given data to disk, so a concurrent reader
+    never sees a partially written file. Errors are logged but not raised,
+    since failing to write a cache file is not critical.
+
+    :param path: Path to the cache file.
+    :param data: Data to pickle.
+    """
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        sgtk.util.filesystem.ensure_folder_exists(os.path.dirname(path))
+        with open(tmp_path, "w") as fh:
+            fh.write(pickle.dumps(data))
+        os.replace(tmp_path, path)
+    except Exception:
+        logger.debug("Unable to write cache file %s.", path, exc_info=True)
+        if os.path.exists(tmp_path):
+            sgtk.util.filesystem.safe_delete_file(tmp_path)
+
+
 def clear_dll_directory():
     """
     Push current Dll Directory. There are two cases that
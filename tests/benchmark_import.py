@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Benchmarks importing the app payload and constructing the launchers, which
+must not import the dialogs, Qt resources or the qtwidgets framework. Run it
+explicitly, it is not collected with the tests::
+
+    pytest tests/benchmark_import.py --log-cli-level=INFO
+"""
+
+import sys
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_benchmark import LaunchAppBenchmarkBase
+
+# Packages of the payload which are only needed to show dialogs.
+UI_PACKAGES = ("launch_indicator_dialog", "not_found_dialog")
+
+
+class BenchmarkImport(LaunchAppBenchmarkBase):
+    """
+    Benchmarks the import of the payload, as done when the app is loaded.
+    """
+
+    def setUp(self):
+        super(BenchmarkImport, self).setUp()
+        payload = self.app.import_module("tk_multi_launchapp")
+        # Name of the package the payload is imported under.
+        self._payload_package = payload.__name__.rsplit(".", 1)[0]
+
+    def _get_payload_modules(self):
+        """
+        :returns: Names of the payload modules imported, relative to the
+                  payload package.
+        """
+        prefix = self._payload_package + "."
+        return sorted(
+            name[len(prefix) :] for name in sys.modules if name.startswith(prefix)
+        )
+
+    def _unload_payload(self):
+        """
+        Remove the payload modules from sys.modules so they are imported again.
+        The payload package itself is kept, it can't be imported by name.
+        """
+        for name in self._get_payload_modules():
+            del sys.modules["%s.%s" % (self._payload_package, name)]
+
+    def _import_payload(self):
+        """
+        Import the payload and construct both launchers, as the app does.
+        """
+        payload = self.app.import_module("tk_multi_launchapp")
+        payload.SoftwareEntityLauncher()
+        payload.SingleConfigLauncher()
+
+    def test_import_payload(self):
+        """
+        Benchmark the import of the payload and make sure it doesn't import
+        any of the UI modules.
+        """
+        results = self.measure(self._import_payload, setup=self._unload_payload)
+
+        self._unload_payload()
+        self._import_payload()
+        modules = self._get_payload_modules()
+        ui_modules = [
+            name
+            for name in modules
+            if name.split(".")[0] in UI_PACKAGES or name.endswith("resources_rc")
+        ]
+        self.assertEqual(ui_modules, [])
+
+        results["module_count"] = len(modules)
+        self.record("import_payload", results)
+
+    def test_import_ui(self):
+        """
+        Benchmark the import of the UI modules, which is only paid when a
+        dialog is shown.
+        """
+        if not self.engine.has_ui:
+            self.skipTest("The UI modules can only be imported with a UI.")
+
+        def import_ui():
+            for package in UI_PACKAGES:
+                self.app.import_module(package)
+
+        self.record("import_ui", self.measure(import_ui, setup=self._unload_payload))
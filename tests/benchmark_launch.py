@@ -0,0 +1,170 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Benchmarks launching applications end-to-end, from the registered launch
+command to the app_launch hook, which is replaced with a stub which does not
+spawn anything. Run it explicitly, it is not collected with the tests::
+
+    pytest tests/benchmark_launch.py --log-cli-level=INFO
+
+The number of launches and the number of synthetic environment variables can
+be set with the SHOTGUN_LAUNCHAPP_BENCHMARK_LAUNCH_COUNT and
+SHOTGUN_LAUNCHAPP_BENCHMARK_ENV_SIZE environment variables.
+"""
+
+import json
+import os
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_benchmark import LaunchAppBenchmarkBase
+
+from sgtk.platform import SoftwareVersion
+from sgtk.util import pickle
+
+
+class BenchmarkLaunch(LaunchAppBenchmarkBase):
+    """
+    Benchmarks the launch path of both launchers.
+    """
+
+    LAUNCH_COUNT = int(os.environ.get("SHOTGUN_LAUNCHAPP_BENCHMARK_LAUNCH_COUNT", 50))
+    ENV_SIZE = int(os.environ.get("SHOTGUN_LAUNCHAPP_BENCHMARK_ENV_SIZE", 2000))
+
+    def _create_software(self):
+        """
+        Create an automatic Software entity for the tk-testengine.
+        """
+        self.mockgun.create(
+            "Software",
+            {
+                "code": "auto",
+                "engine": "tk-testengine",
+                "image": None,
+                "version_names": None,
+                "products": None,
+                "group_name": None,
+                "group_default": False,
+                "linux_path": None,
+                "mac_path": None,
+                "windows_path": None,
+                "linux_args": None,
+                "mac_args": None,
+                "windows_args": None,
+                "description": None,
+            },
+        )
+        scanned_software = [
+            SoftwareVersion("2020", "Auto", "/path/to/software_2020", "", [])
+        ]
+        os.environ["SHOTGUN_SCAN_SOFTWARE_LIST"] = pickle.dumps(scanned_software)
+
+    def setUp(self):
+        super(BenchmarkLaunch, self).setUp()
+
+        # Launch with a large environment, like the ones found in studios.
+        synthetic_env = dict(
+            (
+                "LAUNCHAPP_BENCHMARK_VAR_%d" % i,
+                os.pathsep.join("/synthetic/path/%d/%d" % (i, j) for j in range(10)),
+            )
+            for i in range(self.ENV_SIZE)
+        )
+        os.environ.update(synthetic_env)
+        self.addCleanup(self._remove_from_environ, synthetic_env)
+
+        self._timings_file = os.path.join(self.tank_temp, "launch_timings.jsonl")
+        self.engine.hook_overrides["execute"] = self._app_launch_hook_override
+
+    @staticmethod
+    def _remove_from_environ(env):
+        for name in env:
+            os.environ.pop(name, None)
+
+    def _app_launch_hook_override(
+        self, hook, app_path, app_args, version, engine_name, **kwargs
+    ):
+        # Don't spawn anything.
+        return {"command": app_path, "return_code": 0}
+
+    def _benchmark_launches(self, benchmark, launcher, launch):
+        """
+        Launch the given number of times and record the percentiles of the
+        launch durations and of the duration of each launch stage.
+
+        :param str benchmark: Name of the benchmark.
+        :param launcher: Launcher the application is launched with.
+        :param launch: Callable launching the application once.
+        """
+        if os.path.exists(self._timings_file):
+            os.remove(self._timings_file)
+
+        for _ in range(self.LAUNCH_COUNT):
+            launch()
+        launcher._telemetry.flush(timeout=30)
+
+        with open(self._timings_file, "r") as fh:
+            records = [json.loads(line) for line in fh]
+        self.assertEqual(len(records), self.LAUNCH_COUNT)
+        for record in records:
+            self.assertEqual(record["return_code"], 0)
+
+        stage_durations = {}
+        for record in records:
+            for stage in record["stages"]:
+                stage_durations.setdefault(stage["name"], []).append(stage["duration"])
+
+        return self.record(
+            benchmark,
+            {
+                "launch_count": self.LAUNCH_COUNT,
+                "env_size": len(os.environ),
+                "launch": self.percentiles([record["duration"] for record in records]),
+                "stages": dict(
+                    (name, self.percentiles(durations))
+                    for name, durations in stage_durations.items()
+                ),
+            },
+        )
+
+    def test_software_entity_launch(self):
+        """
+        Benchmark launches with the SoftwareEntityLauncher.
+        """
+        self._patch_settings(launch_timings_file=self._timings_file)
+        self._benchmark_launches(
+            "software_entity_launch",
+            self.app._launcher,
+            self.engine.commands["auto_2020"]["callback"],
+        )
+
+    def test_single_config_launch(self):
+        """
+        Benchmark launches with the SingleConfigLauncher.
+        """
+        self._patch_settings(
+            launch_timings_file=self._timings_file,
+            use_software_entity=False,
+            linux_path="/path/to/single_config",
+            mac_path="/path/to/single_config",
+            windows_path="/path/to/single_config",
+            menu_name="Launch Single Config",
+            engine="tk-testengine",
+        )
+        launcher = self.app.import_module("tk_multi_launchapp").SingleConfigLauncher()
+        launcher.register_launch_commands()
+
+        self._benchmark_launches(
+            "single_config_launch",
+            launcher,
+            self.engine.commands["launch_single_config"]["callback"],
+        )
@@ -0,0 +1,160 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Benchmarks the registration of the launch commands for hundreds of Software
+entities. Run it explicitly, it is not collected with the tests::
+
+    pytest tests/benchmark_registration.py --log-cli-level=INFO
+
+The number of Software entities can be set with the
+SHOTGUN_LAUNCHAPP_BENCHMARK_SOFTWARE_COUNT environment variable.
+"""
+
+import os
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_benchmark import LaunchAppBenchmarkBase
+
+from sgtk.platform import SoftwareVersion
+from sgtk.util import pickle
+
+
+class BenchmarkRegistration(LaunchAppBenchmarkBase):
+    """
+    Benchmarks register_launch_commands with many Software entities.
+    """
+
+    SOFTWARE_COUNT = int(
+        os.environ.get("SHOTGUN_LAUNCHAPP_BENCHMARK_SOFTWARE_COUNT", 500)
+    )
+
+    SCANNED_VERSIONS = ["2021", "2022", "2023", "2024", "2025"]
+    SCANNED_PRODUCTS = ["Auto", "Auto Pro"]
+
+    def _create_software(self):
+        """
+        Create a mix of manual and automatic Software entities, with versions,
+        products, groups and user and project restrictions.
+        """
+        other_project = self.mockgun.create("Project", {"name": "Other Project"})
+        user = self.mockgun.create(
+            "HumanUser", {"login": "benchmark_user", "name": "Benchmark User"}
+        )
+
+        for i in range(self.SOFTWARE_COUNT):
+            versions = self.SCANNED_VERSIONS[: i % 4]
+            version_token = " {version}" if versions else ""
+            automatic = i % 2 == 0
+            path = None if automatic else "/path/to/software_%d%s" % (i, version_token)
+            data = {
+                "code": "Software %d%s" % (i, version_token),
+                "engine": "tk-testengine",
+                "image": None,
+                "version_names": ", ".join(versions) or None,
+                "products": self.SCANNED_PRODUCTS[i % 3] if i % 3 < 2 else None,
+                "group_name": "Group %d" % (i % 10) if i % 5 else None,
+                "group_default": i % 10 == 1,
+                "linux_path": path,
+                "mac_path": path,
+                "windows_path": path,
+                "linux_args": "--arg %d" % i,
+                "mac_args": "--arg %d" % i,
+                "windows_args": "--arg %d" % i,
+                "description": "Software %d" % i if i % 2 else None,
+                "sg_status_list": "act",
+            }
+            if i % 7 == 0:
+                data["projects"] = [self.project]
+            elif i % 7 == 1:
+                data["projects"] = [other_project]
+            if i % 11 == 0:
+                data["user_restrictions"] = [user]
+            self.mockgun.create("Software", data)
+
+        scanned_software = [
+            SoftwareVersion(
+                version,
+                product,
+                "/path/to/%s/%s/software" % (product, version),
+                "",
+                ["--engine"],
+            )
+            for version in self.SCANNED_VERSIONS
+            for product in self.SCANNED_PRODUCTS
+        ]
+        os.environ["SHOTGUN_SCAN_SOFTWARE_LIST"] = pickle.dumps(scanned_software)
+
+    def _benchmark_registration(self, benchmark, warm_up=False):
+        """
+        Benchmark the registration of the launch commands and record the results.
+
+        Commands are registered with a stub engine method, so they don't pile up
+        in the engine across rounds.
+
+        :param str benchmark: Name of the benchmark.
+        :param bool warm_up: If True, commands are registered once before the
+                             measured rounds.
+        """
+        launcher = self.app._launcher
+        launch_timing = self.app.import_module("tk_multi_launchapp").launch_timing
+        commands = {}
+
+        def register_command(name, callback, properties=None):
+            commands[name] = properties
+
+        def setup():
+            commands.clear()
+            launcher._registration_timer = launch_timing.RegistrationTimer(
+                "register_launch_commands"
+            )
+
+        with mock.patch.object(
+            self.engine, "register_command", side_effect=register_command
+        ):
+            if warm_up:
+                setup()
+                launcher.register_launch_commands()
+            results = self.measure(launcher.register_launch_commands, setup=setup)
+
+        stage_durations = {}
+        for stage in launcher.registration_report["stages"]:
+            stage_durations[stage["name"]] = round(
+                stage_durations.get(stage["name"], 0.0) + stage["duration"], 6
+            )
+        results.update(
+            {
+                "software_count": self.SOFTWARE_COUNT,
+                "command_count": len(commands),
+                "stages": stage_durations,
+            }
+        )
+        self.assertTrue(commands)
+        return self.record(benchmark, results)
+
+    def test_register_launch_commands(self):
+        """
+        Benchmark the registration without any cache.
+        """
+        self._patch_settings(software_entity_cache_ttl=0, software_scan_cache_ttl=0)
+        self._benchmark_registration("register_launch_commands")
+
+    def test_register_launch_commands_cached(self):
+        """
+        Benchmark the registration with the Software entity and software scan
+        caches on. Caches are populated by a warm-up round.
+        """
+        self._patch_settings(
+            software_entity_cache_ttl=3600, software_scan_cache_ttl=3600
+        )
+        self._benchmark_registration("register_launch_commands_cached", warm_up=True)
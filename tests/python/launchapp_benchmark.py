@@ -0,0 +1,192 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import datetime
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+from launchapp_test_base import LaunchAppTestBase
+
+logger = logging.getLogger(__name__)
+
+# Benchmark results are appended to this file, one JSON record per line, so
+# they can be compared across releases. It defaults to a file in the temporary
+# folder, outside of the source tree.
+RESULTS_FILE_ENV_VAR = "SHOTGUN_LAUNCHAPP_BENCHMARK_RESULTS"
+DEFAULT_RESULTS_FILE = os.path.join(
+    tempfile.gettempdir(), "tk-multi-launchapp", "benchmark_results.jsonl"
+)
+
+# Flow Production Tracking API methods whose calls are counted.
+COUNTED_SG_METHODS = (
+    "find",
+    "find_one",
+    "summarize",
+    "batch",
+    "create",
+    "update",
+    "download_attachment",
+)
+
+
+class LaunchAppBenchmarkBase(LaunchAppTestBase):
+    """
+    Base class for the benchmarks, which run offline against mockgun.
+
+    Benchmarks are not collected with the tests, run them explicitly, e.g.::
+
+        pytest tests/benchmark_registration.py --log-cli-level=INFO
+
+    Results are logged and appended to the file set with the
+    SHOTGUN_LAUNCHAPP_BENCHMARK_RESULTS environment variable, or to
+    :data:`DEFAULT_RESULTS_FILE`.
+    """
+
+    # Number of timed rounds of each benchmark.
+    ROUNDS = int(os.environ.get("SHOTGUN_LAUNCHAPP_BENCHMARK_ROUNDS", 5))
+
+    def percentiles(self, durations):
+        """
+        Summarize the given durations.
+
+        :param list durations: Durations in seconds.
+        :returns: Dictionary with the 'min', 'p50', 'p90', 'p99' and 'max'
+                  durations, in seconds.
+        """
+        durations = sorted(durations)
+
+        def percentile(p):
+            return durations[min(len(durations) - 1, int(len(durations) * p))]
+
+        return {
+            "min": round(durations[0], 6),
+            "p50": round(statistics.median(durations), 6),
+            "p90": round(percentile(0.9), 6),
+            "p99": round(percentile(0.99), 6),
+            "max": round(durations[-1], 6),
+        }
+
+    @contextlib.contextmanager
+    def count_sg_calls(self):
+        """
+        Context manager counting the calls made to Flow Production Tracking.
+
+        :yields: Dictionary of call counts, keyed by API method name. It is
+                 updated as calls are made.
+        """
+        counts = dict((name, 0) for name in COUNTED_SG_METHODS)
+        with contextlib.ExitStack() as stack:
+            for name in COUNTED_SG_METHODS:
+                method = getattr(self.mockgun, name, None)
+                if method is None:
+                    continue
+                stack.enter_context(
+                    mock.patch.object(
+                        self.mockgun,
+                        name,
+                        side_effect=self._get_counted_method(counts, name, method),
+                    )
+                )
+            yield counts
+
+    @staticmethod
+    def _get_counted_method(counts, name, method):
+        """
+        :returns: A callable counting its calls in counts before calling method.
+        """
+
+        def counted(*args, **kwargs):
+            counts[name] += 1
+            return method(*args, **kwargs)
+
+        return counted
+
+    def measure(self, func, setup=None):
+        """
+        Measure the wall time, memory allocations and Flow Production Tracking
+        calls of the given callable.
+
+        Timed rounds are run without tracing memory allocations, which are
+        measured in an additional round.
+
+        :param func: Callable to measure.
+        :param setup: (Optional) Callable run before each round, untimed.
+        :returns: Dictionary with the 'rounds' count, the 'wall_time'
+                  percentiles, the 'allocations' of a single round and the
+                  'sg_calls' counts of a single round.
+        """
+        durations = []
+        for _ in range(self.ROUNDS):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            with self.count_sg_calls() as sg_calls:
+                func()
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "rounds": self.ROUNDS,
+            "wall_time": self.percentiles(durations),
+            "allocations": {
+                "retained_bytes": current,
+                "peak_bytes": peak,
+                "retained_blocks": blocks,
+            },
+            "sg_calls": sg_calls,
+        }
+
+    def record(self, benchmark, results):
+        """
+        Append the given benchmark results to the results file.
+
+        :param str benchmark: Name of the benchmark.
+        :param dict results: Results of the benchmark.
+        :returns: The recorded results.
+        """
+        record = {
+            "benchmark": benchmark,
+            "date": datetime.datetime.now().isoformat(),
+            "app_version": self.app.version,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        }
+        record.update(results)
+
+        results_file = os.environ.get(RESULTS_FILE_ENV_VAR) or DEFAULT_RESULTS_FILE
+        os.makedirs(os.path.dirname(os.path.abspath(results_file)), exist_ok=True)
+        with open(results_file, "a") as fh:
+            fh.write(json.dumps(record, sort_keys=True) + "\n")
+        logger.info(
+            "Recorded %s benchmark results in %s:\n%s",
+            benchmark,
+            results_file,
+            json.dumps(record, indent=4, sort_keys=True),
+        )
+        return record
@@ -9,6 +9,7 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import os
+from unittest import mock
 
 from tank_test.tank_test_base import TankTestBase
 from tank_test.tank_test_base import setUpModule  # noqa
@@ -54,6 +55,21 @@ class LaunchAppTestBase(TankTestBase):
         """
         pass
 
+    def _patch_settings(self, **overrides):
+        """
+        Override some of the app settings for the duration of the test.
+        """
+        get_setting = self.app.get_setting
+
+        def _get_setting(key, default=None):
+            if key in overrides:
+                return overrides[key]
+            return get_setting(key, default)
+
+        patcher = mock.patch.object(self.app, "get_setting", side_effect=_get_setting)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
 
 def _merge_into_environment_variables(env):
     """
@@ -0,0 +1,68 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import threading
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestBatchLaunch(LaunchAppTestBase):
+    """
+    Tests launching applications for many files at once.
+    """
+
+    def setUp(self):
+        super(TestBatchLaunch, self).setUp()
+        self._lock = threading.Lock()
+        self._launched = []
+
+    def _app_launch_hook_override(
+        self, hook, app_path, app_args, version, engine_name, **kwargs
+    ):
+        with self._lock:
+            self._launched.append(app_path)
+        if version == "broken":
+            raise RuntimeError("Broken hook")
+        return {"command": app_path, "return_code": 1}
+
+    def test_batch_results(self):
+        """
+        Make sure every item is launched and gets a result, in order.
+        """
+        self.engine.hook_overrides["execute"] = self._app_launch_hook_override
+        context = self.app.context
+        items = [("/file/%d" % i, context, str(i)) for i in range(10)]
+        items.append(("/file/broken", context, "broken"))
+
+        results = self.app._launcher._launch_batch(
+            "Test", None, "/path/{version}", "", items, max_workers=4
+        )
+
+        self.assertEqual(
+            sorted(self._launched),
+            sorted("/path/%s" % version for _, _, version in items),
+        )
+        self.assertEqual([r["path"] for r in results], [i[0] for i in items])
+        self.assertFalse(any(r["success"] for r in results))
+        self.assertEqual(results[0]["command"], "/path/0")
+        self.assertEqual(results[0]["return_code"], 1)
+        self.assertEqual(results[-1]["error"], "Broken hook")
+
+    def test_not_supported_by_software_entities(self):
+        """
+        Make sure Software entity launchers report every item as failed.
+        """
+        results = self.app.launch_batch([("/file", None, None)])
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0]["success"])
+        self.assertIsNone(results[0]["pid"])
@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import importlib
+import os
+import sys
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+import sgtk
+
+
+class TestBootstrapCache(LaunchAppTestBase):
+    """
+    Tests the memo of the engine paths and bootstrap modules.
+    """
+
+    def setUp(self):
+        super(TestBootstrapCache, self).setUp()
+        self.BootstrapCache = self.app.import_module(
+            "tk_multi_launchapp"
+        ).bootstrap_cache.BootstrapCache
+        self.BootstrapCache.clear()
+        self.addCleanup(self.BootstrapCache.clear)
+
+    def _get_engine_path(self):
+        """
+        Resolve the path of the test engine, counting the resolutions.
+        """
+        with mock.patch(
+            "sgtk.platform.get_engine_path", wraps=sgtk.platform.get_engine_path
+        ) as get_engine_path:
+            engine_path = self.BootstrapCache(self.app).get_engine_path(
+                "tk-testengine", self.app.context
+            )
+        return engine_path, get_engine_path.call_count
+
+    def test_engine_path_is_reused(self):
+        """
+        Make sure engine paths are resolved once, until the environment changes
+        and the environment signature is reset.
+        """
+        engine_path, call_count = self._get_engine_path()
+        self.assertIsNotNone(engine_path)
+        self.assertEqual(call_count, 1)
+        self.assertEqual(self._get_engine_path(), (engine_path, 0))
+
+        env_path = self.engine.environment["disk_location"]
+        stat = os.stat(env_path)
+        os.utime(env_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        # The environment files are not walked again until the signature is
+        # reset, e.g. when the launch commands are registered again.
+        self.assertEqual(self._get_engine_path(), (engine_path, 0))
+        self.BootstrapCache.reset_environment_signature()
+        self.assertEqual(self._get_engine_path(), (engine_path, 1))
+
+    def test_environment_is_walked_once(self):
+        """
+        Make sure the environment files are only walked once for all the
+        engine path resolutions.
+        """
+        with mock.patch("os.walk", wraps=os.walk) as walk:
+            for _ in range(3):
+                self._get_engine_path()
+        self.assertEqual(walk.call_count, 1)
+
+    def _write_file(self, path, content):
+        """
+        Write the given content to the given file, creating its folder.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fh:
+            fh.write(content)
+
+    def test_bootstrap_module_is_reused(self):
+        """
+        Make sure bootstrap modules are imported once, until they change, and
+        are only registered in sys.modules while they are used.
+        """
+        startup_folder = os.path.join(self.tank_temp, "bootstrap_cache")
+        startup_path = os.path.join(startup_folder, "bootstrap.py")
+        self._write_file(startup_path, "VALUE = 1\n")
+
+        cache = self.BootstrapCache(self.app)
+        sys_path = list(sys.path)
+        import_module_patch = mock.patch(
+            "importlib.import_module", wraps=importlib.import_module
+        )
+        with import_module_patch as import_module:
+            with cache.loaded_module(startup_folder, "bootstrap") as module:
+                self.assertIs(sys.modules["bootstrap"], module)
+            with cache.loaded_module(startup_folder, "bootstrap") as other_module:
+                self.assertEqual(sys.path, sys_path)
+        self.assertEqual(import_module.call_count, 1)
+        self.assertIs(other_module, module)
+        self.assertNotIn("bootstrap", sys.modules)
+
+        # Use a different size, the modification time may not change.
+        self._write_file(startup_path, "VALUE = 22\n")
+        with cache.loaded_module(startup_folder, "bootstrap") as module:
+            self.assertEqual(module.VALUE, 22)
+
+    def test_bootstrap_imports_sibling_module(self):
+        """
+        Make sure engine bootstraps can import modules next to them, and these
+        are unloaded once the bootstrap has run.
+        """
+        engine_path = os.path.join(self.tank_temp, "tk-siblingengine")
+        startup_folder = os.path.join(engine_path, "python", "startup")
+        self._write_file(
+            os.path.join(startup_folder, "launchapp_sibling.py"),
+            "ARGS = '--sibling'\n",
+        )
+        self._write_file(
+            os.path.join(startup_folder, "bootstrap.py"),
+            "import launchapp_sibling\n"
+            "\n"
+            "def bootstrap(app_path, app_args, **kwargs):\n"
+            "    return app_path, launchapp_sibling.ARGS\n",
+        )
+
+        sys_path = list(sys.path)
+        tk_multi_launchapp = self.app.import_module("tk_multi_launchapp")
+        prepare_apps = tk_multi_launchapp.prepare_apps
+        with mock.patch(
+            "sgtk.platform.create_engine_launcher", return_value=None
+        ), mock.patch.object(
+            self.BootstrapCache, "get_engine_path", return_value=engine_path
+        ):
+            app_path, app_args = prepare_apps.prepare_launch_for_engine(
+                "tk-siblingengine",
+                "/path/to/app",
+                "",
+                self.app.context,
+                environment=tk_multi_launchapp.launch_environment.LaunchEnvironment(),
+            )
+
+        self.assertEqual((app_path, app_args), ("/path/to/app", "--sibling"))
+        self.assertEqual(sys.path, sys_path)
+        self.assertNotIn("bootstrap", sys.modules)
+        self.assertNotIn("launchapp_sibling", sys.modules)
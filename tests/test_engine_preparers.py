@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestEnginePreparers(LaunchAppTestBase):
+    """
+    Tests the preparation of launches for engines without an engine launcher.
+    """
+
+    def setUp(self):
+        super(TestEnginePreparers, self).setUp()
+        tk_multi_launchapp = self.app.import_module("tk_multi_launchapp")
+        self.prepare_apps = tk_multi_launchapp.prepare_apps
+        self.launch_environment = tk_multi_launchapp.launch_environment
+        os.environ.pop("LAUNCHAPP_TEST_PREPARER_VAR", None)
+        self._studio_preparers = {}
+
+        # Engines without an engine launcher are prepared by launchapp.
+        patcher = mock.patch("sgtk.platform.create_engine_launcher", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        execute_hook_method = self.app.execute_hook_method
+
+        def execute_studio_hook_method(hook_name, method_name, **kwargs):
+            if hook_name == "hook_engine_preparers":
+                return self._studio_preparers
+            return execute_hook_method(hook_name, method_name, **kwargs)
+
+        patcher = mock.patch.object(
+            self.app, "execute_hook_method", side_effect=execute_studio_hook_method
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _prepare(self, engine_name, app_args=""):
+        """
+        Prepare a launch for the given engine.
+
+        :returns: Tuple (app_path, app_args, environment).
+        """
+        environment = self.launch_environment.LaunchEnvironment()
+        app_path, app_args = self.prepare_apps.prepare_launch_for_engine(
+            engine_name,
+            "/path/to/app",
+            app_args,
+            self.app.context,
+            environment=environment,
+        )
+        return app_path, app_args, environment
+
+    def test_builtin_preparer(self):
+        """
+        Make sure engines are prepared with the built-in preparer registered
+        for them.
+        """
+        app_path, app_args, environment = self._prepare("tk-motionbuilder", "-v")
+        self.assertEqual(app_path, "/path/to/app")
+        self.assertTrue(app_args.startswith("-v "))
+        self.assertTrue(app_args.endswith('init_tank.py"'))
+        self.assertEqual(environment["TANK_ENGINE"], "tk-motionbuilder")
+
+    def test_studio_preparer(self):
+        """
+        Make sure studio preparers take precedence over the built-in ones and
+        their changes to os.environ are captured.
+        """
+        environ_before = dict(os.environ)
+        calls = []
+
+        def prepare_launch(**kwargs):
+            calls.append(kwargs)
+            os.environ["LAUNCHAPP_TEST_PREPARER_VAR"] = os.environ["TANK_ENGINE"]
+            return ("/path/to/studio_app", "--studio")
+
+        self._studio_preparers = {"tk-motionbuilder": prepare_launch}
+        app_path, app_args, environment = self._prepare("tk-motionbuilder")
+
+        self.assertEqual((app_path, app_args), ("/path/to/studio_app", "--studio"))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0]["engine_name"], "tk-motionbuilder")
+        self.assertEqual(calls[0]["app_path"], "/path/to/app")
+        self.assertEqual(environment["LAUNCHAPP_TEST_PREPARER_VAR"], "tk-motionbuilder")
+        self.assertEqual(dict(os.environ), environ_before)
@@ -0,0 +1,166 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import threading
+import time
+from unittest import mock
+
+import sgtk
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestFolderCreationCache(LaunchAppTestBase):
+    """
+    Tests skipping folder creation when folders were recently created.
+    """
+
+    def _count_folder_creations(self, *launches_force_folders):
+        """
+        Launch once per given force_folders value and count folder creations.
+        """
+        self.engine.hook_overrides["execute"] = lambda *args, **kwargs: {
+            "command": "test",
+            "return_code": 1,
+        }
+        with mock.patch.object(
+            self.app.sgtk, "create_filesystem_structure"
+        ) as create_filesystem_structure:
+            for force_folders in launches_force_folders:
+                self.app._launcher._launch_callback(
+                    "Test", None, "/path/to/test", "", force_folders=force_folders
+                )
+        return create_filesystem_structure.call_count
+
+    def test_repeat_launches_skip_folder_creation(self):
+        """
+        Make sure folders are only created again when forced.
+        """
+        self._patch_settings(folder_creation_cache_ttl=600)
+        self.assertEqual(self._count_folder_creations(True, False, False, True), 2)
+
+    def test_force_folder_creation_setting(self):
+        """
+        Make sure folders are created at every launch when forced by the
+        setting.
+        """
+        self._patch_settings(folder_creation_cache_ttl=600, force_folder_creation=True)
+        self.assertEqual(self._count_folder_creations(False, False), 2)
+
+    def test_schema_is_walked_once_per_launch(self):
+        """
+        Make sure the schema signature is computed once per launch, and used
+        both to check and to remember the creation.
+        """
+        self._patch_settings(folder_creation_cache_ttl=600)
+        FolderCreationCache = self.app.import_module(
+            "tk_multi_launchapp"
+        ).folder_creation_cache.FolderCreationCache
+        with mock.patch.object(
+            FolderCreationCache,
+            "get_schema_signature",
+            autospec=True,
+            side_effect=FolderCreationCache.get_schema_signature,
+        ) as get_schema_signature:
+            self.assertEqual(self._count_folder_creations(False, False), 1)
+        self.assertEqual(get_schema_signature.call_count, 2)
+
+    def test_disabled(self):
+        """
+        Make sure folders are created at every launch by default.
+        """
+        self.assertEqual(self._count_folder_creations(False, False), 2)
+
+    def test_folder_creation_runs_in_parallel(self):
+        """
+        Make sure folders are created in the background and the launch hooks
+        are only run once they are created.
+        """
+        created = []
+        created_before_hook = []
+
+        def create_filesystem_structure(*args, **kwargs):
+            time.sleep(0.2)
+            created.append(threading.current_thread())
+
+        def app_launch_hook(*args, **kwargs):
+            created_before_hook.extend(created)
+            return {"command": "test", "return_code": 1}
+
+        self.engine.hook_overrides["execute"] = app_launch_hook
+        with mock.patch.object(
+            self.app.sgtk,
+            "create_filesystem_structure",
+            side_effect=create_filesystem_structure,
+        ):
+            self.app._launcher._launch_callback("Test", None, "/path/to/test", "")
+
+        self.assertEqual(len(created_before_hook), 1)
+        self.assertIsNot(created[0], threading.current_thread())
+
+    def test_folder_creation_overlaps_launch_preparation(self):
+        """
+        Make sure folders are created while the engine launcher prepares the
+        launch, which runs with the launch environment applied.
+        """
+        creating = threading.Event()
+        preparing = threading.Event()
+        overlapped = []
+
+        def create_filesystem_structure(*args, **kwargs):
+            creating.set()
+            overlapped.append(preparing.wait(5))
+
+        def prepare_launch(*args, **kwargs):
+            preparing.set()
+            overlapped.append(creating.wait(5))
+            return mock.Mock(path="/path/to/test", args="", environment={})
+
+        engine_launcher = mock.Mock()
+        engine_launcher.prepare_launch.side_effect = prepare_launch
+        self.app._launcher._engine_launchers.clear()
+        self.engine.hook_overrides["execute"] = lambda *args, **kwargs: {
+            "command": "test",
+            "return_code": 1,
+        }
+        with mock.patch(
+            "sgtk.platform.create_engine_launcher", return_value=engine_launcher
+        ), mock.patch.object(
+            self.app.sgtk,
+            "create_filesystem_structure",
+            side_effect=create_filesystem_structure,
+        ):
+            self.app._launcher._launch_callback(
+                "Test", "tk-testengine", "/path/to/test", ""
+            )
+
+        self.assertEqual(overlapped, [True, True])
+
+    def test_folder_creation_errors_are_raised(self):
+        """
+        Make sure folder creation errors are raised to the caller and the
+        application is not launched.
+        """
+        launched = []
+        self.engine.hook_overrides["execute"] = lambda *args, **kwargs: launched.append(
+            True
+        )
+        with mock.patch.object(
+            self.app.sgtk,
+            "create_filesystem_structure",
+            side_effect=sgtk.TankError("No storage"),
+        ):
+            with self.assertRaisesRegex(sgtk.TankError, "No storage"):
+                self.app._launcher._launch_callback("Test", None, "/path/to/test", "")
+
+        self.assertEqual(launched, [])
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+import sgtk
+
+
+class TestLaunchEnvironment(LaunchAppTestBase):
+    """
+    Tests the environment applications are launched with.
+    """
+
+    def setUp(self):
+        super(TestLaunchEnvironment, self).setUp()
+        os.environ.pop("LAUNCHAPP_TEST_HOOK_VAR", None)
+        os.environ.pop("LAUNCHAPP_TEST_ENV_VAR", None)
+        os.environ.pop("LAUNCHAPP_TEST_APP_DIR", None)
+        self._launch_environment = None
+
+        # The test configuration only routes the app_launch hook through the
+        # test hook, so the before_app_launch hook is intercepted here.
+        execute_hook = self.app.execute_hook
+
+        def execute_test_hook(hook_name, **kwargs):
+            if hook_name == "hook_before_app_launch":
+                return self._before_app_launch_hook(**kwargs)
+            return execute_hook(hook_name, **kwargs)
+
+        patcher = mock.patch.object(
+            self.app, "execute_hook", side_effect=execute_test_hook
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Engines without an engine launcher are prepared by launchapp.
+        patcher = mock.patch("sgtk.platform.create_engine_launcher", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _before_app_launch_hook(self, environment, **kwargs):
+        # Hooks can set variables both ways.
+        os.environ["LAUNCHAPP_TEST_HOOK_VAR"] = "os.environ"
+        environment["LAUNCHAPP_TEST_ENV_VAR"] = "environment"
+
+    def _app_launch_hook_override(
+        self, hook, app_path, app_args, version, engine_name, **kwargs
+    ):
+        self._launch_environment = kwargs["environment"]
+        return {"command": app_path, "return_code": 1}
+
+    def test_environment_is_not_leaked(self):
+        """
+        Make sure the environment set when preparing the launch and by hooks
+        is passed to the application, without changing the environment of the
+        current process.
+        """
+        environ_before = dict(os.environ)
+        self.engine.hook_overrides["execute"] = self._app_launch_hook_override
+        self.app._launcher._launch_app(
+            "Test", "tk-motionbuilder", "/path/to/test", "", self.app.context
+        )
+
+        self.assertEqual(self._launch_environment["TANK_ENGINE"], "tk-motionbuilder")
+        self.assertEqual(
+            self._launch_environment["LAUNCHAPP_TEST_HOOK_VAR"], "os.environ"
+        )
+        self.assertEqual(
+            self._launch_environment["LAUNCHAPP_TEST_ENV_VAR"], "environment"
+        )
+        self.assertIn("SGTK_LAUNCHAPP_READY_FILE", self._launch_environment)
+        self.assertEqual(dict(os.environ), environ_before)
+
+    def test_app_path_variables_are_expanded(self):
+        """
+        Make sure the app launch hook expands the environment variables in the
+        application path and arguments, which are not run through a shell.
+        """
+        os.environ["LAUNCHAPP_TEST_APP_DIR"] = "/path/to"
+        self.addCleanup(os.environ.pop, "LAUNCHAPP_TEST_APP_DIR", None)
+
+        # No override, the app launch hook of the app is run.
+        with mock.patch("subprocess.Popen") as popen:
+            result = self.app.execute_hook(
+                "hook_app_launch",
+                app_path="$LAUNCHAPP_TEST_APP_DIR/test",
+                app_args="--dir $LAUNCHAPP_TEST_APP_DIR",
+                version=None,
+                engine_name=None,
+            )
+
+        self.assertEqual(result["return_code"], 0)
+        if sgtk.util.is_windows():
+            expected_cmd = '"/path/to/test" --dir /path/to'
+        else:
+            expected_cmd = ["/path/to/test", "--dir", "/path/to"]
+        self.assertEqual(popen.call_args[0][0], expected_cmd)
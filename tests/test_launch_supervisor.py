@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import subprocess
+import sys
+import time
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+# Mimics what the app_specific startup scripts do once the engine has started.
+READY_SCRIPT = """
+import os, runpy
+runpy.run_path(os.environ["SGTK_LAUNCHAPP_READY_SCRIPT"])
+"""
+
+# Mimics the macOS open command, exiting once the application is started.
+LAUNCHER_SCRIPT = """
+import subprocess, sys
+subprocess.Popen([sys.executable, "-c", "import time; time.sleep(1)\\n" + %r])
+""" % READY_SCRIPT
+
+
+class TestLaunchSupervisor(LaunchAppTestBase):
+    """
+    Tests the supervision of launched processes.
+    """
+
+    def _launch(self, supervisor, script, process_is_launcher=False):
+        """
+        Launch a Python process running the given script and wait for the
+        supervisor to be done with it.
+        """
+        ready_file = supervisor.new_ready_file()
+        env = dict(
+            os.environ,
+            SGTK_LAUNCHAPP_READY_FILE=ready_file,
+            SGTK_LAUNCHAPP_READY_SCRIPT=os.path.join(
+                self.app.disk_location, "app_specific", "common", "launch_ready.py"
+            ),
+        )
+        start_time = time.time()
+        process = subprocess.Popen([sys.executable, "-c", script], env=env)
+        supervisor.track(
+            process,
+            "Python",
+            "3",
+            start_time,
+            ready_file,
+            process_is_launcher=process_is_launcher,
+        )
+
+        timeout = time.time() + 30
+        while process.pid in supervisor.processes and time.time() < timeout:
+            time.sleep(0.1)
+        self.assertNotIn(process.pid, supervisor.processes)
+        self.assertFalse(os.path.exists(ready_file))
+
+    def test_startup_metrics(self):
+        """
+        Make sure the startup time, exit code and lifetime are recorded.
+        """
+        supervisor = self.app._launcher._supervisor
+        self._launch(supervisor, READY_SCRIPT)
+        self._launch(supervisor, READY_SCRIPT + "\nraise SystemExit(3)")
+
+        metrics = supervisor.load_metrics()["Python 3"]
+        self.assertEqual(metrics["launches"], 2)
+        self.assertEqual(len(metrics["startup_time"]["samples"]), 2)
+        self.assertEqual(len(metrics["lifetime"]["samples"]), 2)
+        self.assertIn("p90", metrics["startup_time"])
+        self.assertEqual(metrics["exit_codes"], {"0": 1, "3": 1})
+
+    def test_process_without_ready_signal(self):
+        """
+        Make sure processes which never signal they are ready are still tracked.
+        """
+        supervisor = self.app._launcher._supervisor
+        self._launch(supervisor, "pass")
+
+        metrics = supervisor.load_metrics()["Python 3"]
+        self.assertEqual(metrics["launches"], 1)
+        self.assertNotIn("samples", metrics["startup_time"])
+        self.assertEqual(metrics["exit_codes"], {"0": 1})
+
+    def test_launcher_process(self):
+        """
+        Make sure the startup time of applications started by a launcher
+        process is recorded, but not the exit code and lifetime of the launcher.
+        """
+        supervisor = self.app._launcher._supervisor
+        self._launch(supervisor, LAUNCHER_SCRIPT, process_is_launcher=True)
+
+        metrics = supervisor.load_metrics()["Python 3"]
+        self.assertEqual(metrics["launches"], 1)
+        self.assertEqual(len(metrics["startup_time"]["samples"]), 1)
+        self.assertGreaterEqual(metrics["startup_time"]["samples"][0], 1)
+        self.assertNotIn("samples", metrics["lifetime"])
+        self.assertEqual(metrics["exit_codes"], {})
+
+    def test_metrics_are_merged_under_lock(self):
+        """
+        Make sure the metrics file is updated under a lock file, and lock files
+        left over by dead processes are broken.
+        """
+        supervisor = self.app._launcher._supervisor
+        lock_path = supervisor.metrics_path + ".lock"
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        with open(lock_path, "w"):
+            pass
+
+        # The lock is held by another process.
+        with mock.patch.object(supervisor, "METRICS_LOCK_TIMEOUT", 0):
+            supervisor._record("Python 3", launched=True)
+        self.assertEqual(supervisor.load_metrics(), {})
+
+        # The lock was left over by a dead process.
+        stale_time = time.time() - supervisor.METRICS_LOCK_STALE_AGE - 1
+        os.utime(lock_path, (stale_time, stale_time))
+        supervisor._record("Python 3", launched=True)
+        self.assertEqual(supervisor.load_metrics()["Python 3"]["launches"], 1)
+        self.assertFalse(os.path.exists(lock_path))
+
+    def test_ready_file_is_not_polled_without_ready_signal(self):
+        """
+        Make sure applications which don't run an app_specific startup script
+        are tracked without a ready file to poll.
+        """
+        self.engine.hook_overrides["execute"] = lambda *args, **kwargs: {
+            "command": "test",
+            "return_code": 0,
+        }
+        with mock.patch.object(
+            self.app._launcher._supervisor, "track"
+        ) as track, mock.patch.object(self.app.sgtk, "create_filesystem_structure"):
+            self.app._launcher._launch_callback("Test", None, "/path/to/test", "")
+
+        self.assertEqual(track.call_count, 1)
+        self.assertIsNone(track.call_args[0][4])
@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import json
+import os
+import threading
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestLaunchTelemetry(LaunchAppTestBase):
+    """
+    Tests the background emission of the launch event log entries.
+    """
+
+    def _log_launches(self, count):
+        """
+        Queue the event log entries of the given number of launches and wait
+        for them to be emitted.
+        """
+        launcher = self.app._launcher
+        for i in range(count):
+            launcher._register_event_log(
+                "Test %d" % i, "tk-testengine", self.app.context, "test"
+            )
+        self.assertTrue(launcher._telemetry.flush(timeout=30))
+
+    def test_entries_are_batched(self):
+        """
+        Make sure entries queued together are created in a single request.
+        """
+        with mock.patch.object(self.app.shotgun, "batch") as batch:
+            self._log_launches(3)
+
+        self.assertEqual(batch.call_count, 1)
+        requests = batch.call_args[0][0]
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(requests[0]["entity_type"], "EventLogEntry")
+        self.assertEqual(requests[0]["data"]["event_type"], "Toolkit_App_Startup")
+
+    def test_unsent_entries_are_spooled(self):
+        """
+        Make sure entries which can't be sent are spooled and sent later on.
+        """
+        spool_path = self.app._launcher._telemetry.spool_path
+        with mock.patch.object(
+            self.app.shotgun, "batch", side_effect=Exception("Connection dropped")
+        ):
+            self._log_launches(2)
+        self.assertTrue(os.path.exists(spool_path))
+
+        with mock.patch.object(self.app.shotgun, "batch") as batch:
+            self._log_launches(1)
+
+        self.assertEqual(len(batch.call_args[0][0]), 3)
+        self.assertFalse(os.path.exists(spool_path))
+
+    def test_pending_entries_are_spooled_at_exit(self):
+        """
+        Make sure entries still queued or being sent when the process exits
+        are spooled.
+        """
+        launcher = self.app._launcher
+        telemetry = launcher._telemetry
+        released = threading.Event()
+        self.addCleanup(released.set)
+
+        with mock.patch.object(
+            self.app.shotgun, "batch", side_effect=lambda requests: released.wait(30)
+        ), mock.patch.object(telemetry, "EXIT_TIMEOUT", 0.2):
+            for i in range(2):
+                launcher._register_event_log(
+                    "Test %d" % i, "tk-testengine", self.app.context, "test"
+                )
+            # Exit right after recording the launches.
+            telemetry._spool_pending_entries()
+
+        with open(telemetry.spool_path) as fh:
+            entries = [json.loads(line) for line in fh]
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]["event_type"], "Toolkit_App_Startup")
@@ -0,0 +1,51 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import json
+import os
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestLaunchTiming(LaunchAppTestBase):
+    """
+    Tests the per-stage timing of launches.
+    """
+
+    def _app_launch_hook_override(
+        self, hook, app_path, app_args, version, engine_name, **kwargs
+    ):
+        return {"command": app_path, "return_code": 1}
+
+    def test_timings_are_written(self):
+        """
+        Make sure the time spent in each stage of a launch is appended to the
+        timings file.
+        """
+        timings_file = os.path.join(self.tank_temp, "launch_timings.jsonl")
+        self._patch_settings(launch_timings_file=timings_file)
+        self.engine.hook_overrides["execute"] = self._app_launch_hook_override
+
+        for _ in range(2):
+            self.app._launcher._launch_app(
+                "Test", None, "/path/to/test", "", self.app.context
+            )
+
+        with open(timings_file, "r") as fh:
+            records = [json.loads(line) for line in fh]
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["name"], "Test")
+        self.assertEqual(records[0]["command"], "/path/to/test")
+        stages = [stage["name"] for stage in records[0]["stages"]]
+        for stage in ("prepare_launch", "before_app_launch_hook", "app_launch_hook"):
+            self.assertIn(stage, stages)
@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import shutil
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+from sgtk.platform import SoftwareVersion
+from sgtk.util import pickle
+
+
+class TestRegistrationCache(LaunchAppTestBase):
+    """
+    Tests the memo of the before_register_command hook results.
+    """
+
+    def _create_software(self):
+        """
+        Create an automatic Software entity finding two software versions.
+        """
+        self.mockgun.create(
+            "Software",
+            {
+                "code": "auto",
+                "engine": "tk-testengine",
+                "image": None,
+                "version_names": None,
+                "products": None,
+                "group_name": None,
+                "group_default": False,
+                "linux_path": None,
+                "mac_path": None,
+                "windows_path": None,
+                "linux_args": None,
+                "mac_args": None,
+                "windows_args": None,
+                "description": None,
+            },
+        )
+        scanned_software = [
+            SoftwareVersion("2020", "Auto", "/path/to/software_2020", "", []),
+            SoftwareVersion("2021", "Auto", "/path/to/software_2021", "", []),
+        ]
+        os.environ["SHOTGUN_SCAN_SOFTWARE_LIST"] = pickle.dumps(scanned_software)
+
+    def _enable_cache(self):
+        """
+        Remember the hook results from now on, as if the
+        cache_before_register_command setting was on.
+        """
+        RegistrationCache = type(self.app._launcher._registration_cache)
+        RegistrationCache.clear()
+        self.addCleanup(RegistrationCache.clear)
+        self._reload_cache()
+
+    def _reload_cache(self):
+        """
+        Recreate the registration cache, as done when the engine restarts.
+        """
+        launcher = self.app._launcher
+        launcher._registration_cache = type(launcher._registration_cache)(
+            self.app, True
+        )
+
+    def _register(self):
+        """
+        Register the launch commands again, counting the hook calls.
+        """
+        with mock.patch.object(self.engine, "register_command"):
+            with mock.patch.object(
+                self.app, "execute_hook_method", wraps=self.app.execute_hook_method
+            ) as execute_hook_method:
+                self.app._launcher.register_launch_commands()
+        return len(
+            [
+                call
+                for call in execute_hook_method.call_args_list
+                if call[0][0] == "hook_before_register_command"
+            ]
+        )
+
+    def test_cache_is_off_by_default(self):
+        """
+        Make sure the hook results are not remembered unless the studio opts in.
+        """
+        self.assertFalse(self.app.get_setting("cache_before_register_command"))
+        self.assertEqual(self._register(), 2)
+        self.assertEqual(self._register(), 2)
+
+    def test_hook_results_are_reused(self):
+        """
+        Make sure the hook results are reused once remembered.
+        """
+        self._enable_cache()
+        self.assertEqual(self._register(), 2)
+        self.assertEqual(self._register(), 0)
+
+    def test_environment_change_invalidates_cache(self):
+        """
+        Make sure editing the environment invalidates the hook results.
+        """
+        self._enable_cache()
+        self.assertEqual(self._register(), 2)
+
+        env_path = self.engine.environment["disk_location"]
+        stat = os.stat(env_path)
+        os.utime(env_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self._reload_cache()
+
+        self.assertEqual(self._register(), 2)
+        self.assertEqual(self._register(), 0)
+
+    def test_hook_change_invalidates_cache(self):
+        """
+        Make sure editing the hook invalidates the hook results.
+        """
+        hook_folder = os.path.join(self.tank_temp, "registration_cache_hooks")
+        os.makedirs(hook_folder, exist_ok=True)
+        hook_path = os.path.join(hook_folder, "before_register_command.py")
+        shutil.copy(
+            os.path.join(self.app.disk_location, "hooks", "before_register_command.py"),
+            hook_path,
+        )
+        os.environ["LAUNCHAPP_TEST_HOOK_FOLDER"] = hook_folder
+        self.addCleanup(os.environ.pop, "LAUNCHAPP_TEST_HOOK_FOLDER", None)
+        self._patch_settings(
+            hook_before_register_command="{$LAUNCHAPP_TEST_HOOK_FOLDER}/before_register_command.py"
+        )
+        self._enable_cache()
+        self.assertIn(
+            hook_path, self.app._launcher._registration_cache._get_hook_paths()
+        )
+        self.assertEqual(self._register(), 2)
+        self._reload_cache()
+        self.assertEqual(self._register(), 0)
+
+        stat = os.stat(hook_path)
+        os.utime(hook_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self._reload_cache()
+        self.assertEqual(self._register(), 2)
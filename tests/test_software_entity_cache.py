@@ -0,0 +1,117 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestSoftwareEntityCache(LaunchAppTestBase):
+    """
+    Tests the on-disk cache of Software entities.
+    """
+
+    def _create_software(self):
+        """
+        Creates a single manual Software entity.
+        """
+        self._create_software_entity("cached")
+
+    def _create_software_entity(self, name):
+        return self.mockgun.create(
+            "Software",
+            {
+                "code": name,
+                "engine": "tk-testengine",
+                "image": None,
+                "version_names": None,
+                "products": None,
+                "group_name": None,
+                "group_default": False,
+                "linux_path": "/path/to/software",
+                "mac_path": "/path/to/software",
+                "windows_path": "/path/to/software",
+                "linux_args": "",
+                "mac_args": "",
+                "windows_args": "",
+                "description": None,
+            },
+        )
+
+    def test_fresh_cache_is_used(self):
+        """
+        Make sure fresh cached entities are returned without being refreshed.
+        """
+        self._patch_settings(software_entity_cache_ttl=3600)
+        launcher = self.app._launcher
+
+        with mock.patch.object(
+            launcher, "_refresh_software_entity_cache_in_background"
+        ) as refresh_in_background:
+            # Nothing cached yet, Flow Production Tracking is queried.
+            self.assertEqual(len(launcher._get_sg_software_entities()), 1)
+            refresh_in_background.assert_not_called()
+
+            # The new entity is not picked up since the cache is fresh.
+            self._create_software_entity("not cached")
+            self.assertEqual(len(launcher._get_sg_software_entities()), 1)
+            refresh_in_background.assert_not_called()
+
+    def test_disabled_cache(self):
+        """
+        Make sure Flow Production Tracking is always queried when the cache is disabled.
+        """
+        self._patch_settings(software_entity_cache_ttl=0)
+        launcher = self.app._launcher
+
+        self.assertEqual(len(launcher._get_sg_software_entities()), 1)
+        self._create_software_entity("not cached")
+        self.assertEqual(len(launcher._get_sg_software_entities()), 2)
+
+    def test_stale_cache_is_refreshed(self):
+        """
+        Make sure stale cached entities are refreshed before being used.
+        """
+        self._patch_settings(
+            software_entity_cache_ttl=3600,
+            software_entity_cache_stale_behavior="refresh",
+        )
+        launcher = self.app._launcher
+
+        self.assertEqual(len(launcher._get_sg_software_entities()), 1)
+        self._create_software_entity("not cached")
+
+        # Make the cache look older than the TTL.
+        with mock.patch("time.time", return_value=2**32):
+            self.assertEqual(len(launcher._get_sg_software_entities()), 2)
+
+    def test_stale_cache_is_used(self):
+        """
+        Make sure stale cached entities are returned and refreshed in the
+        background with the use_stale behavior.
+        """
+        self._patch_settings(
+            software_entity_cache_ttl=3600,
+            software_entity_cache_stale_behavior="use_stale",
+        )
+        launcher = self.app._launcher
+
+        self.assertEqual(len(launcher._get_sg_software_entities()), 1)
+        self._create_software_entity("not cached")
+
+        # Make the cache look older than the TTL.
+        with mock.patch("time.time", return_value=2**32), mock.patch.object(
+            launcher, "_refresh_software_entity_cache_in_background"
+        ) as refresh_in_background:
+            self.assertEqual(len(launcher._get_sg_software_entities()), 1)
+            refresh_in_background.assert_called_once()
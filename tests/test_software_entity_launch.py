@@ -10,12 +10,14 @@
 
 import os
 import datetime
+from unittest import mock
 
 # Required so that the SHOTGUN_HOME env var will be set
 from tank_test.tank_test_base import setUpModule  # noqa
 
 from launchapp_test_base import LaunchAppTestBase
 
+import sgtk
 from sgtk.platform import SoftwareVersion
 from sgtk.util import pickle
 
@@ -166,3 +168,57 @@ class TestSoftwareEntity(LaunchAppTestBase):
             self.engine.commands["no_description"]["properties"]["description"],
             "Launches and initializes an application environment.",
         )
+
+    def test_registration_report(self):
+        """
+        Make sure the time spent registering the commands of each Software
+        entity is reported.
+        """
+        report = self.app.get_registration_report()
+
+        stages = [stage["name"] for stage in report["stages"]]
+        self.assertIn("get_software_entities", stages)
+        self.assertIn("scan_software", stages)
+        self.assertIn("before_register_command_hook", stages)
+
+        entities = [entity["entity"] for entity in report["entities"]]
+        for sw_entity in (
+            self._manual_software_entity,
+            self._auto_software_entity,
+            self._no_desc_software_entity,
+        ):
+            self.assertIn("Software %d" % sw_entity["id"], entities)
+
+        auto_entity = report["entities"][
+            entities.index("Software %d" % self._auto_software_entity["id"])
+        ]
+        self.assertIn("scan_software", auto_entity["stages"])
+
+    def test_engine_launcher_is_reused(self):
+        """
+        Make sure the engine launcher created to scan for software is reused
+        to prepare the launches.
+        """
+        self.app._launcher._scan_for_software("tk-testengine", None, None)
+        self.engine.hook_overrides["execute"] = self._app_launch_hook_override_auto
+        with mock.patch(
+            "sgtk.platform.create_engine_launcher",
+            wraps=sgtk.platform.create_engine_launcher,
+        ) as create_engine_launcher:
+            self.engine.commands["auto_2020"]["callback"]()
+            self.engine.commands["auto_2020"]["callback"]()
+        self.assertEqual(create_engine_launcher.call_count, 0)
+
+    def test_engine_launchers_are_reset_on_registration(self):
+        """
+        Make sure engine launchers created before the launch commands are
+        registered again are not reused.
+        """
+        launcher = self.app._launcher
+        launcher._scan_for_software("tk-testengine", None, None)
+        previous_engine_launchers = dict(launcher._engine_launchers)
+        self.assertTrue(previous_engine_launchers)
+
+        launcher.register_launch_commands()
+        for key, engine_launcher in previous_engine_launchers.items():
+            self.assertIsNot(launcher._engine_launchers.get(key), engine_launcher)
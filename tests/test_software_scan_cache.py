@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+from sgtk.platform import SoftwareVersion
+from sgtk.util import pickle
+
+
+class TestSoftwareScanCache(LaunchAppTestBase):
+    """
+    Tests the on-disk cache of the software scan results.
+    """
+
+    def _create_software(self):
+        """
+        Provide the scan results to the tk-testengine startup scan software method.
+        """
+        self._install_dir = os.path.join(self.tank_temp, "install", "software_2020")
+        os.makedirs(self._install_dir)
+        self._software_path = os.path.join(self._install_dir, "software")
+        with open(self._software_path, "w"):
+            pass
+
+        scanned_software = [
+            SoftwareVersion("2020", "Auto", self._software_path, "", [])
+        ]
+        os.environ["SHOTGUN_SCAN_SOFTWARE_LIST"] = pickle.dumps(scanned_software)
+
+    def _scan(self):
+        """
+        Scan for the tk-testengine software, counting the actual scans.
+        """
+        launcher = self.app._launcher
+        with mock.patch.object(
+            launcher,
+            "_scan_for_software",
+            wraps=launcher._scan_for_software,
+        ) as scan_for_software:
+            software_versions = launcher._scan_for_software_for_key(
+                ("tk-testengine", (), ())
+            )
+        self.assertEqual([sw.path for sw in software_versions], [self._software_path])
+        return scan_for_software.call_count
+
+    def test_warm_scan_is_cached(self):
+        """
+        Make sure the second scan comes from the cache.
+        """
+        self._patch_settings(software_scan_cache_ttl=3600)
+        self.assertEqual(self._scan(), 1)
+        self.assertEqual(self._scan(), 0)
+
+    def test_install_dir_change_invalidates_cache(self):
+        """
+        Make sure installing new software invalidates the cache.
+        """
+        self._patch_settings(software_scan_cache_ttl=3600)
+        self.assertEqual(self._scan(), 1)
+
+        # Fake a new install next to the existing one.
+        install_root = os.path.dirname(self._install_dir)
+        stat = os.stat(install_root)
+        os.utime(install_root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertEqual(self._scan(), 1)
+
+    def test_engine_update_invalidates_cache(self):
+        """
+        Make sure updating the engine, which implements the scan, invalidates
+        the cache.
+        """
+        self._patch_settings(software_scan_cache_ttl=3600)
+        BootstrapCache = self.app.import_module(
+            "tk_multi_launchapp"
+        ).bootstrap_cache.BootstrapCache
+
+        with mock.patch.object(
+            BootstrapCache, "get_engine_path", return_value="/path/to/engine/v1.0.0"
+        ):
+            self.assertEqual(self._scan(), 1)
+            self.assertEqual(self._scan(), 0)
+        # The engine is updated, and the launch commands registered again.
+        self.app._launcher._reset_launch_caches()
+        with mock.patch.object(
+            BootstrapCache, "get_engine_path", return_value="/path/to/engine/v1.1.0"
+        ):
+            self.assertEqual(self._scan(), 1)
+
+    def test_engine_signature_is_computed_once(self):
+        """
+        Make sure the engine path is resolved once for all the scans of a
+        registration.
+        """
+        self._patch_settings(software_scan_cache_ttl=3600)
+        BootstrapCache = self.app.import_module(
+            "tk_multi_launchapp"
+        ).bootstrap_cache.BootstrapCache
+        launcher = self.app._launcher
+        launcher._reset_launch_caches()
+
+        with mock.patch.object(
+            BootstrapCache, "get_engine_path", return_value="/path/to/engine"
+        ) as get_engine_path:
+            for versions in [(), ("2020",), ("2021",)]:
+                launcher._scan_for_software_for_key(("tk-testengine", versions, ()))
+        self.assertEqual(get_engine_path.call_count, 1)
+
+    def test_rescan_command(self):
+        """
+        Make sure the rescan command is registered and clears the cache.
+        """
+        self._patch_settings(software_scan_cache_ttl=3600)
+        self.assertEqual(self._scan(), 1)
+
+        self.app._launcher._register_rescan_command()
+        self.engine.commands["rescan_software"]["callback"]()
+
+        # No automatic Software entity was rescanned, so the cache is now empty.
+        self.assertEqual(self._scan(), 1)
+
+    def test_disabled_cache(self):
+        """
+        Make sure software is always scanned when the cache is disabled.
+        """
+        self._patch_settings(software_scan_cache_ttl=0)
+        self.assertEqual(self._scan(), 1)
+        self.assertEqual(self._scan(), 1)
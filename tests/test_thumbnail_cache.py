@@ -0,0 +1,98 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+from unittest import mock
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestThumbnailCache(LaunchAppTestBase):
+    """
+    Tests the on-disk cache of the Software entity thumbnails.
+    """
+
+    THUMBNAIL_URL = "https://example.com/thumbnails/software/1.png?AWSAccessKeyId=1"
+    INTERRUPTED_URL = "https://example.com/thumbnails/software/2.png"
+    TRANSIENT_URL = "https://example.com/images/status/transient/thumbnail_pending.png"
+
+    def setUp(self):
+        super(TestThumbnailCache, self).setUp()
+        self.cache = self.app.import_module(
+            "tk_multi_launchapp"
+        ).thumbnail_cache.ThumbnailCache(self.app)
+
+    def _get_temp_files(self):
+        """
+        Return the temporary download files left in the cache folder.
+        """
+        cache_folder = os.path.join(self.app.site_cache_location, "thumbnails")
+        return [name for name in os.listdir(cache_folder) if name.startswith("tmp_")]
+
+    def _download_url(self, sg, url, location, use_url_extension=False):
+        """
+        Write a thumbnail file where sgtk.util.download_url would.
+        """
+        path = location + ".png"
+        with open(path, "w") as fh:
+            fh.write("thumbnail")
+        return path
+
+    def test_download_is_moved_into_place(self):
+        """
+        Make sure thumbnails are downloaded to a temporary file, which is moved
+        to the cached path once complete.
+        """
+        with mock.patch(
+            "sgtk.util.download_url", side_effect=self._download_url
+        ) as download_url:
+            icon_path = self.cache.download("Software", 1, self.THUMBNAIL_URL)
+
+        temp_location = download_url.call_args[0][2]
+        self.assertNotEqual(temp_location + ".png", icon_path)
+        self.assertFalse(os.path.exists(temp_location + ".png"))
+        self.assertEqual(self.cache.get(self.THUMBNAIL_URL), icon_path)
+        self.assertEqual(self._get_temp_files(), [])
+
+    def test_interrupted_download_is_not_cached(self):
+        """
+        Make sure partial downloads are removed and never returned as cached.
+        """
+
+        def download_url(sg, url, location, use_url_extension=False):
+            self._download_url(sg, url, location, use_url_extension)
+            raise Exception("Connection dropped")
+
+        with mock.patch("sgtk.util.download_url", side_effect=download_url):
+            with self.assertRaises(Exception):
+                self.cache.download("Software", 2, self.INTERRUPTED_URL)
+
+        self.assertIsNone(self.cache.get(self.INTERRUPTED_URL))
+        self.assertEqual(self._get_temp_files(), [])
+
+    def test_transient_url_is_not_cached(self):
+        """
+        Make sure the placeholder shown while a thumbnail is being processed,
+        shared by all entities, is neither downloaded nor cached.
+        """
+        with mock.patch("sgtk.util.download_url") as download_url:
+            self.assertIsNone(self.cache.download("Software", 1, self.TRANSIENT_URL))
+            self.assertEqual(
+                self.cache.download_in_background(
+                    [("Software", 1, self.TRANSIENT_URL)], mock.MagicMock()
+                ),
+                {},
+            )
+
+        download_url.assert_not_called()
+        self.assertIsNone(self.cache.get(self.TRANSIENT_URL))
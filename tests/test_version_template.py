@@ -0,0 +1,79 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+# Required so that the SHOTGUN_HOME env var will be set
+from tank_test.tank_test_base import setUpModule  # noqa
+
+from launchapp_test_base import LaunchAppTestBase
+
+
+class TestVersionTemplate(LaunchAppTestBase):
+    """
+    Tests the replacement of the version tokens in settings and the sorting
+    of versions.
+    """
+
+    def setUp(self):
+        super(TestVersionTemplate, self).setUp()
+        self.util = self.app.import_module("tk_multi_launchapp").util
+
+    def test_tokens_are_replaced(self):
+        """
+        Make sure {version} and {v} tokens are replaced.
+        """
+        template = self.util.get_version_template("/apps/{v0}/app{version}-{v1}")
+        self.assertEqual(template.render("(9.0)v4(beta1)"), "/apps/9.0/app9.0v4-beta1")
+        self.assertEqual(template.render("2024"), "/apps/{v0}/app2024-{v1}")
+        self.assertEqual(template.render(None), "/apps/{v0}/app{version}-{v1}")
+        self.assertIs(
+            self.util.get_version_template("/apps/{v0}/app{version}-{v1}"), template
+        )
+
+    def test_stray_braces(self):
+        """
+        Make sure tokens formed by substituted values are replaced, as they
+        were when tokens were replaced one after the other.
+        """
+        self.assertEqual(
+            self.util.apply_version_to_setting("{v{v0}}", "(1)(beta)"), "beta"
+        )
+        self.assertEqual(self.util.apply_version_to_setting("{v0", "(1)"), "{v0")
+        self.assertEqual(self.util.get_clean_version_string("(8.4)v6"), "8.4v6")
+
+    def test_versions_are_sorted(self):
+        """
+        Make sure DCC-style versions are sorted highest first and returned as is.
+        """
+        self.assertEqual(
+            self.app._launcher._sort_versions(
+                ["14.0v3", "2024.2", "(8.0)v1", "2024.10", "14.0", "1.2b", "1.2a"]
+            ),
+            ["2024.10", "2024.2", "14.0v3", "14.0", "(8.0)v1", "1.2b", "1.2a"],
+        )
+
+    def test_pre_releases_are_sorted_before_releases(self):
+        """
+        Make sure pre-release versions sort before the release they lead to.
+        """
+        for pre_release, release in [
+            ("1.0b1", "1.0"),
+            ("1.0a1", "1.0b1"),
+            ("1.0rc1", "1.0"),
+            ("2024.1beta", "2024.1"),
+            ("(8.0)v1(beta1)", "(8.0)v1"),
+        ]:
+            self.assertEqual(
+                self.app._launcher._sort_versions([pre_release, release]),
+                [release, pre_release],
+            )
+        self.assertEqual(
+            self.app._launcher._sort_versions(["1.0", "1.0v1", "1.0b1"]),
+            ["1.0v1", "1.0", "1.0b1"],
+        )